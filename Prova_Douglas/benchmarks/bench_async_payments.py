@@ -0,0 +1,85 @@
+# benchmarks/bench_async_payments.py
+# Milhares de pagamentos em andamento num único event loop: o gateway
+# simulado responde com latência fixa e o banco fica numa thread dedicada.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_async_payments [pagamentos] [latencia_ms]
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from config.database import DatabaseManager
+from models.customer import Customer
+from models.order_item import OrderItem
+from models.order_request import OrderRequest
+from models.enums import CustomerType, ItemType, OrderStatus, PaymentMethod
+from repositories.order_repository import OrderRepository
+from repositories.inventory_repository import InMemoryInventoryRepository
+from services.order_service import OrderService
+from services.async_order_service import AsyncOrderService
+from services.async_payment_service import AsyncPaymentService
+from services.notification_service import NotificationService
+from services.loyalty_service import LoyaltyService
+from services.inventory_service import InventoryService
+from strategies.pricing_engine import PricingEngine
+from strategies.payment_strategy import AsyncGatewayPaymentStrategy
+
+
+async def run(db_manager: DatabaseManager, n_payments: int, latency: float):
+    order_repository = OrderRepository(db_manager)
+    order_service = OrderService(
+        order_repository=order_repository,
+        notification_service=NotificationService(),
+        loyalty_service=LoyaltyService(),
+        inventory_service=InventoryService(InMemoryInventoryRepository({'produto1': n_payments})),
+        pricing_engine=PricingEngine(),
+        unit_of_work=db_manager
+    )
+    async_order_service = AsyncOrderService(order_service, order_repository)
+    payment_service = AsyncPaymentService(
+        {PaymentMethod.PIX: AsyncGatewayPaymentStrategy(PaymentMethod.PIX, latency_seconds=latency)},
+        async_order_service
+    )
+
+    item = OrderItem(name='produto1', price=100, quantity=1, item_type=ItemType.NORMAL)
+    requests = [
+        OrderRequest(customer=Customer(name=f'Cliente {i % 50}', customer_type=CustomerType.NORMAL), items=[item])
+        for i in range(n_payments)
+    ]
+    order_ids = await async_order_service.create_orders(requests)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        payment_service.process_payment(order_id, PaymentMethod.PIX, 100.0) for order_id in order_ids
+    ))
+    elapsed = time.perf_counter() - start
+
+    approved = await async_order_service.run_in_db(
+        lambda: sum(1 for o in order_repository.get_all() if o.status == OrderStatus.APPROVED)
+    )
+    async_order_service.close()
+    return results, approved, elapsed
+
+
+def main():
+    n_payments = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(os.path.join(tmp, 'async.db'), persistent=True)
+        db_manager.initialize()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results, approved, elapsed = asyncio.run(run(db_manager, n_payments, latency))
+        db_manager.close()
+
+    print(f"Pagamentos: {n_payments}, latência do gateway: {latency * 1000:.0f}ms")
+    print(f"Aprovados: {sum(results)} (gravados como aprovado: {approved})")
+    print(f"Tempo total: {elapsed:.3f}s (sequencial seria ~{n_payments * latency:.1f}s só de gateway)")
+    print(f"Vazão: {n_payments / elapsed:.1f} pagamentos/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_connection.py
+# Compara pedidos/s com uma conexão por chamada vs conexões persistentes.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_connection [n_pedidos]
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from config.database import DatabaseManager
+from models.customer import Customer
+from models.order_item import OrderItem
+from models.enums import CustomerType, ItemType, OrderStatus, PaymentMethod
+from repositories.order_repository import OrderRepository
+from repositories.inventory_repository import InMemoryInventoryRepository
+from services.order_service import OrderService
+from services.notification_service import NotificationService
+from services.loyalty_service import LoyaltyService
+from services.inventory_service import InventoryService
+from services.payment_service import PaymentService
+from strategies.pricing_engine import PricingEngine
+from strategies.payment_strategy import CardPaymentStrategy
+
+
+def run_lifecycle(db_manager: DatabaseManager, n_orders: int) -> float:
+    order_repository = OrderRepository(db_manager)
+    order_service = OrderService(
+        order_repository=order_repository,
+        notification_service=NotificationService(),
+        loyalty_service=LoyaltyService(),
+        inventory_service=InventoryService(InMemoryInventoryRepository({'produto1': 10 ** 9})),
+        pricing_engine=PricingEngine()
+    )
+    payment_service = PaymentService(
+        payment_strategies={PaymentMethod.CARD: CardPaymentStrategy()},
+        order_repository=order_repository,
+        order_service=order_service
+    )
+    customer = Customer(name='Cliente Benchmark', customer_type=CustomerType.NORMAL)
+    items = [OrderItem(name='produto1', price=100, quantity=1, item_type=ItemType.NORMAL)]
+
+    # Os serviços imprimem a cada etapa; a saída é descartada durante a medição
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(n_orders):
+            order_id = order_service.create_order(customer, items)
+            payment_service.process_payment(order_id, PaymentMethod.CARD, 100.0)
+            order_service.update_order_status(order_id, OrderStatus.SHIPPED)
+            order_service.update_order_status(order_id, OrderStatus.DELIVERED)
+        elapsed = time.perf_counter() - start
+    return n_orders / elapsed
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = DatabaseManager(os.path.join(tmp, 'legacy.db'))
+        legacy_rate = run_lifecycle(legacy, n_orders)
+
+        pooled = DatabaseManager(os.path.join(tmp, 'pooled.db'), persistent=True)
+        pooled.initialize()
+        pooled_rate = run_lifecycle(pooled, n_orders)
+        pooled.close()
+
+    print(f"Pedidos processados: {n_orders} (criação + pagamento + 2 atualizações de status)")
+    print(f"Conexão por chamada: {legacy_rate:10.1f} pedidos/s")
+    print(f"Conexão persistente: {pooled_rate:10.1f} pedidos/s")
+    print(f"Ganho: {pooled_rate / legacy_rate:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
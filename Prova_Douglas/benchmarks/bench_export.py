@@ -0,0 +1,91 @@
+# benchmarks/bench_export.py
+# Exporta orders e order_items com o ExportService em CSV, JSON Lines e
+# colunar (com e sem gzip), mostra linhas/s e tamanho dos arquivos e confere
+# que cada arquivo, lido de volta, tem todas as linhas e a mesma soma de
+# total_cents / quantity que o banco.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_export [linhas] [itens_por_pedido]
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from config.database import DatabaseManager
+from repositories.order_repository import OrderRepository
+from services.export_service import ExportService
+from strategies.export_writers import CSVExportWriter, JSONLinesExportWriter, ColumnarExportWriter, read_columnar
+from benchmarks.bench_hydration import populate
+
+# Coluna somada na conferência de cada conjunto
+CHECKSUM_COLUMNS = {'orders': 'total_cents', 'order_items': 'quantity'}
+
+
+def expected_totals(db_manager: DatabaseManager):
+    with db_manager as cursor:
+        cursor.execute("SELECT COUNT(*), SUM(total_cents) FROM orders")
+        orders = cursor.fetchone()
+        cursor.execute("SELECT COUNT(*), SUM(quantity) FROM order_items")
+        items = cursor.fetchone()
+    return {'orders': orders, 'order_items': items}
+
+
+def read_back(path: str, file_format: str, column: str):
+    # (linhas, soma da coluna) do arquivo exportado
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as stream:
+        if file_format == 'csv':
+            rows = list(csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8', newline='')))
+            return len(rows), sum(int(row[column]) for row in rows)
+        if file_format == 'jsonl':
+            rows = [json.loads(line) for line in stream]
+            return len(rows), sum(row[column] for row in rows)
+        count = total = 0
+        for block in read_columnar(stream):
+            count += len(block[column])
+            total += sum(block[column])
+        return count, total
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    items_per_order = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(os.path.join(tmp, 'exportacao.db'), persistent=True)
+        db_manager.initialize()
+        populate(db_manager, n_rows, items_per_order)
+        expected = expected_totals(db_manager)
+        service = ExportService(OrderRepository(db_manager))
+
+        print(f"{'conjunto':<12}{'formato':<10}{'gzip':<6}{'linhas/s':>12}{'MB':>9}")
+        for dataset, _ in service.get_datasets():
+            for writer in (CSVExportWriter(), JSONLinesExportWriter(), ColumnarExportWriter()):
+                for compress in (False, True):
+                    path = os.path.join(tmp, dataset + writer.get_extension() + ('.gz' if compress else ''))
+                    start = time.perf_counter()
+                    rows = service.export(dataset, writer, path, compress)
+                    elapsed = time.perf_counter() - start
+
+                    assert rows == expected[dataset][0], (dataset, writer.get_format(), rows)
+                    assert read_back(path, writer.get_format(), CHECKSUM_COLUMNS[dataset]) == expected[dataset], \
+                        (dataset, writer.get_format(), compress)
+                    print(f"{dataset:<12}{writer.get_format():<10}{'sim' if compress else 'não':<6}"
+                          f"{rows / elapsed:>12,.0f}{os.path.getsize(path) / 1e6:>9.1f}")
+
+        try:
+            service.export('clientes', CSVExportWriter(), os.path.join(tmp, 'clientes.csv'))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("conjunto inválido deveria levantar ValueError")
+        db_manager.close()
+
+    print("Arquivos lidos de volta com as mesmas linhas e somas do banco (ok)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+# benchmarks/bench_hydration.py
+# Mede a hidratação de pedidos numa varredura completa (iter_all):
+# pedidos/s sobre N linhas e memória por pedido numa amostra materializada.
+# Compara o caminho anterior (dataclasses sem slots, Enum(valor) e um
+# Customer por linha), o atual com slots e o atual em modo lazy_items.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_hydration [linhas] [itens_por_pedido] [amostra]
+
+import itertools
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from config.database import DatabaseManager
+from models.enums import CustomerType, ItemType, OrderStatus
+from models.money import Money
+from repositories.order_repository import OrderRepository
+
+
+# Modelos como eram antes dos slots, só para a comparação
+@dataclass
+class UnslottedCustomer:
+    name: str
+    customer_type: CustomerType
+
+
+@dataclass
+class UnslottedOrderItem:
+    name: str
+    price: Money
+    quantity: int
+    item_type: ItemType
+
+    def __post_init__(self):
+        self.price = Money.of(self.price)
+
+
+@dataclass
+class UnslottedOrder:
+    customer: UnslottedCustomer
+    items: List[UnslottedOrderItem]
+    id: int = None
+    total_price: Money = Money(0)
+    status: OrderStatus = OrderStatus.PENDING
+    created_at: str = field(default_factory=str)
+    is_special: bool = False
+    idempotency_key: Optional[str] = None
+
+    def __post_init__(self):
+        self.total_price = Money.of(self.total_price)
+
+
+class UnslottedOrderRepository(OrderRepository):
+    # Hidratação anterior: argumentos nomeados, Enum(valor) por linha e um
+    # Customer novo para cada pedido
+
+    def _row_to_order(self, row: tuple, item_rows):
+        customer = UnslottedCustomer(name=row[1], customer_type=CustomerType(row[2]))
+        items = []
+        for item_row in item_rows:
+            items.append(UnslottedOrderItem(
+                name=item_row[1],
+                price=Money(item_row[2]),
+                quantity=item_row[3],
+                item_type=ItemType(item_row[4])
+            ))
+        return UnslottedOrder(
+            id=row[0],
+            customer=customer,
+            items=items,
+            total_price=Money(row[3]),
+            status=OrderStatus(row[4]),
+            created_at=row[5]
+        )
+
+
+def populate(db_manager: DatabaseManager, n_rows: int, items_per_order: int, batch_size: int = 50_000):
+    # Insere direto no SQLite: o objetivo aqui é medir a leitura, não a gravação
+    customer_types = ('normal', 'vip', 'especial')
+    statuses = ('pendente', 'aprovado', 'enviado', 'entregue')
+    item_types = ('normal', 'desc10', 'desc20')
+    with db_manager as cursor:
+        for start in range(1, n_rows + 1, batch_size):
+            ids = range(start, min(start + batch_size, n_rows + 1))
+            cursor.executemany(
+                "INSERT INTO orders (id, customer_name, customer_type, total_price, total_cents, status, created_at, created_ts) "
+                "VALUES (?, ?, ?, ?, ?, ?, '2024-01-01 00:00:00', 1704067200)",
+                [
+                    (i, f'Cliente {i % 5000:05d}', customer_types[i % 5000 % 3], (i % 997) + 0.5,
+                     (i % 997) * 100 + 50, statuses[i % 4])
+                    for i in ids
+                ]
+            )
+            cursor.executemany(
+                "INSERT INTO order_items (order_id, position, name, price, price_cents, quantity, item_type) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (i, position, f'produto{(i + position) % 50}', 10.0, 1000, 1 + position, item_types[(i + position) % 3])
+                    for i in ids
+                    for position in range(items_per_order)
+                ]
+            )
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    items_per_order = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    sample = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(os.path.join(tmp, 'hidratacao.db'), persistent=True)
+        db_manager.initialize()
+        start = time.perf_counter()
+        populate(db_manager, n_rows, items_per_order)
+        print(f"Carga: {n_rows} pedidos x {items_per_order} itens em {time.perf_counter() - start:.1f}s")
+
+        variants = (
+            ('sem slots', UnslottedOrderRepository(db_manager)),
+            ('slots', OrderRepository(db_manager)),
+            ('slots + lazy_items', OrderRepository(db_manager, lazy_items=True)),
+        )
+        baseline = None
+        for label, repository in variants:
+
+            start = time.perf_counter()
+            count = 0
+            for _ in repository.iter_all(batch_size=5000):
+                count += 1
+            elapsed = time.perf_counter() - start
+            rate = count / elapsed
+
+            tracemalloc.start()
+            orders = list(itertools.islice(repository.iter_all(batch_size=5000), sample))
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            per_order = current / len(orders)
+            sampled = len(orders)
+            del orders
+
+            baseline = baseline or (rate, per_order)
+            print(f"[{label}] Varredura: {count} pedidos em {elapsed:.2f}s ({rate:,.0f} pedidos/s, "
+                  f"{rate / baseline[0]:.2f}x)")
+            print(f"[{label}] Memória: {per_order:,.0f} bytes/pedido ({per_order / baseline[1]:.0%} do sem slots, "
+                  f"{sampled} pedidos materializados)")
+
+        db_manager.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+# benchmarks/bench_inventory.py
+# Várias threads criando pedidos ao mesmo tempo contra o estoque em SQLite.
+# Verifica que nada é vendido além do estoque e mede pedidos/s. Antes disso
+# confere as reservas direto no repositório (SQLite e em memória): muitas
+# threads disputando um único produto, com confirmações e devoluções
+# misturadas, sem venda além do estoque e com o saldo final exato.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_inventory [threads] [pedidos_por_thread] [estoque]
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from config.database import DatabaseManager
+from models.customer import Customer
+from models.order_item import OrderItem
+from models.enums import CustomerType, ItemType
+from repositories.order_repository import OrderRepository
+from repositories.inventory_repository import InventoryRepository, InMemoryInventoryRepository
+from services.order_service import OrderService
+from services.notification_service import NotificationService
+from services.loyalty_service import LoyaltyService
+from services.inventory_service import InventoryService
+from strategies.pricing_engine import PricingEngine
+
+
+def check_single_product(label: str, repository, n_threads: int, initial_stock: int):
+    # Cada thread reserva de 1 a 3 unidades por vez até o estoque acabar para
+    # ela; uma em cada três reservas é devolvida, as demais confirmadas
+    repository.set_quantities({'produto1': initial_stock})
+    committed = []
+    released = []
+    barrier = threading.Barrier(n_threads)
+
+    def worker(index: int):
+        barrier.wait()
+        for attempt in range(initial_stock):
+            quantity = 1 + (index + attempt) % 3
+            reservation_id = f'{label}-{index}-{attempt}'
+            if not repository.reserve(reservation_id, {'produto1': quantity}):
+                continue
+            if attempt % 3 == 0:
+                assert repository.release(reservation_id)
+                released.append(quantity)
+            else:
+                assert repository.commit(reservation_id)
+                committed.append(quantity)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    remaining = repository.get_quantities(['produto1'])['produto1']
+    assert sum(committed) <= initial_stock, f"{label}: vendido além do estoque ({sum(committed)})"
+    assert remaining == initial_stock - sum(committed), f"{label}: saldo final {remaining}"
+    print(f"{label}: {len(committed)} reservas confirmadas ({sum(committed)} unidades), "
+          f"{len(released)} devolvidas, saldo final {remaining} (ok)")
+
+
+def main():
+    n_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    orders_per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    initial_stock = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(os.path.join(tmp, 'estoque.db'), persistent=True)
+        db_manager.initialize()
+        inventory_repository = InventoryRepository(db_manager)
+        check_single_product('SQLite', inventory_repository, n_threads, initial_stock)
+        check_single_product('Memória', InMemoryInventoryRepository(), n_threads, initial_stock)
+        with db_manager as cursor:
+            cursor.execute("SELECT COUNT(*) FROM stock_reservations WHERE state='reserved'")
+            assert cursor.fetchone()[0] == 0, "reservas do SQLite ficaram abertas"
+
+        inventory_repository.set_quantities({'produto1': initial_stock, 'produto2': initial_stock})
+
+        order_repository = OrderRepository(db_manager)
+        order_service = OrderService(
+            order_repository=order_repository,
+            notification_service=NotificationService(),
+            loyalty_service=LoyaltyService(),
+            inventory_service=InventoryService(inventory_repository),
+            pricing_engine=PricingEngine(),
+            unit_of_work=db_manager
+        )
+
+        # Cada pedido leva uma unidade de cada produto: a reserva tem que ser tudo ou nada
+        items = [
+            OrderItem(name='produto1', price=10, quantity=1, item_type=ItemType.NORMAL),
+            OrderItem(name='produto2', price=10, quantity=1, item_type=ItemType.NORMAL)
+        ]
+        created = []
+        rejected = []
+        barrier = threading.Barrier(n_threads)
+
+        def worker(index: int):
+            customer = Customer(name=f'Cliente {index}', customer_type=CustomerType.NORMAL)
+            barrier.wait()
+            for _ in range(orders_per_thread):
+                try:
+                    created.append(order_service.create_order(customer, items))
+                except ValueError:
+                    rejected.append(index)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+        remaining = inventory_repository.get_quantities(['produto1', 'produto2'])
+        stored_orders = len(order_repository.get_all())
+        db_manager.close()
+
+    attempts = n_threads * orders_per_thread
+    expected = min(attempts, initial_stock)
+    print(f"Tentativas: {attempts} em {n_threads} threads, estoque inicial {initial_stock}")
+    print(f"Pedidos criados: {len(created)} (esperado {expected}), recusados: {len(rejected)}")
+    print(f"Pedidos gravados: {stored_orders}, estoque restante: {remaining}")
+    print(f"Vazão: {attempts / elapsed:.1f} tentativas/s")
+
+    consistent = (
+        len(created) == expected == stored_orders
+        and remaining == {'produto1': initial_stock - expected, 'produto2': initial_stock - expected}
+    )
+    print("Consistente: sim" if consistent else "Consistente: NÃO")
+    sys.exit(0 if consistent else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_notifications.py
+# Mede mensagens/s entregues a canais falsos com latência fixa por submissão.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_notifications [n_pedidos] [latencia_ms]
+
+import sys
+import time
+
+from models.customer import Customer
+from models.order import Order
+from models.enums import CustomerType, OrderStatus
+from services.notification_router import NotificationRouter
+from strategies.notification_strategy import FakeNotificationStrategy, BatchingNotificationStrategy
+
+CHANNELS = ['email', 'sms', 'push']
+
+
+def make_orders(n_orders: int):
+    customer = Customer(name='Cliente Benchmark', customer_type=CustomerType.NORMAL)
+    return [Order(id=i, customer=customer, items=[]) for i in range(1, n_orders + 1)]
+
+
+def bench_sequential(orders, latency: float) -> float:
+    channels = [FakeNotificationStrategy(name, latency) for name in CHANNELS]
+    start = time.perf_counter()
+    for order in orders:
+        for channel in channels:
+            channel.send_notification(order, OrderStatus.APPROVED)
+    elapsed = time.perf_counter() - start
+    return sum(channel.messages_sent for channel in channels) / elapsed
+
+
+def bench_router(orders, latency: float) -> float:
+    channels = [FakeNotificationStrategy(name, latency) for name in CHANNELS]
+    router = NotificationRouter(channels)
+    start = time.perf_counter()
+    for order in orders:
+        router.send_notification(order, OrderStatus.APPROVED)
+    elapsed = time.perf_counter() - start
+    router.close()
+    return sum(channel.messages_sent for channel in channels) / elapsed
+
+
+def bench_router_batching(orders, latency: float) -> float:
+    channels = [FakeNotificationStrategy(name, latency) for name in CHANNELS]
+    batching = [BatchingNotificationStrategy(channel, max_batch=500, flush_interval=0.1) for channel in channels]
+    router = NotificationRouter(batching)
+    start = time.perf_counter()
+    for order in orders:
+        router.send_notification(order, OrderStatus.APPROVED)
+    for channel in batching:
+        channel.close()
+    elapsed = time.perf_counter() - start
+    router.close()
+    return sum(channel.messages_sent for channel in channels) / elapsed
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 2.0) / 1000
+
+    orders = make_orders(n_orders)
+    print(f"{n_orders} pedidos x {len(CHANNELS)} canais, {latency * 1000:.1f} ms por submissão")
+    print(f"Sequencial, 1 mensagem por chamada: {bench_sequential(orders, latency):12.1f} msg/s")
+    print(f"Roteador (canais em paralelo):      {bench_router(orders, latency):12.1f} msg/s")
+    print(f"Roteador + envio em lote:           {bench_router_batching(orders, latency):12.1f} msg/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+# benchmarks/bench_outbox.py
+# Confere o ciclo do outbox de notificações: enqueue -> dispatch -> falha
+# com retentativa -> mark_sent, a falha definitiva após max_attempts e que
+# start() não devolve à fila mensagens pegas há pouco por outro processo.
+# Depois mede mensagens/s entregues pelo dispatcher em segundo plano.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_outbox [n_pedidos] [latencia_ms]
+
+import os
+import sys
+import tempfile
+import time
+
+from config.database import DatabaseManager
+from models.customer import Customer
+from models.order import Order
+from models.enums import CustomerType, OrderStatus
+from repositories.notification_outbox_repository import NotificationOutboxRepository
+from services.notification_dispatcher import NotificationDispatcher
+from services.outbox_notification_service import OutboxNotificationService
+from strategies.notification_strategy import FakeNotificationStrategy
+
+BACKOFF = 0.05
+
+
+class FlakyNotificationStrategy(FakeNotificationStrategy):
+    # Recusa as primeiras `failures` mensagens, depois entrega normalmente
+
+    def __init__(self, method: str, failures: int):
+        super().__init__(method)
+        self._failures = failures
+
+    def send_many(self, orders, status) -> int:
+        with self._lock:
+            if self._failures:
+                self._failures -= 1
+                raise RuntimeError("provedor indisponível")
+        return super().send_many(orders, status)
+
+
+def make_orders(n_orders: int):
+    customer = Customer(name='Cliente Benchmark', customer_type=CustomerType.NORMAL)
+    return [Order(id=i, customer=customer, items=[]) for i in range(1, n_orders + 1)]
+
+
+def open_outbox(path: str):
+    db_manager = DatabaseManager(path, persistent=True)
+    db_manager.initialize()
+    return db_manager, NotificationOutboxRepository(db_manager)
+
+
+def attempts_by_channel(db_manager: DatabaseManager):
+    with db_manager as cursor:
+        cursor.execute("SELECT channel, state, attempts FROM notification_outbox ORDER BY id")
+        return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+
+def check_retry(tmp: str):
+    db_manager, outbox = open_outbox(os.path.join(tmp, 'retry.db'))
+    email = FakeNotificationStrategy('email')
+    sms = FlakyNotificationStrategy('sms', failures=1)
+    dispatcher = NotificationDispatcher(outbox, [email, sms], max_attempts=3, backoff_seconds=BACKOFF)
+    OutboxNotificationService(outbox, ['email', 'sms']).send_notification(make_orders(1)[0], OrderStatus.APPROVED)
+
+    assert dispatcher.dispatch_once() == 2
+    assert attempts_by_channel(db_manager) == {'email': ('sent', 1), 'sms': ('pending', 1)}
+    # Ainda no backoff: nada pronto para envio
+    assert dispatcher.dispatch_once() == 0
+
+    time.sleep(BACKOFF * 2)
+    assert dispatcher.dispatch_once() == 1
+    assert attempts_by_channel(db_manager) == {'email': ('sent', 1), 'sms': ('sent', 2)}
+    assert (email.messages_sent, sms.messages_sent) == (1, 1)
+    dispatcher.stop()
+    db_manager.close()
+    print("Falha com retentativa: reenviada após o backoff e marcada como enviada (ok)")
+
+
+def check_permanent_failure(tmp: str):
+    db_manager, outbox = open_outbox(os.path.join(tmp, 'falha.db'))
+    sms = FlakyNotificationStrategy('sms', failures=10)
+    dispatcher = NotificationDispatcher(outbox, [sms], max_attempts=2, backoff_seconds=BACKOFF)
+    OutboxNotificationService(outbox, ['sms']).send_notification(make_orders(1)[0], OrderStatus.APPROVED)
+
+    dispatcher.dispatch_once()
+    time.sleep(BACKOFF * 2)
+    dispatcher.dispatch_once()
+    assert attempts_by_channel(db_manager) == {'sms': ('failed', 2)}
+    assert outbox.count_by_state() == {'failed': 1}
+    dispatcher.stop()
+    db_manager.close()
+    print("Falha definitiva após max_attempts (ok)")
+
+
+def check_live_claims(tmp: str):
+    db_manager, outbox = open_outbox(os.path.join(tmp, 'claims.db'))
+    OutboxNotificationService(outbox, ['email']).send_notification(make_orders(1)[0], OrderStatus.APPROVED)
+    # Outro processo pegou a mensagem e ainda está enviando
+    assert len(outbox.claim_batch(10)) == 1
+
+    email = FakeNotificationStrategy('email')
+    dispatcher = NotificationDispatcher(outbox, [email], poll_interval=0.01, claim_timeout=60)
+    dispatcher.start()
+    time.sleep(0.05)
+    dispatcher.stop()
+    assert outbox.count_by_state() == {'processing': 1}
+    assert email.messages_sent == 0
+    # Passado o claim_timeout ela volta para a fila
+    assert outbox.release_claimed(0) == 1
+    db_manager.close()
+    print("start() mantém as mensagens pegas há pouco por outro processo (ok)")
+
+
+def bench_dispatch(tmp: str, n_orders: int, latency: float) -> float:
+    db_manager, outbox = open_outbox(os.path.join(tmp, 'bench.db'))
+    channels = [FakeNotificationStrategy(name, latency) for name in ('email', 'sms')]
+    service = OutboxNotificationService(outbox, [channel.get_notification_method() for channel in channels])
+    with db_manager:
+        for order in make_orders(n_orders):
+            service.send_notification(order, OrderStatus.APPROVED)
+
+    dispatcher = NotificationDispatcher(outbox, channels, default_concurrency=8, poll_interval=0.01)
+    start = time.perf_counter()
+    dispatcher.start()
+    while outbox.count_by_state().get('sent', 0) < n_orders * len(channels):
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    dispatcher.stop()
+    db_manager.close()
+    assert sum(channel.messages_sent for channel in channels) == n_orders * len(channels)
+    return n_orders * len(channels) / elapsed
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 2.0) / 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        check_retry(tmp)
+        check_permanent_failure(tmp)
+        check_live_claims(tmp)
+        rate = bench_dispatch(tmp, n_orders, latency)
+
+    print(f"{n_orders} pedidos x 2 canais, {latency * 1000:.1f} ms por envio: {rate:.1f} msg/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_parallel_report.py
+# Relatório de vendas serial vs paralelo (fatias de IDs num pool de processos).
+# Confere que o rel_vendas.txt e a saída no console são idênticos nos dois
+# modos. A medição usa print_lines=False: só o arquivo, sem uma linha no
+# console por pedido.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_parallel_report [linhas] [workers...]
+
+import contextlib
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from config.database import DatabaseManager
+from models.enums import ReportType
+from repositories.order_repository import OrderRepository
+from services.report_service import ReportService
+from benchmarks.bench_hydration import populate
+
+
+def run_report(repository: OrderRepository, workers: int) -> float:
+    service = ReportService(repository, workers=workers, print_lines=False)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        service.generate_report(ReportType.SALES)
+        return time.perf_counter() - start
+
+
+def report_output(repository: OrderRepository, workers: int, print_lines: bool) -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        ReportService(repository, workers=workers, print_lines=print_lines).generate_report(ReportType.SALES)
+    return output.getvalue()
+
+
+def check_console_output(repository: OrderRepository, workers: int):
+    # Com ou sem as linhas de pedido, o console não depende do modo
+    for print_lines in (True, False):
+        serial = report_output(repository, 1, print_lines)
+        parallel = report_output(repository, workers, print_lines)
+        assert serial == parallel, f"saída diferente entre os modos (print_lines={print_lines})"
+    print("Console idêntico nos dois modos, com e sem print_lines (ok)")
+
+
+def file_digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or sorted({2, 4, os.cpu_count() or 1})
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            db_manager = DatabaseManager(os.path.join(tmp, 'relatorio.db'), persistent=True)
+            db_manager.initialize()
+            populate(db_manager, n_rows, 1)
+            # O modo serial usa a hidratação mais barata (só cabeçalho)
+            repository = OrderRepository(db_manager, lazy_items=True)
+
+            check_console_output(repository, max(worker_counts))
+
+            serial = run_report(repository, 1)
+            expected = file_digest('rel_vendas.txt')
+            print(f"Pedidos: {n_rows}")
+            print(f"Serial:        {serial:.2f}s")
+            for workers in worker_counts:
+                elapsed = run_report(repository, workers)
+                same = file_digest('rel_vendas.txt') == expected
+                print(f"{workers:>2} processos:  {elapsed:.2f}s (speedup {serial / elapsed:.1f}x, "
+                      f"arquivo {'idêntico' if same else 'DIFERENTE'})")
+            db_manager.close()
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+# benchmarks/bench_pipeline.py
+# Compara o fluxo sequencial (como em main.py) com o OrderPipeline:
+# criação -> pagamento -> envio/entrega, e mostra a latência por etapa.
+# O ganho do pipeline vem de sobrepor a espera do gateway de pagamento
+# (latencia_ms simulada); as gravações no SQLite continuam serializadas,
+# então com latência 0 o pipeline não é mais rápido que o fluxo sequencial.
+# Também confere que um pagamento recusado interrompe o pedido.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_pipeline [pedidos] [workers] [fila] [latencia_ms]
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from config.database import DatabaseManager
+from models.customer import Customer
+from models.order_item import OrderItem
+from models.order_request import OrderRequest
+from models.enums import CustomerType, ItemType, OrderStatus, PaymentMethod
+from repositories.order_repository import OrderRepository
+from repositories.inventory_repository import InventoryRepository
+from services.order_service import OrderService
+from services.order_pipeline import OrderPipeline
+from services.payment_service import PaymentService
+from services.notification_service import NotificationService
+from services.loyalty_service import LoyaltyService
+from services.inventory_service import InventoryService
+from strategies.pricing_engine import PricingEngine
+from interfaces.payment_interface import IPaymentStrategy
+from models.order import Order
+from strategies.payment_strategy import CardPaymentStrategy, PIXPaymentStrategy, BoletoPaymentStrategy
+
+
+class GatewayPaymentStrategy(IPaymentStrategy):
+    # Cartão com a latência de rede de um gateway e resposta configurável
+    def __init__(self, latency: float, approve: bool = True):
+        self._latency = latency
+        self._approve = approve
+
+    def process_payment(self, order: Order, amount: float) -> bool:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._approve
+
+    def get_payment_method(self) -> PaymentMethod:
+        return PaymentMethod.CARD
+
+    def requires_approval(self) -> bool:
+        return True
+
+
+def build_services(db_path: str, n_orders: int, card_strategy: IPaymentStrategy = None):
+    db_manager = DatabaseManager(db_path, persistent=True)
+    db_manager.initialize()
+    inventory_repository = InventoryRepository(db_manager)
+    inventory_repository.set_quantities({'produto1': n_orders * 2, 'produto2': n_orders})
+    inventory_service = InventoryService(inventory_repository)
+
+    order_repository = OrderRepository(db_manager)
+    order_service = OrderService(
+        order_repository=order_repository,
+        notification_service=NotificationService(),
+        loyalty_service=LoyaltyService(),
+        inventory_service=inventory_service,
+        pricing_engine=PricingEngine(),
+        unit_of_work=db_manager
+    )
+    payment_service = PaymentService(
+        payment_strategies={
+            PaymentMethod.CARD: card_strategy or CardPaymentStrategy(),
+            PaymentMethod.PIX: PIXPaymentStrategy(),
+            PaymentMethod.BOLETO: BoletoPaymentStrategy()
+        },
+        order_repository=order_repository,
+        order_service=order_service
+    )
+    return db_manager, order_service, payment_service, inventory_service
+
+
+def build_requests(n_orders: int):
+    items = [
+        OrderItem(name='produto1', price=100, quantity=2, item_type=ItemType.NORMAL),
+        OrderItem(name='produto2', price=50, quantity=1, item_type=ItemType.DESC10)
+    ]
+    return [
+        OrderRequest(
+            customer=Customer(name=f'Cliente {i % 50}', customer_type=CustomerType.NORMAL),
+            items=items,
+            payment_method=PaymentMethod.CARD,
+            amount_paid=250.0,
+            status_updates=[OrderStatus.SHIPPED, OrderStatus.DELIVERED]
+        )
+        for i in range(n_orders)
+    ]
+
+
+def check_declined_payment(tmp: str):
+    # Pagamento recusado: o pedido falha na etapa 'payment', sem envio,
+    # entrega nem pontos de fidelidade
+    db_manager, order_service, payment_service, inventory_service = build_services(
+        os.path.join(tmp, 'recusado.db'), 1, GatewayPaymentStrategy(0, approve=False)
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        with OrderPipeline(order_service, payment_service, inventory_service, workers=1) as pipeline:
+            result = pipeline.process_all(build_requests(1))[0]
+    order = order_service._order_repository.get_by_id(result.order_id)
+    db_manager.close()
+
+    assert not result.paid and not result.succeeded, result
+    assert result.failed_stage == 'payment', result.failed_stage
+    assert order.status == OrderStatus.PENDING, order.status
+    assert pipeline.get_metrics()['counters'].get('failed') == 1
+    print("Pagamento recusado: pedido interrompido na etapa 'payment' (ok)")
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    queue_size = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+    latency = (float(sys.argv[4]) if len(sys.argv) > 4 else 5.0) / 1000
+    requests = build_requests(n_orders)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        check_declined_payment(tmp)
+
+        db_manager, order_service, payment_service, inventory_service = build_services(
+            os.path.join(tmp, 'sequencial.db'), n_orders, GatewayPaymentStrategy(latency)
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for request in requests:
+                order_id = order_service.create_order(request.customer, request.items, request.is_special)
+                if not payment_service.process_payment(order_id, request.payment_method, request.amount_paid):
+                    continue
+                for status in request.status_updates:
+                    order_service.update_order_status(order_id, status)
+            sequential = time.perf_counter() - start
+        db_manager.close()
+
+        db_manager, order_service, payment_service, inventory_service = build_services(
+            os.path.join(tmp, 'pipeline.db'), n_orders, GatewayPaymentStrategy(latency)
+        )
+        pipeline = OrderPipeline(order_service, payment_service, inventory_service,
+                                 workers=workers, queue_size=queue_size)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            with pipeline:
+                results = pipeline.process_all(requests)
+            concurrent = time.perf_counter() - start
+        db_manager.close()
+
+    failures = [r for r in results if not r.succeeded]
+    print(f"Pedidos: {n_orders}, workers: {workers}, fila: {queue_size}, latência do gateway: {latency * 1000:.1f}ms")
+    print(f"Sequencial: {sequential:.3f}s ({n_orders / sequential:.1f} pedidos/s)")
+    print(f"Pipeline:   {concurrent:.3f}s ({n_orders / concurrent:.1f} pedidos/s, {sequential / concurrent:.1f}x), falhas: {len(failures)}")
+
+    metrics = pipeline.get_metrics()
+    print(f"Contadores: {metrics['counters']}")
+    for stage, summary in metrics['stages'].items():
+        print(f"  {stage:<14} n={summary['count']:<6} p50={summary['p50_ms']:.2f}ms "
+              f"p95={summary['p95_ms']:.2f}ms p99={summary['p99_ms']:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_pricing.py
+# Cálculo do total pedido a pedido: strategies encadeadas (com a strategy de
+# cliente escolhida pelo tipo) vs PricingEngine com a tabela compilada.
+# Confere que os totais são idênticos e que, com recargas concorrentes, todo
+# pedido é precificado inteiro por uma única versão das regras.
+# Uso (dentro de Prova_Douglas): python -m benchmarks.bench_pricing [pedidos] [threads]
+
+import sys
+import threading
+import time
+from decimal import Decimal
+
+from models.enums import CustomerType
+from models.pricing_rules import PricingRules
+from strategies.discount_strategy import (
+    ItemDiscountStrategy, NormalCustomerStrategy, VIPCustomerStrategy, SpecialOrderFeeStrategy
+)
+from strategies.pricing_engine import PricingEngine, DEFAULT_PRICING_RULES
+from benchmarks.synthetic import generate_customers, generate_order_requests
+
+
+def price_chained(requests):
+    item_strategy = ItemDiscountStrategy()
+    customer_strategies = {CustomerType.VIP: VIPCustomerStrategy()}
+    normal_strategy = NormalCustomerStrategy()
+    fee_strategy = SpecialOrderFeeStrategy()
+    totals = []
+    for request in requests:
+        total = item_strategy.calculate_discount(request.items)
+        customer_strategy = customer_strategies.get(request.customer.customer_type, normal_strategy)
+        total = customer_strategy.apply_customer_discount(total, request.customer)
+        totals.append(fee_strategy.apply_special_fee(total, request.is_special))
+    return totals
+
+
+def price_engine(engine: PricingEngine, requests):
+    return [engine.calculate_total(r.items, r.customer, r.is_special) for r in requests]
+
+
+def check_reload(requests, n_threads: int) -> int:
+    # Alterna entre duas versões das regras enquanto as threads precificam;
+    # cada total tem que bater com uma das duas versões
+    alternate = PricingRules(
+        DEFAULT_PRICING_RULES.item_factors,
+        {CustomerType.VIP: Decimal('0.9'), CustomerType.SPECIAL: Decimal('0.97')},
+        Decimal('1.2')
+    )
+    expected = [
+        {total.cents for total in totals}
+        for totals in zip(price_engine(PricingEngine(), requests), price_engine(PricingEngine(alternate), requests))
+    ]
+
+    engine = PricingEngine()
+    mismatches = []
+    stop = threading.Event()
+
+    def reloader():
+        use_alternate = True
+        while not stop.is_set():
+            engine.reload(alternate if use_alternate else DEFAULT_PRICING_RULES)
+            use_alternate = not use_alternate
+
+    def worker():
+        for index, total in enumerate(price_engine(engine, requests)):
+            if total.cents not in expected[index]:
+                mismatches.append(index)
+
+    reload_thread = threading.Thread(target=reloader)
+    reload_thread.start()
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop.set()
+    reload_thread.join()
+    print(f"Recargas concorrentes: {engine.get_version() - 1} versões, {len(mismatches)} totais inconsistentes")
+    return len(mismatches)
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    n_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    requests = list(generate_order_requests(n_orders, generate_customers(max(n_orders // 20, 1))))
+
+    start = time.perf_counter()
+    chained = price_chained(requests)
+    chained_elapsed = time.perf_counter() - start
+
+    engine = PricingEngine()
+    start = time.perf_counter()
+    compiled = price_engine(engine, requests)
+    engine_elapsed = time.perf_counter() - start
+
+    print(f"strategies encadeadas: {n_orders / chained_elapsed:,.0f} pedidos/s")
+    print(f"PricingEngine:         {n_orders / engine_elapsed:,.0f} pedidos/s ({chained_elapsed / engine_elapsed:.1f}x)")
+    print(f"Totais idênticos: {chained == compiled}")
+
+    check_reload(requests[:min(n_orders, 20_000)], n_threads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+# benchmarks/suite.py
+# Suíte de benchmark do ciclo de vida do pedido: popula um banco com pedidos
+# sintéticos e mede create_order, process_payment, update_order_status,
+# get_by_id e os dois relatórios do ReportService (ops/s, p50/p99).
+#
+# Uso (dentro de Prova_Douglas):
+#   python -m benchmarks.suite --orders 100000 --json resultado.json
+#   python -m benchmarks.suite --orders 100000 --compare resultado.json
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable
+
+from config.database import DatabaseManager
+from models.enums import OrderStatus, PaymentMethod, ReportType
+from monitoring import instrumentation
+from monitoring.metrics import LatencyStats
+from repositories.order_repository import OrderRepository
+from repositories.cached_order_repository import CachedOrderRepository
+from repositories.inventory_repository import InMemoryInventoryRepository
+from services.order_service import OrderService
+from services.notification_service import NotificationService
+from services.loyalty_service import LoyaltyService
+from services.inventory_service import InventoryService
+from services.payment_service import PaymentService
+from services.report_service import ReportService
+from strategies.pricing_engine import PricingEngine
+from strategies.payment_strategy import CardPaymentStrategy, PIXPaymentStrategy, BoletoPaymentStrategy
+from benchmarks.synthetic import generate_customers, generate_order_requests, unlimited_stock
+
+# Versão do formato do JSON de saída
+RESULT_FORMAT_VERSION = 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do ciclo de vida do pedido")
+    parser.add_argument('--orders', type=int, default=10_000, help="pedidos pré-carregados no banco")
+    parser.add_argument('--customers', type=int, default=None, help="clientes distintos (padrão: pedidos / 20)")
+    parser.add_argument('--ops', type=int, default=1_000, help="operações medidas por benchmark de pedido")
+    parser.add_argument('--report-runs', type=int, default=3, help="execuções de cada relatório")
+    parser.add_argument('--batch-size', type=int, default=5_000, help="pedidos por lote na carga inicial")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--db', default=None, help="arquivo do banco (padrão: temporário)")
+    parser.add_argument('--cached', action='store_true', help="usa o CachedOrderRepository")
+    parser.add_argument('--instrument', action='store_true', help="liga a instrumentação e inclui o snapshot no JSON")
+    parser.add_argument('--label', default=None, help="rótulo da versão medida")
+    parser.add_argument('--json', dest='json_path', default=None, help="grava o resultado em JSON ('-' para stdout)")
+    parser.add_argument('--compare', default=None, help="JSON de uma execução anterior para comparação")
+    return parser.parse_args(argv)
+
+
+def batched(iterator, total: int, batch_size: int):
+    # Consome exatamente 'total' itens do iterador, em listas de até batch_size
+    remaining = total
+    while remaining > 0:
+        batch = list(itertools.islice(iterator, min(batch_size, remaining)))
+        if not batch:
+            return
+        remaining -= len(batch)
+        yield batch
+
+
+def measure(stats: LatencyStats, operations: Iterable, run: Callable) -> float:
+    # Mede cada operação individualmente; retorna o tempo total de parede
+    start = time.perf_counter()
+    for operation in operations:
+        op_start = time.perf_counter()
+        run(operation)
+        stats.record(time.perf_counter() - op_start)
+    return time.perf_counter() - start
+
+
+def summarize(stats: LatencyStats, elapsed: float) -> Dict[str, float]:
+    summary = stats.summary()
+    summary['ops_per_sec'] = summary['count'] / elapsed if elapsed > 0 else 0.0
+    return summary
+
+
+def run_suite(args, db_path: str, report_dir: str) -> Dict[str, Dict[str, float]]:
+    db_manager = DatabaseManager(db_path, persistent=True)
+    db_manager.initialize()
+    order_repository = OrderRepository(db_manager)
+    if args.cached:
+        order_repository = CachedOrderRepository(order_repository, database=db_manager)
+
+    order_service = OrderService(
+        order_repository=order_repository,
+        notification_service=NotificationService(),
+        loyalty_service=LoyaltyService(),
+        inventory_service=InventoryService(InMemoryInventoryRepository(unlimited_stock())),
+        pricing_engine=PricingEngine(),
+        unit_of_work=db_manager
+    )
+    payment_service = PaymentService(
+        payment_strategies={
+            PaymentMethod.CARD: CardPaymentStrategy(),
+            PaymentMethod.PIX: PIXPaymentStrategy(),
+            PaymentMethod.BOLETO: BoletoPaymentStrategy()
+        },
+        order_repository=order_repository,
+        order_service=order_service
+    )
+    report_service = ReportService(order_repository)
+
+    customers = generate_customers(args.customers or max(args.orders // 20, 1), args.seed)
+    requests = generate_order_requests(args.orders + args.ops, customers, args.seed)
+    rng = random.Random(args.seed)
+    results = {}
+
+    # Carga inicial em lotes pelo caminho de importação (create_orders)
+    populate = LatencyStats()
+    elapsed = measure(populate, batched(requests, args.orders, args.batch_size), order_service.create_orders)
+    results['populate'] = summarize(populate, elapsed)
+    results['populate']['orders_per_sec'] = args.orders / elapsed if elapsed > 0 else 0.0
+
+    # Os próximos pedidos do mesmo gerador alimentam create_order
+    created_ids = []
+    stats = LatencyStats()
+    elapsed = measure(
+        stats, itertools.islice(requests, args.ops),
+        lambda r: created_ids.append(order_service.create_order(r.customer, r.items, r.is_special))
+    )
+    results['create_order'] = summarize(stats, elapsed)
+
+    methods = list(PaymentMethod)
+    stats = LatencyStats()
+    elapsed = measure(
+        stats, created_ids,
+        lambda order_id: payment_service.process_payment(order_id, rng.choice(methods), 10 ** 9)
+    )
+    results['process_payment'] = summarize(stats, elapsed)
+
+    stats = LatencyStats()
+    elapsed = measure(
+        stats, created_ids,
+        lambda order_id: order_service.update_order_status(order_id, OrderStatus.SHIPPED)
+    )
+    results['update_order_status'] = summarize(stats, elapsed)
+
+    max_id = args.orders + args.ops
+    stats = LatencyStats()
+    elapsed = measure(
+        stats, (rng.randint(1, max_id) for _ in range(args.ops)),
+        order_repository.get_by_id
+    )
+    results['get_by_id'] = summarize(stats, elapsed)
+
+    # Os relatórios gravam rel_*.txt no diretório atual
+    cwd = os.getcwd()
+    os.chdir(report_dir)
+    try:
+        for name, report_type in (('report_sales', ReportType.SALES), ('report_clients', ReportType.CLIENTS)):
+            stats = LatencyStats()
+            elapsed = measure(stats, range(args.report_runs), lambda _: report_service.generate_report(report_type))
+            results[name] = summarize(stats, elapsed)
+    finally:
+        os.chdir(cwd)
+
+    db_manager.close()
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]] = None):
+    header = f"{'benchmark':<20} {'n':>8} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10}"
+    if baseline:
+        header += f" {'Δ ops/s':>10}"
+    print(header, file=sys.stderr)
+    for name, summary in results.items():
+        line = (f"{name:<20} {summary['count']:>8} {summary['ops_per_sec']:>12.1f} "
+                f"{summary['p50_ms']:>10.3f} {summary['p99_ms']:>10.3f}")
+        previous = (baseline or {}).get(name)
+        if previous and previous.get('ops_per_sec'):
+            change = summary['ops_per_sec'] / previous['ops_per_sec'] - 1
+            line += f" {change:>+9.1%}"
+        print(line, file=sys.stderr)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.instrument:
+        instrumentation.enable()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or os.path.join(tmp, 'benchmark.db')
+        # Os serviços imprimem a cada operação; em escala isso é descartado
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            results = run_suite(args, db_path, tmp)
+
+    output = {
+        'format_version': RESULT_FORMAT_VERSION,
+        'label': args.label,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'orders': args.orders,
+            'customers': args.customers or max(args.orders // 20, 1),
+            'ops': args.ops,
+            'report_runs': args.report_runs,
+            'batch_size': args.batch_size,
+            'seed': args.seed,
+            'cached': args.cached,
+            'instrument': args.instrument
+        },
+        'results': results
+    }
+    if args.instrument:
+        output['instrumentation'] = instrumentation.snapshot()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f).get('results')
+    print_results(results, baseline)
+
+    if args.json_path == '-':
+        json.dump(output, sys.stdout, indent=2)
+        print()
+    elif args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
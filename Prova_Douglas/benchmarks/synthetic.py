@@ -0,0 +1,61 @@
+# benchmarks/synthetic.py
+# Gerador determinístico de clientes e pedidos sintéticos para os benchmarks.
+
+import random
+from typing import Iterator, List
+from models.customer import Customer
+from models.order_item import OrderItem
+from models.order_request import OrderRequest
+from models.enums import CustomerType, ItemType
+
+# Catálogo sintético: nome -> preço em reais
+PRODUCTS = {f'produto{i}': 5 + (i * 37) % 300 for i in range(1, 51)}
+
+# Distribuição aproximada de tipos de cliente (maioria normal)
+CUSTOMER_TYPE_WEIGHTS = {
+    CustomerType.NORMAL: 80,
+    CustomerType.VIP: 15,
+    CustomerType.SPECIAL: 5
+}
+
+
+def generate_customers(n_customers: int, seed: int = 42) -> List[Customer]:
+    rng = random.Random(seed)
+    types = list(CUSTOMER_TYPE_WEIGHTS)
+    weights = list(CUSTOMER_TYPE_WEIGHTS.values())
+    return [
+        Customer(name=f'Cliente {i:07d}', customer_type=rng.choices(types, weights)[0])
+        for i in range(n_customers)
+    ]
+
+
+def generate_order_requests(
+    n_orders: int,
+    customers: List[Customer],
+    seed: int = 42,
+    max_items: int = 5
+) -> Iterator[OrderRequest]:
+    # Gerador preguiçoso: permite milhões de pedidos sem materializar a lista
+    rng = random.Random(seed)
+    product_names = list(PRODUCTS)
+    item_types = list(ItemType)
+    for _ in range(n_orders):
+        items = [
+            OrderItem(
+                name=name,
+                price=PRODUCTS[name],
+                quantity=rng.randint(1, 3),
+                item_type=rng.choice(item_types)
+            )
+            for name in rng.sample(product_names, rng.randint(1, max_items))
+        ]
+        yield OrderRequest(
+            customer=rng.choice(customers),
+            items=items,
+            is_special=rng.random() < 0.05
+        )
+
+
+def unlimited_stock() -> dict:
+    # Estoque grande o bastante para qualquer escala de benchmark
+    return {name: 10 ** 12 for name in PRODUCTS}
@@ -1,32 +1,161 @@
 import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+from config.migrations import apply_migrations
+from monitoring.instrumentation import span
+
+# Pragmas aplicados a cada conexão do modo persistente.
+# WAL permite leitores concorrentes enquanto um escritor grava.
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -16000,  # ~16 MB
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,
+}
+
 
 class DatabaseManager:
-    def __init__(self, db_name: str):
+    def __init__(self, db_name: str, persistent: bool = False, pragmas: Optional[Dict[str, object]] = None):
         self._db_name = db_name
-        self.conn = None
-        self.cursor = None
+        self._persistent = persistent
+        self._pragmas = dict(DEFAULT_PRAGMAS)
+        if pragmas:
+            self._pragmas.update(pragmas)
+
+        # Cada thread tem sua própria conexão e pilha de contextos abertos
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    @property
+    def db_name(self) -> str:
+        return self._db_name
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1][0] if stack else None
+
+    @property
+    def cursor(self) -> Optional[sqlite3.Cursor]:
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1][1] if stack else None
 
     def __enter__(self):
-        self.conn = sqlite3.connect(self._db_name)
-        self.cursor = self.conn.cursor()
-        self._create_table_if_not_exists()
-        return self.cursor
+        conn = self._acquire()
+        cursor = conn.cursor()
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        self._local.stack.append((conn, cursor))
+        return cursor
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is None:
-            self.conn.commit()
-        self.conn.close()
-
-    def _create_table_if_not_exists(self):
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS orders (
-                id INTEGER PRIMARY KEY,
-                customer_name TEXT,
-                customer_type TEXT,
-                items TEXT,
-                total_price REAL,
-                status TEXT,
-                created_at TEXT
-            )
-        """)
-        self.conn.commit()
\ No newline at end of file
+        conn, cursor = self._local.stack.pop()
+        cursor.close()
+
+        if not self._persistent:
+            if exc_type is None:
+                with span("db.commit"):
+                    conn.commit()
+            conn.close()
+            return
+
+        # No modo persistente contextos aninhados compartilham a conexão,
+        # então só o mais externo encerra a transação.
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            callbacks, self._local.callbacks = self._local.callbacks, []
+            try:
+                if exc_type is None:
+                    with span("db.commit"):
+                        conn.commit()
+                else:
+                    conn.rollback()
+            finally:
+                for callback in callbacks:
+                    callback()
+
+    def after_transaction(self, callback: Callable[[], None]):
+        # Executa callback quando a transação aberta pela thread terminar
+        # (commit ou rollback); fora de uma transação, executa na hora. Serve
+        # para caches que só podem ser invalidados depois que as outras
+        # conexões passam a enxergar a gravação.
+        if self._persistent and getattr(self._local, 'depth', 0) > 0:
+            self._local.callbacks.append(callback)
+        else:
+            callback()
+
+    def initialize(self):
+        # Cria o schema na inicialização da aplicação em vez de na primeira chamada
+        with self:
+            pass
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Cursor]:
+        # Cursor para varreduras longas. No modo persistente usa uma conexão
+        # somente leitura própria, para que o scan não prenda a transação da
+        # conexão compartilhada da thread enquanto o chamador grava. Dentro de
+        # uma transação aberta pela thread usa a conexão dela, para que a
+        # varredura enxergue as gravações ainda não confirmadas.
+        if not self._persistent or self._db_name == ':memory:' or self._in_transaction():
+            with self as cursor:
+                yield cursor
+            return
+
+        self._ensure_schema_ready()
+        conn = sqlite3.connect(f"file:{self._db_name}?mode=ro", uri=True)
+        conn.execute(f"PRAGMA busy_timeout={self._pragmas.get('busy_timeout', 5000)}")
+        try:
+            yield conn.cursor()
+        finally:
+            conn.close()
+
+    def _in_transaction(self) -> bool:
+        conn = getattr(self._local, 'conn', None)
+        return conn is not None and conn.in_transaction
+
+    def close(self):
+        # Fecha todas as conexões persistentes abertas pelas threads
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _acquire(self) -> sqlite3.Connection:
+        if not self._persistent:
+            conn = sqlite3.connect(self._db_name)
+            self._ensure_schema(conn)
+            return conn
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # A conexão só é usada pela thread dona; check_same_thread=False
+            # permite que close() a encerre a partir de outra thread.
+            conn = sqlite3.connect(self._db_name, check_same_thread=False)
+            self._apply_pragmas(conn)
+            self._ensure_schema(conn)
+            self._local.conn = conn
+            self._local.depth = 0
+            self._local.callbacks = []
+            with self._lock:
+                self._connections.append(conn)
+        self._local.depth += 1
+        return conn
+
+    def _ensure_schema_ready(self):
+        if not self._schema_ready:
+            self.initialize()
+
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        with self._lock:
+            if not self._schema_ready:
+                apply_migrations(conn)
+                self._schema_ready = True
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
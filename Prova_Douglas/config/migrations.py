@@ -0,0 +1,306 @@
+# config/migrations.py
+# Migrações versionadas do schema. Cada passo roda uma única vez, em ordem,
+# e a versão aplicada fica registrada na tabela schema_version.
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def _create_orders(conn: sqlite3.Connection):
+    # 'items' guarda o JSON legado; novos pedidos gravam os itens em order_items
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY,
+            customer_name TEXT,
+            customer_type TEXT,
+            items TEXT,
+            total_price REAL,
+            status TEXT,
+            created_at TEXT
+        )
+    """)
+
+
+def _create_order_items(conn: sqlite3.Connection):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS order_items (
+            id INTEGER PRIMARY KEY,
+            order_id INTEGER NOT NULL REFERENCES orders(id),
+            position INTEGER NOT NULL,
+            name TEXT,
+            price REAL,
+            quantity INTEGER,
+            item_type TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_order_items_order ON order_items (order_id, position)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_order_items_name ON order_items (name)")
+
+    # Move os itens de bancos antigos (JSON em orders.items) para order_items
+    rows = conn.execute("SELECT id, items FROM orders WHERE items IS NOT NULL").fetchall()
+    conn.executemany(
+        "INSERT INTO order_items (order_id, position, name, price, quantity, item_type) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (order_id, position, item['name'], item['price'], item['quantity'], item['item_type'])
+            for order_id, items in rows
+            for position, item in enumerate(json.loads(items))
+        ]
+    )
+    conn.execute("UPDATE orders SET items = NULL WHERE items IS NOT NULL")
+
+
+def _add_created_ts_and_indexes(conn: sqlite3.Connection):
+    # created_ts: created_at em segundos (epoch) para ordenação e filtros por faixa
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(orders)")]
+    if 'created_ts' not in columns:
+        conn.execute("ALTER TABLE orders ADD COLUMN created_ts INTEGER")
+    conn.execute("UPDATE orders SET created_ts = CAST(strftime('%s', created_at) AS INTEGER) WHERE created_ts IS NULL")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_customer_name ON orders (customer_name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders (status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_created_ts ON orders (created_ts)")
+
+
+def _add_money_cents_columns(conn: sqlite3.Connection):
+    # Valores em centavos inteiros; total_price/price (REAL) ficam como espelho legado
+    order_columns = [row[1] for row in conn.execute("PRAGMA table_info(orders)")]
+    if 'total_cents' not in order_columns:
+        conn.execute("ALTER TABLE orders ADD COLUMN total_cents INTEGER")
+    item_columns = [row[1] for row in conn.execute("PRAGMA table_info(order_items)")]
+    if 'price_cents' not in item_columns:
+        conn.execute("ALTER TABLE order_items ADD COLUMN price_cents INTEGER")
+    conn.execute("UPDATE orders SET total_cents = CAST(ROUND(total_price * 100) AS INTEGER) WHERE total_cents IS NULL")
+    conn.execute("UPDATE order_items SET price_cents = CAST(ROUND(price * 100) AS INTEGER) WHERE price_cents IS NULL")
+
+
+def _create_notification_outbox(conn: sqlite3.Connection):
+    # Outbox: notificações gravadas na mesma transação do pedido e enviadas
+    # depois por um worker em segundo plano
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS notification_outbox (
+            id INTEGER PRIMARY KEY,
+            order_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            channel TEXT NOT NULL,
+            customer_name TEXT,
+            customer_type TEXT,
+            is_special INTEGER NOT NULL DEFAULT 0,
+            state TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            last_error TEXT,
+            created_at TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_pending ON notification_outbox (state, next_attempt_at)")
+
+
+def _create_inventory(conn: sqlite3.Connection):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS inventory (
+            product_name TEXT PRIMARY KEY,
+            quantity INTEGER NOT NULL CHECK (quantity >= 0)
+        )
+    """)
+    # Cada linha é a parte de uma reserva referente a um produto
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS stock_reservations (
+            id INTEGER PRIMARY KEY,
+            reservation_id TEXT NOT NULL,
+            product_name TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            order_id INTEGER,
+            state TEXT NOT NULL DEFAULT 'reserved',
+            created_at TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stock_reservations_reservation ON stock_reservations (reservation_id)")
+
+
+def _create_order_aggregates(conn: sqlite3.Connection):
+    # Agregados mantidos por triggers a cada gravação em orders, para que os
+    # relatórios leiam O(clientes)/O(dias) linhas em vez de varrer os pedidos.
+    # first_order_id preserva a ordem de primeira compra do relatório de clientes
+    # (não é recalculado se esse pedido for excluído; serve só para ordenar).
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS customer_totals (
+            customer_name TEXT NOT NULL,
+            customer_type TEXT NOT NULL,
+            total_cents INTEGER NOT NULL DEFAULT 0,
+            order_count INTEGER NOT NULL DEFAULT 0,
+            first_order_id INTEGER NOT NULL,
+            PRIMARY KEY (customer_name, customer_type)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_customer_totals_first_order ON customer_totals (first_order_id)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS status_counts (
+            status TEXT PRIMARY KEY,
+            order_count INTEGER NOT NULL DEFAULT 0,
+            total_cents INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_revenue (
+            day TEXT PRIMARY KEY,
+            total_cents INTEGER NOT NULL DEFAULT 0,
+            order_count INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    # INSERT OR IGNORE + UPDATE em vez de UPSERT: funciona dentro de
+    # triggers em qualquer versão do SQLite
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_orders_aggregates_insert AFTER INSERT ON orders
+        BEGIN
+            INSERT OR IGNORE INTO customer_totals (customer_name, customer_type, first_order_id)
+                VALUES (NEW.customer_name, NEW.customer_type, NEW.id);
+            UPDATE customer_totals
+                SET total_cents = total_cents + COALESCE(NEW.total_cents, 0),
+                    order_count = order_count + 1,
+                    first_order_id = MIN(first_order_id, NEW.id)
+                WHERE customer_name = NEW.customer_name AND customer_type = NEW.customer_type;
+
+            INSERT OR IGNORE INTO status_counts (status) VALUES (NEW.status);
+            UPDATE status_counts
+                SET order_count = order_count + 1, total_cents = total_cents + COALESCE(NEW.total_cents, 0)
+                WHERE status = NEW.status;
+
+            INSERT OR IGNORE INTO daily_revenue (day) VALUES (substr(NEW.created_at, 1, 10));
+            UPDATE daily_revenue
+                SET total_cents = total_cents + COALESCE(NEW.total_cents, 0), order_count = order_count + 1
+                WHERE day = substr(NEW.created_at, 1, 10);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_orders_aggregates_status AFTER UPDATE OF status ON orders
+        WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            UPDATE status_counts
+                SET order_count = order_count - 1, total_cents = total_cents - COALESCE(OLD.total_cents, 0)
+                WHERE status = OLD.status;
+            INSERT OR IGNORE INTO status_counts (status) VALUES (NEW.status);
+            UPDATE status_counts
+                SET order_count = order_count + 1, total_cents = total_cents + COALESCE(NEW.total_cents, 0)
+                WHERE status = NEW.status;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_orders_aggregates_delete AFTER DELETE ON orders
+        BEGIN
+            UPDATE customer_totals
+                SET total_cents = total_cents - COALESCE(OLD.total_cents, 0), order_count = order_count - 1
+                WHERE customer_name = OLD.customer_name AND customer_type = OLD.customer_type;
+            UPDATE status_counts
+                SET order_count = order_count - 1, total_cents = total_cents - COALESCE(OLD.total_cents, 0)
+                WHERE status = OLD.status;
+            UPDATE daily_revenue
+                SET total_cents = total_cents - COALESCE(OLD.total_cents, 0), order_count = order_count - 1
+                WHERE day = substr(OLD.created_at, 1, 10);
+        END
+    """)
+
+    # Carga inicial a partir dos pedidos já existentes
+    conn.execute("DELETE FROM customer_totals")
+    conn.execute("DELETE FROM status_counts")
+    conn.execute("DELETE FROM daily_revenue")
+    conn.execute("""
+        INSERT INTO customer_totals (customer_name, customer_type, total_cents, order_count, first_order_id)
+        SELECT customer_name, customer_type, COALESCE(SUM(total_cents), 0), COUNT(*), MIN(id)
+        FROM orders GROUP BY customer_name, customer_type
+    """)
+    conn.execute("""
+        INSERT INTO status_counts (status, order_count, total_cents)
+        SELECT status, COUNT(*), COALESCE(SUM(total_cents), 0) FROM orders GROUP BY status
+    """)
+    conn.execute("""
+        INSERT INTO daily_revenue (day, total_cents, order_count)
+        SELECT substr(created_at, 1, 10), COALESCE(SUM(total_cents), 0), COUNT(*)
+        FROM orders GROUP BY substr(created_at, 1, 10)
+    """)
+
+
+def _add_idempotency_and_id_leases(conn: sqlite3.Connection):
+    # Chave de idempotência por pedido: repetições do cliente com a mesma
+    # chave devolvem o pedido já criado em vez de gravar outro
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(orders)")]
+    if 'idempotency_key' not in columns:
+        conn.execute("ALTER TABLE orders ADD COLUMN idempotency_key TEXT")
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_orders_idempotency_key ON orders (idempotency_key) "
+        "WHERE idempotency_key IS NOT NULL"
+    )
+    # Concessões de worker_id do gerador de IDs: cada processo ativo tem um ID único
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS id_worker_leases (
+            worker_id INTEGER PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    """)
+
+
+def _add_outbox_claimed_at(conn: sqlite3.Connection):
+    # Momento em que a mensagem foi pega por um worker: mensagens presas em
+    # 'processing' além do prazo voltam para a fila
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(notification_outbox)")]
+    if 'claimed_at' not in columns:
+        conn.execute("ALTER TABLE notification_outbox ADD COLUMN claimed_at REAL")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "tabela orders", _create_orders),
+    Migration(2, "tabela order_items normalizada", _create_order_items),
+    Migration(3, "created_ts numérico e índices de orders", _add_created_ts_and_indexes),
+    Migration(4, "valores monetários em centavos", _add_money_cents_columns),
+    Migration(5, "outbox de notificações", _create_notification_outbox),
+    Migration(6, "estoque persistente e reservas", _create_inventory),
+    Migration(7, "agregados de clientes, status e receita diária", _create_order_aggregates),
+    Migration(8, "chave de idempotência e concessões de worker_id", _add_idempotency_and_id_leases),
+    Migration(9, "instante de reserva das mensagens do outbox", _add_outbox_claimed_at),
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TEXT
+        )
+    """)
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection, migrations: List[Migration] = MIGRATIONS) -> int:
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= get_schema_version(conn):
+            continue
+
+        # Trava de escrita antes de reler a versão: outro processo pode ter
+        # aplicado a mesma migração enquanto esperávamos
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if migration.version > get_schema_version(conn):
+                migration.apply(conn)
+                conn.execute(
+                    "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                    (migration.version, migration.description, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return get_schema_version(conn)
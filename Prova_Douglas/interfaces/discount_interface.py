@@ -2,13 +2,15 @@ from abc import ABC, abstractmethod
 from typing import List
 from models.order_item import OrderItem
 from models.customer import Customer
+from models.money import Money
 from models.enums import CustomerType
+from models.pricing_columns import PricingColumns
 
 
 class IDiscountStrategy(ABC):
     
     @abstractmethod
-    def calculate_discount(self, items: List[OrderItem]) -> float:
+    def calculate_discount(self, items: List[OrderItem]) -> Money:
         pass
     
     @abstractmethod
@@ -18,7 +20,7 @@ class IDiscountStrategy(ABC):
 
 class ICustomerDiscountStrategy(ABC):
     @abstractmethod
-    def apply_customer_discount(self, total: float, customer: Customer) -> float:
+    def apply_customer_discount(self, total: Money, customer: Customer) -> Money:
         pass
     
     @abstractmethod
@@ -29,5 +31,27 @@ class ICustomerDiscountStrategy(ABC):
 class ISpecialOrderFeeStrategy(ABC):
     
     @abstractmethod
-    def apply_special_fee(self, total: float, is_special: bool) -> float:
-        pass
\ No newline at end of file
+    def apply_special_fee(self, total: Money, is_special: bool) -> Money:
+        pass
+
+
+class IBatchPricingStrategy(ABC):
+    
+    @abstractmethod
+    def calculate_totals(self, columns: PricingColumns) -> List[Money]:
+        pass
+    
+    @abstractmethod
+    def get_engine(self) -> str:
+        pass
+
+
+class IPricingEngine(ABC):
+    
+    @abstractmethod
+    def calculate_total(self, items: List[OrderItem], customer: Customer, is_special: bool) -> Money:
+        pass
+    
+    @abstractmethod
+    def get_version(self) -> int:
+        pass
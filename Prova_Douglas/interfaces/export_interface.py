@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Sequence, Tuple
+
+# Coluna exportada: (nome, tipo), com tipo em 'int', 'float' ou 'str'
+ExportColumn = Tuple[str, str]
+
+
+class IExportWriter(ABC):
+    # Writer de exportação em streaming: recebe as linhas em lotes e grava
+    # direto no stream binário (que pode ser um arquivo gzip), sem montar
+    # o conteúdo inteiro em memória.
+    
+    @abstractmethod
+    def begin(self, stream: BinaryIO, columns: Sequence[ExportColumn]) -> None:
+        pass
+    
+    @abstractmethod
+    def write_chunk(self, rows: Sequence[tuple]) -> None:
+        pass
+    
+    @abstractmethod
+    def end(self) -> None:
+        pass
+    
+    @abstractmethod
+    def get_format(self) -> str:
+        pass
+    
+    @abstractmethod
+    def get_extension(self) -> str:
+        pass
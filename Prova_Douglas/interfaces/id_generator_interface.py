@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+
+class IIdGenerator(ABC):
+    
+    @abstractmethod
+    def next_id(self) -> int:
+        pass
+    
+    def close(self) -> None:
+        # Libera recursos (ex.: a concessão de worker_id); opcional
+        pass
+
+
+class IWorkerIdLease(ABC):
+    # Concessão de um worker_id exclusivo entre processos
+    
+    @abstractmethod
+    def acquire(self, owner: str, ttl_seconds: float) -> int:
+        pass
+    
+    @abstractmethod
+    def renew(self, worker_id: int, owner: str, ttl_seconds: float) -> bool:
+        pass
+    
+    @abstractmethod
+    def release(self, worker_id: int, owner: str) -> None:
+        pass
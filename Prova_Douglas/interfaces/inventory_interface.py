@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+
+class IInventoryRepository(ABC):
+    
+    @abstractmethod
+    def get_quantities(self, product_names: List[str]) -> Dict[str, int]:
+        pass
+    
+    @abstractmethod
+    def set_quantities(self, quantities: Dict[str, int]) -> None:
+        pass
+    
+    @abstractmethod
+    def reserve(self, reservation_id: str, quantities: Dict[str, int]) -> bool:
+        pass
+    
+    @abstractmethod
+    def commit(self, reservation_id: str, order_id: Optional[int] = None) -> bool:
+        pass
+    
+    @abstractmethod
+    def release(self, reservation_id: str) -> bool:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from models.order import Order
 from models.enums import OrderStatus
 
@@ -12,5 +13,19 @@ class INotificationStrategy(ABC):
     @abstractmethod
     def get_notification_method(self) -> str:
         pass
+    
+    def send_many(self, orders: List[Order], status: OrderStatus) -> int:
+        # Envio em lote; canais que aceitam submissões em massa sobrescrevem
+        # este método para agrupar as mensagens numa única chamada
+        return sum(1 for order in orders if self.send_notification(order, status))
 
 
+class INotificationService(ABC):
+    
+    @abstractmethod
+    def send_notification(self, order: Order, status: OrderStatus) -> None:
+        pass
+    
+    def send_many(self, orders: List[Order], status: OrderStatus) -> None:
+        for order in orders:
+            self.send_notification(order, status)
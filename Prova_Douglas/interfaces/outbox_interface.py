@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from models.order import Order
+from models.outbox_message import OutboxMessage
+from models.enums import OrderStatus
+
+
+class INotificationOutbox(ABC):
+    
+    @abstractmethod
+    def enqueue(self, order: Order, status: OrderStatus, channels: List[str]) -> None:
+        pass
+    
+    @abstractmethod
+    def claim_batch(self, limit: int, exclude_channels: Optional[List[str]] = None) -> List[OutboxMessage]:
+        pass
+    
+    @abstractmethod
+    def mark_sent(self, message_id: int) -> None:
+        pass
+    
+    @abstractmethod
+    def mark_failed(self, message_id: int, error: str, retry_at: Optional[float] = None) -> None:
+        pass
+    
+    @abstractmethod
+    def release_claimed(self, older_than: Optional[float] = None) -> int:
+        pass
+    
+    @abstractmethod
+    def count_by_state(self) -> Dict[str, int]:
+        pass
@@ -15,3 +15,18 @@ class IPaymentStrategy(ABC):
     @abstractmethod
     def requires_approval(self) -> bool:
         pass
+
+
+class IAsyncPaymentStrategy(ABC):
+    # Contraparte assíncrona: o gateway é aguardado sem ocupar uma thread
+    @abstractmethod
+    async def process_payment(self, order: Order, amount: float) -> bool:
+        pass
+    
+    @abstractmethod
+    def get_payment_method(self) -> PaymentMethod:
+        pass
+    
+    @abstractmethod
+    def requires_approval(self) -> bool:
+        pass
@@ -1,19 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Optional, List, Dict, Iterator, Tuple
 from models.order import Order
 from models.customer import Customer
+from models.customer_summary import CustomerSummary
+from models.daily_revenue import DailyRevenue
+from models.money import Money
 from models.enums import OrderStatus
 
 
+class DuplicateOrderError(Exception):
+    # Gravação recusada porque a chave de idempotência já pertence a um pedido
+    def __init__(self, idempotency_key: str, order_id: int):
+        super().__init__(f"Chave de idempotência {idempotency_key} já usada pelo pedido {order_id}.")
+        self.idempotency_key = idempotency_key
+        self.order_id = order_id
+
+
 class IOrderRepository(ABC):
     @abstractmethod
     def add(self, order: Order) -> int:
         pass
     
+    @abstractmethod
+    def add_many(self, orders: List[Order]) -> List[int]:
+        pass
+    
     @abstractmethod
     def get_by_id(self, order_id: int) -> Optional[Order]:
         pass
     
+    @abstractmethod
+    def find_ids_by_idempotency_keys(self, keys: List[str]) -> Dict[str, int]:
+        pass
+    
     @abstractmethod
     def update_status(self, order_id: int, status: OrderStatus) -> bool:
         pass
@@ -26,10 +46,69 @@ class IOrderRepository(ABC):
     def get_all(self) -> List[Order]:
         pass
     
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Order]:
+        pass
+    
+    @abstractmethod
+    def iter_order_rows(self, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        # Lotes de tuplas cruas (id, customer_name, customer_type, total_cents,
+        # status, created_at), sem hidratar objetos; usado pelas exportações
+        pass
+    
+    @abstractmethod
+    def iter_item_rows(self, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        # Lotes de (order_id, position, name, price_cents, quantity, item_type)
+        pass
+    
+    @abstractmethod
+    def get_id_shards(self, rows_per_shard: int) -> List[Tuple[int, int]]:
+        # Faixas [primeiro, último] de IDs com até rows_per_shard pedidos cada,
+        # na ordem dos IDs (os IDs podem ser esparsos, ex.: snowflake)
+        pass
+    
+    @abstractmethod
+    def get_database_path(self) -> Optional[str]:
+        # Arquivo que outros processos podem abrir somente leitura; None
+        # quando o armazenamento não é compartilhável (ex.: ':memory:')
+        pass
+    
+    @abstractmethod
+    def list_orders(
+        self,
+        status: Optional[OrderStatus] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        customer: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Order]:
+        pass
+    
     @abstractmethod
     def get_distinct_customers(self) -> List[Customer]:
         pass
     
     @abstractmethod
-    def calculate_customer_total(self, customer_name: str) -> float:
+    def calculate_customer_total(self, customer_name: str) -> Money:
+        pass
+    
+    @abstractmethod
+    def get_customer_totals(self) -> List[CustomerSummary]:
+        pass
+    
+    @abstractmethod
+    def get_status_counts(self) -> Dict[OrderStatus, int]:
+        pass
+    
+    @abstractmethod
+    def get_daily_revenue(self, since: Optional[date] = None, until: Optional[date] = None) -> List[DailyRevenue]:
+        pass
+    
+    @abstractmethod
+    def get_product_sales(self) -> List[Dict]:
+        pass
+    
+    @abstractmethod
+    def get_quantities_by_product(self, statuses: Optional[List[OrderStatus]] = None) -> Dict[str, int]:
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
 
 class IStockValidationStrategy(ABC):
@@ -15,5 +15,9 @@ class IStockValidationStrategy(ABC):
     @abstractmethod
     def get_stock_source(self) -> str:
         pass
+    
+    def get_available_quantities(self, product_names: Iterable[str]) -> Dict[str, int]:
+        # Consulta em lote; fontes remotas sobrescrevem para fazer uma única ida e volta
+        return {name: self.get_available_quantity(name) for name in product_names}
 
 
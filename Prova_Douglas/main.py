@@ -6,26 +6,29 @@ from models.customer import Customer
 from models.order_item import OrderItem
 from models.enums import OrderStatus, CustomerType, ItemType, PaymentMethod, ReportType
 from repositories.order_repository import OrderRepository
+from repositories.cached_order_repository import CachedOrderRepository
+from repositories.inventory_repository import InventoryRepository
+from repositories.id_lease_repository import WorkerIdLeaseRepository
 from services.order_service import OrderService
-from services.notification_service import NotificationService
+from services.notification_router import NotificationRouter
 from services.loyalty_service import LoyaltyService
-from services.inventory_service import InventoryService
+from services.inventory_service import InventoryService, DEFAULT_STOCK
 from services.report_service import ReportService
+from services.id_generator import SnowflakeIdGenerator
 from services.payment_service import PaymentService
 from interfaces.repository_interface import IOrderRepository
-from strategies.discount_strategy import ItemDiscountStrategy, VIPCustomerStrategy, NormalCustomerStrategy, SpecialOrderFeeStrategy
+from strategies.pricing_engine import PricingEngine
 from strategies.payment_strategy import CardPaymentStrategy, PIXPaymentStrategy, BoletoPaymentStrategy
+from strategies.notification_strategy import EmailNotificationStrategy, SMSNotificationStrategy
 from config.database import DatabaseManager
 from typing import Dict
 
 def main():
     
     # --- 1. Configuração da Injeção de Dependência ---
-    # Criando instâncias das strategies
-    item_discount_strategy = ItemDiscountStrategy()
-    normal_customer_strategy = NormalCustomerStrategy()
-    vip_customer_strategy = VIPCustomerStrategy()
-    special_fee_strategy = SpecialOrderFeeStrategy()
+    # Regras de preço compiladas numa tabela por tipo de cliente: o desconto
+    # VIP vem do customer_type, sem trocar strategy no meio da execução
+    pricing_engine = PricingEngine()
     
     # Criando strategies de pagamento
     card_payment_strategy = CardPaymentStrategy()
@@ -40,12 +43,28 @@ def main():
     }
     
     # Criando serviços
-    db_manager = DatabaseManager('loja.db')
-    order_repository = OrderRepository(db_manager)
-    notification_service = NotificationService()
+    # Conexão persistente por thread; o schema é criado uma vez na inicialização
+    db_manager = DatabaseManager('loja.db', persistent=True)
+    db_manager.initialize()
+    # Cache de leitura na frente do repositório (get_by_id repetido no fluxo de pagamento).
+    # Pagamento, status e relatórios só leem o cabeçalho: itens sob demanda
+    order_repository = CachedOrderRepository(OrderRepository(db_manager, lazy_items=True), database=db_manager)
+    # Email e SMS replicam as notificações originais; max_workers=1 mantém
+    # a ordem das mensagens no console da demonstração
+    notification_service = NotificationRouter(
+        [EmailNotificationStrategy(), SMSNotificationStrategy()],
+        max_workers=1
+    )
     loyalty_service = LoyaltyService()
-    inventory_service = InventoryService()
+    # Estoque persistente com reservas atômicas; a demonstração repõe o
+    # estoque inicial a cada execução, como o dicionário da prova original
+    inventory_repository = InventoryRepository(db_manager)
+    inventory_repository.set_quantities(DEFAULT_STOCK)
+    inventory_service = InventoryService(inventory_repository)
     report_service = ReportService(order_repository)
+    # IDs snowflake ordenados pelo tempo; o worker_id é concedido pelo banco,
+    # então processos simultâneos nunca geram o mesmo ID
+    id_generator = SnowflakeIdGenerator.from_lease(WorkerIdLeaseRepository(db_manager))
     
     # Criando OrderService com injeção de dependências
     order_service = OrderService(
@@ -53,9 +72,8 @@ def main():
         notification_service=notification_service,
         loyalty_service=loyalty_service,
         inventory_service=inventory_service,
-        discount_strategy=item_discount_strategy,
-        customer_discount_strategy=normal_customer_strategy,  # Será alterado para VIP quando necessário
-        special_fee_strategy=special_fee_strategy
+        pricing_engine=pricing_engine,
+        id_generator=id_generator
     )
     
     # Criando PaymentService
@@ -66,7 +84,21 @@ def main():
     )
 
     # --- 2. Exemplo de Uso (replicando exatamente o fluxo original) ---
-    
+    # Os recursos (concessão do worker_id, conexões) são liberados mesmo se a demonstração falhar
+    try:
+        run_demo(order_service, payment_service, inventory_service, report_service)
+    finally:
+        notification_service.close()
+        id_generator.close()
+        db_manager.close()
+
+
+def run_demo(
+    order_service: OrderService,
+    payment_service: PaymentService,
+    inventory_service: InventoryService,
+    report_service: ReportService
+):
     print("=== SISTEMA DE LOJA REFATORADO ===")
     
     # --- Pedido 1: Cliente Normal ---
@@ -111,9 +143,6 @@ def main():
         customer2 = Customer(name='Maria Santos', customer_type=CustomerType.VIP)
         
         try:
-            # Alterando strategy para VIP customer
-            order_service._customer_discount_strategy = vip_customer_strategy
-            
             id2 = order_service.create_order(customer2, items2, is_special=False)
             
             payment_service.process_payment(id2, PaymentMethod.PIX, 160.0)
@@ -131,7 +160,6 @@ def main():
     print()
     
     report_service.generate_report(ReportType.CLIENTS)
-    
 
 
 if __name__ == '__main__':
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from .enums import CustomerType
 
-@dataclass
+# Imutável: o repositório reutiliza a mesma instância para todos os
+# pedidos de um cliente (ver intern_customer)
+@dataclass(frozen=True, slots=True)
 class Customer:
     name: str
     customer_type: CustomerType
\ No newline at end of file
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from .customer import Customer
+from .money import Money
+
+@dataclass
+class CustomerSummary:
+    customer: Customer
+    total_spent: Money
+    order_count: int
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from .money import Money
+
+@dataclass
+class DailyRevenue:
+    day: str  # 'AAAA-MM-DD', mesmo prefixo de created_at
+    total: Money
+    order_count: int
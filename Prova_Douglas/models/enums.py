@@ -24,4 +24,5 @@ class ItemType(Enum):
 
 class ReportType(Enum):
     SALES = 'vendas'
-    CLIENTS = 'clientes'
\ No newline at end of file
+    CLIENTS = 'clientes'
+    DAILY = 'diario'
\ No newline at end of file
@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+from typing import Callable, List, Optional
+from .order_item import OrderItem
+
+
+class LazyOrderItems(Sequence):
+    """
+    Itens de um pedido carregados só no primeiro acesso.
+    Usado pelo OrderRepository em modo lazy_items: pagamento, mudança de
+    status e relatório de vendas só leem o cabeçalho do pedido.
+    """
+
+    __slots__ = ('_loader', '_items')
+
+    def __init__(self, loader: Callable[[], List[OrderItem]]):
+        self._loader = loader
+        self._items: Optional[List[OrderItem]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._items is not None
+
+    def _load(self) -> List[OrderItem]:
+        if self._items is None:
+            self._items = self._loader()
+            self._loader = None
+        return self._items
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __eq__(self, other):
+        if isinstance(other, (LazyOrderItems, list)):
+            return self._load() == list(other)
+        return NotImplemented
+
+    def __reduce__(self):
+        # Ao serializar (ex.: envio para outro processo) vira uma lista comum;
+        # o loader depende da conexão local e não atravessa processos
+        return (list, (self._load(),))
+
+    def __repr__(self):
+        if self._items is None:
+            return "LazyOrderItems(<não carregado>)"
+        return f"LazyOrderItems({self._items!r})"
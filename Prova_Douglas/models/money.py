@@ -0,0 +1,165 @@
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Tuple, Union
+
+Number = Union[int, float, Decimal]
+
+CENT = Decimal('0.01')
+
+
+@lru_cache(maxsize=256)
+def to_ratio(factor: Number) -> Tuple[int, int]:
+    # Fator decimal como fração exata de inteiros; floats são lidos pela sua
+    # representação decimal (0.9 -> 9/10, e não a aproximação binária)
+    if isinstance(factor, int):
+        return factor, 1
+    if isinstance(factor, float):
+        factor = Decimal(repr(factor))
+    return factor.as_integer_ratio()
+
+
+def round_ratio(numerator: int, denominator: int) -> int:
+    # numerator / denominator arredondado para o inteiro mais próximo,
+    # com empates afastando-se do zero (ROUND_HALF_UP)
+    sign = -1 if (numerator < 0) != (denominator < 0) else 1
+    numerator, denominator = abs(numerator), abs(denominator)
+    return sign * ((2 * numerator + denominator) // (2 * denominator))
+
+
+def _exact_cents(value) -> Union[int, Decimal, None]:
+    # Valor em centavos, sem arredondar, para comparar com Money: 99.996
+    # não é igual a 100.00. Floats entram pelo valor binário exato, como o
+    # Python compara int, float e Decimal: assim Money(10) != 0.1 e
+    # Money(50) == 0.5, sempre de acordo com o hash. Para tratar um float
+    # como valor em reais, converta antes com Money.of.
+    # None para NaN (nunca igual nem ordenado).
+    if isinstance(value, Money):
+        return value._cents
+    if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+        return NotImplemented
+    if isinstance(value, int):
+        return value * 100
+    if isinstance(value, float):
+        value = Decimal(value)
+    if value.is_nan():
+        return None
+    return value.scaleb(2)
+
+
+class Money:
+    """Valor monetário em centavos inteiros (ponto fixo, sem erro de float)."""
+
+    __slots__ = ('_cents',)
+
+    def __init__(self, cents: int = 0):
+        if not isinstance(cents, int):
+            raise TypeError(f"Money espera centavos inteiros, recebeu {type(cents).__name__}")
+        self._cents = cents
+
+    @classmethod
+    def of(cls, value: Union['Money', Number, str]) -> 'Money':
+        # Converte um valor em reais (int, float, Decimal ou str) para centavos
+        if isinstance(value, Money):
+            return value
+        if isinstance(value, int):
+            return cls(value * 100)
+        if isinstance(value, float):
+            value = repr(value)
+        cents = (Decimal(value) / CENT).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+        return cls(int(cents))
+
+    @property
+    def cents(self) -> int:
+        return self._cents
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self._cents).scaleb(-2)
+
+    def __add__(self, other):
+        if isinstance(other, Money):
+            return Money(self._cents + other._cents)
+        if isinstance(other, (int, float, Decimal)):
+            return Money(self._cents + Money.of(other)._cents)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            return Money(self._cents - other._cents)
+        if isinstance(other, (int, float, Decimal)):
+            return Money(self._cents - Money.of(other)._cents)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, (int, float, Decimal)):
+            return Money(Money.of(other)._cents - self._cents)
+        return NotImplemented
+
+    def __mul__(self, factor):
+        # Multiplicação por quantidade (exata) ou por fator (arredondada ao centavo)
+        if type(factor) is int:
+            return Money(self._cents * factor)
+        if isinstance(factor, bool) or not isinstance(factor, (int, float, Decimal)):
+            return NotImplemented
+        numerator, denominator = to_ratio(factor)
+        return Money(round_ratio(self._cents * numerator, denominator))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money(-self._cents)
+
+    def __eq__(self, other):
+        other_cents = _exact_cents(other)
+        if other_cents is NotImplemented:
+            return NotImplemented
+        return other_cents is not None and self._cents == other_cents
+
+    def __lt__(self, other):
+        other_cents = _exact_cents(other)
+        if other_cents is NotImplemented:
+            return NotImplemented
+        return other_cents is not None and self._cents < other_cents
+
+    def __le__(self, other):
+        other_cents = _exact_cents(other)
+        if other_cents is NotImplemented:
+            return NotImplemented
+        return other_cents is not None and self._cents <= other_cents
+
+    def __gt__(self, other):
+        other_cents = _exact_cents(other)
+        if other_cents is NotImplemented:
+            return NotImplemented
+        return other_cents is not None and self._cents > other_cents
+
+    def __ge__(self, other):
+        other_cents = _exact_cents(other)
+        if other_cents is NotImplemented:
+            return NotImplemented
+        return other_cents is not None and self._cents >= other_cents
+
+    def __hash__(self):
+        # Igual ao hash do mesmo valor em reais como int, float ou Decimal
+        # (Money(100) == 1 e hash(Money(100)) == hash(1))
+        return hash(self.to_decimal())
+
+    def __bool__(self):
+        return self._cents != 0
+
+    def __float__(self):
+        return self._cents / 100
+
+    def __int__(self):
+        # Parte inteira em reais, como int() de um float
+        return int(self.to_decimal())
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.to_decimal(), format_spec)
+
+    def __str__(self):
+        return f"{self.to_decimal():.2f}"
+
+    def __repr__(self):
+        return f"Money('{self}')"
@@ -1,16 +1,21 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Optional, Sequence
 from .customer import Customer
 from .order_item import OrderItem
 from .enums import OrderStatus
+from .money import Money
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     customer: Customer
-    items: List[OrderItem]
+    items: Sequence[OrderItem]
     id: int = None
-    total_price: float = 0.0
+    total_price: Money = Money(0)
     status: OrderStatus = OrderStatus.PENDING
     created_at: str = field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-    is_special: bool = False
\ No newline at end of file
+    is_special: bool = False
+    idempotency_key: Optional[str] = None
+
+    def __post_init__(self):
+        self.total_price = Money.of(self.total_price)
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 from .enums import ItemType
+from .money import Money
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     name: str
-    price: float
+    price: Money
     quantity: int
-    item_type: ItemType
\ No newline at end of file
+    item_type: ItemType
+
+    def __post_init__(self):
+        # Aceita o preço em reais (int/float/Decimal) e guarda em centavos
+        self.price = Money.of(self.price)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+from .customer import Customer
+from .order_item import OrderItem
+from .enums import OrderStatus, PaymentMethod
+from .money import Money
+
+@dataclass
+class OrderRequest:
+    customer: Customer
+    items: List[OrderItem]
+    is_special: bool = False
+    # Usados pelo pipeline: pagamento após a criação e mudanças de status seguintes
+    payment_method: Optional[PaymentMethod] = None
+    amount_paid: Optional[Union[Money, float]] = None
+    status_updates: List[OrderStatus] = field(default_factory=list)
+    # Repetições com a mesma chave devolvem o pedido já criado
+    idempotency_key: Optional[str] = None
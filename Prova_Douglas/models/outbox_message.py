@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from .customer import Customer
+from .enums import OrderStatus
+
+@dataclass
+class OutboxMessage:
+    id: int
+    order_id: int
+    status: OrderStatus
+    channel: str
+    customer: Customer
+    is_special: bool
+    attempts: int = 0
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+from .order_request import OrderRequest
+
+@dataclass
+class PipelineResult:
+    request: OrderRequest
+    order_id: Optional[int] = None
+    paid: bool = False
+    error: Optional[str] = None
+    # Etapa em que o processamento parou, quando houve erro
+    failed_stage: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import List
+from .enums import CustomerType, ItemType
+from .order_request import OrderRequest
+
+# Códigos inteiros usados nas colunas; a posição na lista é o código
+ITEM_TYPE_CODES = list(ItemType)
+CUSTOMER_TYPE_CODES = list(CustomerType)
+
+
+@dataclass
+class PricingColumns:
+    # Uma posição por item (linha) de todos os pedidos do lote
+    order_index: List[int]
+    price_cents: List[int]
+    quantities: List[int]
+    item_type_codes: List[int]
+    # Uma posição por pedido
+    customer_type_codes: List[int]
+    is_special: List[bool]
+
+    @property
+    def order_count(self) -> int:
+        return len(self.customer_type_codes)
+
+    @classmethod
+    def from_requests(cls, requests: List[OrderRequest]) -> 'PricingColumns':
+        item_codes = {item_type: code for code, item_type in enumerate(ITEM_TYPE_CODES)}
+        customer_codes = {customer_type: code for code, customer_type in enumerate(CUSTOMER_TYPE_CODES)}
+
+        columns = cls([], [], [], [], [], [])
+        for index, request in enumerate(requests):
+            columns.customer_type_codes.append(customer_codes[request.customer.customer_type])
+            columns.is_special.append(request.is_special)
+            for item in request.items:
+                columns.order_index.append(index)
+                columns.price_cents.append(item.price.cents)
+                columns.quantities.append(item.quantity)
+                columns.item_type_codes.append(item_codes[item.item_type])
+        return columns
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Mapping
+from .enums import CustomerType, ItemType
+
+
+@dataclass(frozen=True)
+class PricingRules:
+    # Fatores de preço na forma declarativa (ex.: lidos de um JSON).
+    # Tipos de cliente ausentes não têm desconto (fator 1).
+    item_factors: Mapping[ItemType, Decimal]
+    customer_factors: Mapping[CustomerType, Decimal]
+    special_fee_factor: Decimal
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> 'PricingRules':
+        # Formato: {"item_factors": {"desc10": "0.9", ...},
+        #           "customer_factors": {"vip": "0.95"},
+        #           "special_fee_factor": "1.15"}
+        item_factors = {
+            ItemType(name): _parse_factor(value, f"item_factors.{name}")
+            for name, value in _section(data, 'item_factors').items()
+        }
+        missing = [item_type.value for item_type in ItemType if item_type not in item_factors]
+        if missing:
+            raise ValueError(f"Fator ausente para os tipos de item: {', '.join(missing)}")
+
+        customer_factors = {
+            CustomerType(name): _parse_factor(value, f"customer_factors.{name}")
+            for name, value in _section(data, 'customer_factors', required=False).items()
+        }
+        if 'special_fee_factor' not in data:
+            raise ValueError("Regra de preço sem special_fee_factor.")
+        return cls(item_factors, customer_factors, _parse_factor(data['special_fee_factor'], 'special_fee_factor'))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'item_factors': {item_type.value: str(factor) for item_type, factor in self.item_factors.items()},
+            'customer_factors': {customer_type.value: str(factor) for customer_type, factor in self.customer_factors.items()},
+            'special_fee_factor': str(self.special_fee_factor)
+        }
+
+
+def _section(data: Mapping[str, object], name: str, required: bool = True) -> Mapping[str, object]:
+    section = data.get(name)
+    if section is None and not required:
+        return {}
+    if not isinstance(section, Mapping):
+        raise ValueError(f"Regra de preço sem a seção {name}.")
+    return section
+
+
+def _parse_factor(value: object, name: str) -> Decimal:
+    # Strings ou números; floats passam pela representação decimal
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"Fator inválido em {name}: {value!r}")
+    try:
+        factor = Decimal(repr(value) if isinstance(value, float) else value)
+    except InvalidOperation:
+        raise ValueError(f"Fator inválido em {name}: {value!r}")
+    if not factor.is_finite() or factor < 0:
+        raise ValueError(f"Fator inválido em {name}: {value!r}")
+    return factor
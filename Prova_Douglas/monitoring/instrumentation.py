@@ -0,0 +1,180 @@
+# monitoring/instrumentation.py
+#
+# Instrumentação opcional dos caminhos quentes (repositório, serviços e
+# strategies). Desligada por padrão: timed() e span() só testam uma flag e
+# chamam o código original. Ligada, cada medição entra num histograma de
+# buckets fixos (memória constante, sem guardar amostras).
+#
+# Liga com enable() ou com a variável de ambiente LOJA_INSTRUMENTATION=1.
+
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, TextIO, TypeVar, Union
+
+F = TypeVar('F', bound=Callable)
+
+# Limites superiores dos buckets em microssegundos (escala 1-2-5)
+BUCKET_BOUNDS_US = [
+    1, 2, 5, 10, 20, 50, 100, 200, 500,
+    1_000, 2_000, 5_000, 10_000, 20_000, 50_000,
+    100_000, 200_000, 500_000, 1_000_000, 2_000_000, 5_000_000
+]
+
+
+class Histogram:
+    # Contagem por bucket de latência; os percentis são estimados pelo
+    # limite superior do bucket que contém a posição pedida
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        # Um bucket extra para valores acima do último limite
+        self.buckets = [0] * (len(BUCKET_BOUNDS_US) + 1)
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_US, seconds * 1_000_000)] += 1
+
+    def percentile(self, p: float) -> float:
+        # Em segundos; o último bucket (sem limite) usa o máximo observado
+        if not self.count:
+            return 0.0
+        target = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                if index < len(BUCKET_BOUNDS_US):
+                    return min(BUCKET_BOUNDS_US[index] / 1_000_000, self.max)
+                return self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'min_ms': self.min * 1000 if self.count else 0.0,
+            'max_ms': self.max * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'buckets_us': {
+                (str(bound) if index < len(BUCKET_BOUNDS_US) else 'inf'): bucket_count
+                for index, (bound, bucket_count) in enumerate(zip(BUCKET_BOUNDS_US + [None], self.buckets))
+                if bucket_count
+            }
+        }
+
+
+class _Registry:
+    def __init__(self):
+        self.enabled = os.environ.get('LOJA_INSTRUMENTATION', '') not in ('', '0')
+        self.histograms: Dict[str, Histogram] = {}
+        self.lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(seconds)
+
+
+_registry = _Registry()
+
+
+class _Span:
+    __slots__ = ('_name', '_start')
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _registry.record(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable():
+    _registry.enabled = True
+
+
+def disable():
+    _registry.enabled = False
+
+
+def is_enabled() -> bool:
+    return _registry.enabled
+
+
+def span(name: str):
+    # Context manager de medição; desligado, devolve um contexto vazio compartilhado
+    if not _registry.enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    # Decorator de medição; desligado, custa só o teste da flag
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _registry.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    with _registry.lock:
+        return {name: histogram.to_dict() for name, histogram in sorted(_registry.histograms.items())}
+
+
+def dump(target: Optional[Union[str, TextIO]] = None) -> str:
+    # Serializa o snapshot em JSON; grava em arquivo (caminho ou objeto) se informado
+    content = json.dumps(snapshot(), indent=2)
+    if isinstance(target, str):
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(content)
+    elif target is not None:
+        target.write(content)
+    return content
+
+
+def reset():
+    with _registry.lock:
+        _registry.histograms = {}
@@ -0,0 +1,103 @@
+# monitoring/metrics.py
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+
+def nearest_rank(sorted_samples: List[float], p: float) -> float:
+    # Percentil pelo método nearest-rank (p entre 0 e 100)
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class LatencyStats:
+    # Amostras de latência (em segundos) de uma etapa, seguras entre threads.
+    # Guarda todas as amostras para percentis exatos; para execuções muito
+    # longas use reset() entre janelas de medição.
+    
+    def __init__(self):
+        self._samples: List[float] = []
+        self._total = 0.0
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            self._total += seconds
+    
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+    
+    def percentile(self, p: float) -> float:
+        with self._lock:
+            samples = sorted(self._samples)
+        return nearest_rank(samples, p)
+    
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            samples = sorted(self._samples)
+            total = self._total
+        if not samples:
+            return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'count': len(samples),
+            'mean_ms': total / len(samples) * 1000,
+            'p50_ms': nearest_rank(samples, 50) * 1000,
+            'p95_ms': nearest_rank(samples, 95) * 1000,
+            'p99_ms': nearest_rank(samples, 99) * 1000,
+            'max_ms': samples[-1] * 1000
+        }
+    
+    def reset(self):
+        with self._lock:
+            self._samples = []
+            self._total = 0.0
+
+
+class StageMetrics:
+    # Latências por etapa (create, payment, ...) e contadores nomeados
+    
+    def __init__(self):
+        self._stages: Dict[str, LatencyStats] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def stage(self, name: str) -> LatencyStats:
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = LatencyStats()
+            return stats
+    
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        # Mede o bloco mesmo quando ele termina com exceção
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage(name).record(time.perf_counter() - start)
+    
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            stages = dict(self._stages)
+            counters = dict(self._counters)
+        return {
+            'stages': {name: stats.summary() for name, stats in stages.items()},
+            'counters': counters
+        }
+    
+    def reset(self):
+        with self._lock:
+            self._stages = {}
+            self._counters = {}
@@ -0,0 +1,196 @@
+# projeto/repositories/cached_order_repository.py
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from config.database import DatabaseManager
+from interfaces.repository_interface import IOrderRepository
+from models.order import Order
+from models.customer import Customer
+from models.customer_summary import CustomerSummary
+from models.daily_revenue import DailyRevenue
+from models.money import Money
+from models.enums import OrderStatus
+
+# O mapa de gerações guarda até max_size * este fator pedidos invalidados
+GENERATION_LIMIT_FACTOR = 4
+
+
+class CachedOrderRepository(IOrderRepository):
+    """
+    Decorator de IOrderRepository com cache de leitura para get_by_id.
+    Política LRU com expiração por tempo (TTL); escritas vão direto para o
+    repositório decorado e invalidam/atualizam a entrada correspondente.
+    Os pedidos em cache são compartilhados entre chamadas e não devem ser
+    alterados pelos chamadores.
+
+    Cada invalidação incrementa a geração do pedido; uma leitura do banco
+    só entra no cache se a geração não mudou durante a leitura, para que um
+    update_status concorrente não seja sobrescrito pelo pedido antigo.
+
+    Com database, um update_status feito dentro de uma transação ainda
+    aberta só libera o pedido para o cache quando ela termina: até lá as
+    outras conexões leem a linha antiga, e ela não pode entrar no cache.
+    """
+
+    def __init__(
+        self,
+        repository: IOrderRepository,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = 60.0,
+        database: Optional[DatabaseManager] = None
+    ):
+        self._repository = repository
+        self._database = database
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries = OrderedDict()  # order_id -> (pedido, instante de expiração)
+        self._lock = threading.Lock()
+        # order_id -> geração; ao passar do limite o mapa é zerado e a época
+        # muda, descartando as leituras em andamento
+        self._generations: Dict[int, int] = {}
+        self._epoch = 0
+        # order_id -> gravações ainda não confirmadas; não entram no cache
+        self._pending_writes: Dict[int, int] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+    def add(self, order: Order) -> int:
+        # Não guarda o pedido recebido: ele compartilha a lista de itens do
+        # chamador e a gravação pode ainda ser desfeita pela transação externa.
+        # A primeira leitura carrega o pedido como o banco o devolve.
+        return self._repository.add(order)
+
+    def add_many(self, orders: List[Order]) -> List[int]:
+        return self._repository.add_many(orders)
+
+    def get_by_id(self, order_id: int) -> Optional[Order]:
+        with self._lock:
+            entry = self._entries.get(order_id)
+            if entry is not None:
+                order, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(order_id)
+                    self._stats['hits'] += 1
+                    return order
+                del self._entries[order_id]
+                self._stats['expirations'] += 1
+            self._stats['misses'] += 1
+            generation = (self._epoch, self._generations.get(order_id, 0))
+
+        order = self._repository.get_by_id(order_id)
+        if order is not None:
+            self._store(order_id, order, generation)
+        return order
+
+    def find_ids_by_idempotency_keys(self, keys: List[str]) -> Dict[str, int]:
+        return self._repository.find_ids_by_idempotency_keys(keys)
+
+    def update_status(self, order_id: int, status: OrderStatus) -> bool:
+        with self._lock:
+            self._pending_writes[order_id] = self._pending_writes.get(order_id, 0) + 1
+        try:
+            return self._repository.update_status(order_id, status)
+        finally:
+            self.invalidate(order_id)
+            # Invalida de novo quando a gravação ficar visível (ou for desfeita)
+            if self._database is not None:
+                self._database.after_transaction(lambda: self._finish_write(order_id))
+            else:
+                self._finish_write(order_id)
+
+    def get_all_by_customer(self, customer_name: str) -> List[Order]:
+        return self._repository.get_all_by_customer(customer_name)
+
+    def get_all(self) -> List[Order]:
+        return self._repository.get_all()
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Order]:
+        return self._repository.iter_all(batch_size)
+
+    def iter_order_rows(self, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        return self._repository.iter_order_rows(batch_size)
+
+    def iter_item_rows(self, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        return self._repository.iter_item_rows(batch_size)
+
+    def get_id_shards(self, rows_per_shard: int) -> List[Tuple[int, int]]:
+        return self._repository.get_id_shards(rows_per_shard)
+
+    def get_database_path(self) -> Optional[str]:
+        return self._repository.get_database_path()
+
+    def list_orders(
+        self,
+        status: Optional[OrderStatus] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        customer: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Order]:
+        return self._repository.list_orders(status, since, until, customer, after_id, limit)
+
+    def get_distinct_customers(self) -> List[Customer]:
+        return self._repository.get_distinct_customers()
+
+    def calculate_customer_total(self, customer_name: str) -> Money:
+        return self._repository.calculate_customer_total(customer_name)
+
+    def get_customer_totals(self) -> List[CustomerSummary]:
+        return self._repository.get_customer_totals()
+
+    def get_status_counts(self) -> Dict[OrderStatus, int]:
+        return self._repository.get_status_counts()
+
+    def get_daily_revenue(self, since: Optional[date] = None, until: Optional[date] = None) -> List[DailyRevenue]:
+        return self._repository.get_daily_revenue(since, until)
+
+    def get_product_sales(self) -> List[Dict]:
+        return self._repository.get_product_sales()
+
+    def get_quantities_by_product(self, statuses: Optional[List[OrderStatus]] = None) -> Dict[str, int]:
+        return self._repository.get_quantities_by_product(statuses)
+
+    def invalidate(self, order_id: int):
+        with self._lock:
+            if len(self._generations) >= self._max_size * GENERATION_LIMIT_FACTOR:
+                self._generations.clear()
+                self._epoch += 1
+            self._generations[order_id] = self._generations.get(order_id, 0) + 1
+            if self._entries.pop(order_id, None) is not None:
+                self._stats['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            return stats
+
+    def _finish_write(self, order_id: int):
+        with self._lock:
+            remaining = self._pending_writes.pop(order_id) - 1
+            if remaining:
+                self._pending_writes[order_id] = remaining
+        self.invalidate(order_id)
+
+    def _store(self, order_id: int, order: Order, generation: Tuple[int, int]):
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            # Invalidado durante a leitura, ou com gravação ainda não
+            # confirmada: o pedido lido pode estar desatualizado
+            if order_id in self._pending_writes:
+                return
+            if generation != (self._epoch, self._generations.get(order_id, 0)):
+                return
+            self._entries[order_id] = (order, expires_at)
+            self._entries.move_to_end(order_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
@@ -0,0 +1,46 @@
+# projeto/repositories/id_lease_repository.py
+import time
+from interfaces.id_generator_interface import IWorkerIdLease
+from config.database import DatabaseManager
+
+# 10 bits de worker_id no ID snowflake
+MAX_WORKER_IDS = 1024
+
+
+class WorkerIdLeaseRepository(IWorkerIdLease):
+    # Concessões de worker_id em SQLite. A escolha roda sob BEGIN IMMEDIATE,
+    # então dois processos nunca recebem o mesmo ID; concessões vencidas
+    # (processo que morreu sem liberar) voltam a ficar disponíveis.
+
+    def __init__(self, db_manager: DatabaseManager):
+        self._db_manager = db_manager
+
+    def acquire(self, owner: str, ttl_seconds: float) -> int:
+        with self._db_manager as cursor:
+            if not cursor.connection.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            cursor.execute("DELETE FROM id_worker_leases WHERE expires_at < ?", (now,))
+            cursor.execute("SELECT worker_id FROM id_worker_leases")
+            leased = {row[0] for row in cursor.fetchall()}
+            worker_id = next((i for i in range(MAX_WORKER_IDS) if i not in leased), None)
+            if worker_id is None:
+                raise RuntimeError("Todos os worker_id do gerador de IDs estão em uso.")
+            cursor.execute(
+                "INSERT INTO id_worker_leases (worker_id, owner, expires_at) VALUES (?, ?, ?)",
+                (worker_id, owner, now + ttl_seconds)
+            )
+            return worker_id
+
+    def renew(self, worker_id: int, owner: str, ttl_seconds: float) -> bool:
+        # Só renova se a concessão ainda for deste dono
+        with self._db_manager as cursor:
+            cursor.execute(
+                "UPDATE id_worker_leases SET expires_at=? WHERE worker_id=? AND owner=?",
+                (time.time() + ttl_seconds, worker_id, owner)
+            )
+            return cursor.rowcount > 0
+
+    def release(self, worker_id: int, owner: str) -> None:
+        with self._db_manager as cursor:
+            cursor.execute("DELETE FROM id_worker_leases WHERE worker_id=? AND owner=?", (worker_id, owner))
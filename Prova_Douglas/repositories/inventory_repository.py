@@ -0,0 +1,142 @@
+# projeto/repositories/inventory_repository.py
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from interfaces.inventory_interface import IInventoryRepository
+from config.database import DatabaseManager
+
+# Limite de parâmetros por consulta IN (...), abaixo do limite do SQLite
+QUERY_CHUNK_SIZE = 500
+
+
+def _validate_quantities(quantities: Dict[str, int]):
+    # Uma quantidade não positiva somaria ao estoque em vez de dar baixa
+    for product_name, quantity in quantities.items():
+        if quantity <= 0:
+            raise ValueError(f"Quantidade inválida para {product_name}: {quantity}")
+
+
+class InventoryRepository(IInventoryRepository):
+    # Estoque em SQLite. A baixa usa UPDATE condicional (quantity >= ?), então
+    # duas reservas concorrentes nunca deixam o estoque negativo.
+
+    def __init__(self, db_manager: DatabaseManager):
+        self._db_manager = db_manager
+
+    def get_quantities(self, product_names: List[str]) -> Dict[str, int]:
+        names = list(dict.fromkeys(product_names))
+        quantities = {}
+        with self._db_manager as cursor:
+            for start in range(0, len(names), QUERY_CHUNK_SIZE):
+                chunk = names[start:start + QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"SELECT product_name, quantity FROM inventory WHERE product_name IN ({placeholders})",
+                    chunk
+                )
+                quantities.update(cursor.fetchall())
+        return quantities
+
+    def set_quantities(self, quantities: Dict[str, int]) -> None:
+        with self._db_manager as cursor:
+            cursor.executemany(
+                "INSERT INTO inventory (product_name, quantity) VALUES (?, ?) "
+                "ON CONFLICT(product_name) DO UPDATE SET quantity=excluded.quantity",
+                list(quantities.items())
+            )
+
+    def reserve(self, reservation_id: str, quantities: Dict[str, int]) -> bool:
+        # Tudo ou nada: se algum produto não tiver saldo, o savepoint desfaz
+        # as baixas já feitas sem afetar uma transação externa em andamento
+        _validate_quantities(quantities)
+        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._db_manager as cursor:
+            if not cursor.connection.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SAVEPOINT stock_reservation")
+            # Ordem fixa de produtos para que as travas sejam pegas sempre na mesma ordem
+            for product_name, quantity in sorted(quantities.items()):
+                cursor.execute(
+                    "UPDATE inventory SET quantity = quantity - ? WHERE product_name=? AND quantity >= ?",
+                    (quantity, product_name, quantity)
+                )
+                if cursor.rowcount == 0:
+                    cursor.execute("ROLLBACK TO stock_reservation")
+                    cursor.execute("RELEASE stock_reservation")
+                    return False
+
+            cursor.executemany(
+                "INSERT INTO stock_reservations (reservation_id, product_name, quantity, state, created_at) VALUES (?, ?, ?, 'reserved', ?)",
+                [(reservation_id, product_name, quantity, created_at) for product_name, quantity in quantities.items()]
+            )
+            cursor.execute("RELEASE stock_reservation")
+            return True
+
+    def commit(self, reservation_id: str, order_id: Optional[int] = None) -> bool:
+        with self._db_manager as cursor:
+            cursor.execute(
+                "UPDATE stock_reservations SET state='committed', order_id=? WHERE reservation_id=? AND state='reserved'",
+                (order_id, reservation_id)
+            )
+            return cursor.rowcount > 0
+
+    def release(self, reservation_id: str) -> bool:
+        # Devolve ao estoque as quantidades de uma reserva ainda não confirmada
+        with self._db_manager as cursor:
+            if not cursor.connection.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "SELECT product_name, quantity FROM stock_reservations WHERE reservation_id=? AND state='reserved'",
+                (reservation_id,)
+            )
+            rows = cursor.fetchall()
+            cursor.executemany(
+                "UPDATE inventory SET quantity = quantity + ? WHERE product_name=?",
+                [(quantity, product_name) for product_name, quantity in rows]
+            )
+            cursor.execute(
+                "UPDATE stock_reservations SET state='released' WHERE reservation_id=? AND state='reserved'",
+                (reservation_id,)
+            )
+            return bool(rows)
+
+
+class InMemoryInventoryRepository(IInventoryRepository):
+    # Estoque em memória protegido por trava, com a mesma semântica de reserva
+
+    def __init__(self, quantities: Optional[Dict[str, int]] = None):
+        self._stock = dict(quantities or {})
+        self._reservations = {}  # reservation_id -> {produto: quantidade}
+        self._lock = threading.Lock()
+
+    def get_quantities(self, product_names: List[str]) -> Dict[str, int]:
+        with self._lock:
+            return {name: self._stock[name] for name in product_names if name in self._stock}
+
+    def set_quantities(self, quantities: Dict[str, int]) -> None:
+        with self._lock:
+            self._stock.update(quantities)
+
+    def reserve(self, reservation_id: str, quantities: Dict[str, int]) -> bool:
+        _validate_quantities(quantities)
+        with self._lock:
+            for product_name, quantity in quantities.items():
+                if self._stock.get(product_name, 0) < quantity:
+                    return False
+            for product_name, quantity in quantities.items():
+                self._stock[product_name] -= quantity
+            self._reservations[reservation_id] = dict(quantities)
+            return True
+
+    def commit(self, reservation_id: str, order_id: Optional[int] = None) -> bool:
+        with self._lock:
+            return self._reservations.pop(reservation_id, None) is not None
+
+    def release(self, reservation_id: str) -> bool:
+        with self._lock:
+            quantities = self._reservations.pop(reservation_id, None)
+            if quantities is None:
+                return False
+            for product_name, quantity in quantities.items():
+                self._stock[product_name] += quantity
+            return True
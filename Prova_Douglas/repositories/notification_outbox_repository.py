@@ -0,0 +1,106 @@
+# projeto/repositories/notification_outbox_repository.py
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from interfaces.outbox_interface import INotificationOutbox
+from models.customer import Customer
+from models.order import Order
+from models.outbox_message import OutboxMessage
+from models.enums import CustomerType, OrderStatus
+from config.database import DatabaseManager
+
+
+class NotificationOutboxRepository(INotificationOutbox):
+    def __init__(self, db_manager: DatabaseManager):
+        self._db_manager = db_manager
+
+    def enqueue(self, order: Order, status: OrderStatus, channels: List[str]) -> None:
+        # Dentro de um contexto já aberto (unit of work) a gravação entra na
+        # mesma transação do pedido
+        now = time.time()
+        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._db_manager as cursor:
+            cursor.executemany(
+                "INSERT INTO notification_outbox (order_id, status, channel, customer_name, customer_type, is_special, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (order.id, status.value, channel, order.customer.name, order.customer.customer_type.value,
+                     int(order.is_special), now, created_at)
+                    for channel in channels
+                ]
+            )
+
+    def claim_batch(self, limit: int, exclude_channels: Optional[List[str]] = None) -> List[OutboxMessage]:
+        # Seleciona e marca como 'processing' sob trava de escrita, para que
+        # dois workers nunca peguem a mesma mensagem. exclude_channels deixa
+        # de fora canais que já estão com envios demais em andamento.
+        exclude_channels = list(exclude_channels or [])
+        channel_filter = ""
+        if exclude_channels:
+            channel_filter = f" AND channel NOT IN ({', '.join('?' for _ in exclude_channels)})"
+        with self._db_manager as cursor:
+            if not cursor.connection.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "SELECT id, order_id, status, channel, customer_name, customer_type, is_special, attempts "
+                f"FROM notification_outbox WHERE state='pending' AND next_attempt_at<=?{channel_filter} ORDER BY id LIMIT ?",
+                (time.time(), *exclude_channels, limit)
+            )
+            rows = cursor.fetchall()
+            claimed_at = time.time()
+            cursor.executemany(
+                "UPDATE notification_outbox SET state='processing', claimed_at=? WHERE id=?",
+                [(claimed_at, row[0]) for row in rows]
+            )
+            return [
+                OutboxMessage(
+                    id=row[0],
+                    order_id=row[1],
+                    status=OrderStatus(row[2]),
+                    channel=row[3],
+                    customer=Customer(name=row[4], customer_type=CustomerType(row[5])),
+                    is_special=bool(row[6]),
+                    attempts=row[7]
+                )
+                for row in rows
+            ]
+
+    def mark_sent(self, message_id: int) -> None:
+        with self._db_manager as cursor:
+            cursor.execute(
+                "UPDATE notification_outbox SET state='sent', attempts=attempts+1, last_error=NULL WHERE id=?",
+                (message_id,)
+            )
+
+    def mark_failed(self, message_id: int, error: str, retry_at: Optional[float] = None) -> None:
+        # Com retry_at a mensagem volta para a fila; sem ele falha em definitivo
+        with self._db_manager as cursor:
+            if retry_at is None:
+                cursor.execute(
+                    "UPDATE notification_outbox SET state='failed', attempts=attempts+1, last_error=? WHERE id=?",
+                    (error, message_id)
+                )
+            else:
+                cursor.execute(
+                    "UPDATE notification_outbox SET state='pending', attempts=attempts+1, last_error=?, next_attempt_at=? WHERE id=?",
+                    (error, retry_at, message_id)
+                )
+
+    def release_claimed(self, older_than: Optional[float] = None) -> int:
+        # Devolve à fila mensagens presas em 'processing' (ex.: worker
+        # interrompido). Com older_than, só as pegas há mais de older_than segundos.
+        with self._db_manager as cursor:
+            if older_than is None:
+                cursor.execute("UPDATE notification_outbox SET state='pending' WHERE state='processing'")
+            else:
+                cursor.execute(
+                    "UPDATE notification_outbox SET state='pending' "
+                    "WHERE state='processing' AND (claimed_at IS NULL OR claimed_at < ?)",
+                    (time.time() - older_than,)
+                )
+            return cursor.rowcount
+
+    def count_by_state(self) -> Dict[str, int]:
+        with self._db_manager as cursor:
+            cursor.execute("SELECT state, COUNT(*) FROM notification_outbox GROUP BY state")
+            return {row[0]: row[1] for row in cursor.fetchall()}
@@ -1,96 +1,450 @@
 # projeto/repositories/order_repository.py
-import json
-from typing import List, Optional
+import calendar
+import sqlite3
+import time
+from datetime import date, datetime
+from functools import lru_cache, partial
+from typing import Dict, Iterator, List, Optional, Tuple
 from models.order import Order
 from models.customer import Customer
+from models.customer_summary import CustomerSummary
+from models.daily_revenue import DailyRevenue
+from models.lazy_items import LazyOrderItems
+from models.money import Money
 from models.order_item import OrderItem
-from models.enums import OrderStatus
+from models.enums import CustomerType, ItemType, OrderStatus
+from interfaces.repository_interface import IOrderRepository, DuplicateOrderError
 from config.database import DatabaseManager
+from monitoring.instrumentation import span, timed
 
-class OrderRepository:
-    def __init__(self, db_manager: DatabaseManager):
+# Colunas lidas de orders; a coluna legada 'items' (JSON) não é mais usada
+ORDER_COLUMNS = "id, customer_name, customer_type, total_cents, status, created_at"
+
+# id NULL deixa o SQLite escolher o próximo rowid (pedidos sem ID gerado)
+INSERT_ORDER_SQL = (
+    "INSERT INTO orders (id, customer_name, customer_type, total_price, total_cents, status, created_at, created_ts, idempotency_key) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Limite de parâmetros por consulta IN (...), abaixo do limite do SQLite
+QUERY_CHUNK_SIZE = 500
+
+# Mapas valor -> enum pré-calculados para a hidratação; Enum(valor) custa
+# bem mais que uma busca em dicionário quando repetido a cada linha
+CUSTOMER_TYPES = {customer_type.value: customer_type for customer_type in CustomerType}
+ORDER_STATUSES = {status.value: status for status in OrderStatus}
+ITEM_TYPES = {item_type.value: item_type for item_type in ItemType}
+
+
+@lru_cache(maxsize=65536)
+def intern_customer(name: str, customer_type: str) -> Customer:
+    # Customer é imutável, então todos os pedidos de um cliente podem
+    # compartilhar a mesma instância em vez de uma cópia por linha
+    return Customer(name, CUSTOMER_TYPES[customer_type])
+
+
+def iter_order_rows_readonly(db_path: str, first_id: int, last_id: int, batch_size: int = 5000) -> Iterator[List[tuple]]:
+    # Faixa [first_id, last_id] de orders por uma conexão somente leitura
+    # própria. Função de módulo para poder rodar em processos de um pool,
+    # onde o DatabaseManager (conexões por thread) não pode ser enviado.
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        conn.execute("PRAGMA busy_timeout=5000")
+        cursor = conn.execute(
+            f"SELECT {ORDER_COLUMNS} FROM orders o WHERE o.id BETWEEN ? AND ? ORDER BY o.id",
+            (first_id, last_id)
+        )
+        yield from iter(lambda: cursor.fetchmany(batch_size), [])
+    finally:
+        conn.close()
+
+
+def created_at_to_timestamp(created_at: str) -> int:
+    # Mesma conversão de strftime('%s', created_at) usada na migração
+    return calendar.timegm(time.strptime(created_at, '%Y-%m-%d %H:%M:%S'))
+
+
+class OrderRepository(IOrderRepository):
+    def __init__(self, db_manager: DatabaseManager, lazy_items: bool = False):
         self._db_manager = db_manager
+        # Com lazy_items as leituras trazem só o cabeçalho do pedido e os
+        # itens são buscados no primeiro acesso a order.items
+        self._lazy_items = lazy_items
 
+    @timed("repository.add")
     def add(self, order: Order) -> int:
-        # Converte os itens para um formato serializável
-        items_data = []
-        for item in order.items:
-            item_dict = {
-                'name': item.name,
-                'price': item.price,
-                'quantity': item.quantity,
-                'item_type': item.item_type.value  # Converte enum para string
-            }
-            items_data.append(item_dict)
-        
-        items_str = json.dumps(items_data)
-        
+        # Usa order.id quando já gerado (ex.: snowflake); senão, o rowid do SQLite
         with self._db_manager as cursor:
-            cursor.execute(
-                "INSERT INTO orders (customer_name, customer_type, items, total_price, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (order.customer.name, order.customer.customer_type.value, items_str, order.total_price, order.status.value, order.created_at)
-            )
-            return cursor.lastrowid
+            try:
+                cursor.execute(INSERT_ORDER_SQL, self._order_params(order.id, order))
+            except sqlite3.IntegrityError as e:
+                self._raise_if_duplicate(cursor, e, [order])
+                raise
+            order_id = cursor.lastrowid
+            self._insert_items(cursor, [(order_id, order)])
+            return order_id
+
+    @timed("repository.add_many")
+    def add_many(self, orders: List[Order]) -> List[int]:
+        if not orders:
+            return []
 
+        with self._db_manager as cursor:
+            # Trava de escrita desde o início: pedidos sem ID gerado recebem IDs
+            # reservados a partir do maior atual, e tudo vai num único
+            # executemany/commit.
+            if not cursor.connection.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            if any(order.id is None for order in orders):
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM orders")
+                first_id = cursor.fetchone()[0] + 1
+                reserved_ids = iter(range(first_id, first_id + len(orders)))
+            order_ids = [order.id if order.id is not None else next(reserved_ids) for order in orders]
+
+            try:
+                cursor.executemany(
+                    INSERT_ORDER_SQL,
+                    [self._order_params(order_id, order) for order_id, order in zip(order_ids, orders)]
+                )
+            except sqlite3.IntegrityError as e:
+                self._raise_if_duplicate(cursor, e, orders, order_ids)
+                raise
+            self._insert_items(cursor, zip(order_ids, orders))
+            return order_ids
+
+    @timed("repository.get_by_id")
     def get_by_id(self, order_id: int) -> Optional[Order]:
         with self._db_manager as cursor:
-            cursor.execute("SELECT * FROM orders WHERE id=?", (order_id,))
-            row = cursor.fetchone()
-            return self._row_to_order(row) if row else None
+            orders = self._fetch_orders(cursor, "WHERE o.id=?", (order_id,))
+            return orders[0] if orders else None
+
+    @timed("repository.find_ids_by_idempotency_keys")
+    def find_ids_by_idempotency_keys(self, keys: List[str]) -> Dict[str, int]:
+        with self._db_manager as cursor:
+            return self._select_ids_by_keys(cursor, keys)
 
-    def update_status(self, order_id: int, status: OrderStatus):
+    @timed("repository.update_status")
+    def update_status(self, order_id: int, status: OrderStatus) -> bool:
         with self._db_manager as cursor:
             cursor.execute("UPDATE orders SET status=? WHERE id=?", (status.value, order_id))
+            return cursor.rowcount > 0
 
+    @timed("repository.get_all")
     def get_all(self) -> List[Order]:
         with self._db_manager as cursor:
-            cursor.execute("SELECT * FROM orders")
-            rows = cursor.fetchall()
-            return [self._row_to_order(row) for row in rows]
+            return self._fetch_orders(cursor)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Order]:
+        # Percorre a tabela em lotes com fetchmany; só um lote fica em memória
+        with self._db_manager.reader() as cursor:
+            cursor.execute(f"SELECT {ORDER_COLUMNS} FROM orders o ORDER BY o.id")
+            items_cursor = cursor.connection.cursor()
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                if self._lazy_items:
+                    for row in rows:
+                        yield self._row_to_order(row, None)
+                    continue
+
+                # Os IDs do lote são contíguos na ordenação, então uma faixa
+                # no índice de order_items traz exatamente os itens do lote
+                with span("repository.iter_all.batch_items"):
+                    items_cursor.execute(
+                        "SELECT order_id, name, price_cents, quantity, item_type FROM order_items "
+                        "WHERE order_id BETWEEN ? AND ? ORDER BY order_id, position",
+                        (rows[0][0], rows[-1][0])
+                    )
+                    items_by_order = self._group_items(items_cursor.fetchall())
+                for row in rows:
+                    yield self._row_to_order(row, items_by_order.get(row[0], []))
+
+    def iter_order_rows(self, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        # Linhas cruas na ordem de ORDER_COLUMNS, em lotes do fetchmany
+        with self._db_manager.reader() as cursor:
+            cursor.execute(f"SELECT {ORDER_COLUMNS} FROM orders o ORDER BY o.id")
+            yield from iter(lambda: cursor.fetchmany(batch_size), [])
+
+    def iter_item_rows(self, batch_size: int = 5000) -> Iterator[List[tuple]]:
+        with self._db_manager.reader() as cursor:
+            cursor.execute(
+                "SELECT order_id, position, name, price_cents, quantity, item_type "
+                "FROM order_items ORDER BY order_id, position"
+            )
+            yield from iter(lambda: cursor.fetchmany(batch_size), [])
 
+    def get_id_shards(self, rows_per_shard: int) -> List[Tuple[int, int]]:
+        # Salta rows_per_shard linhas por vez no índice da chave primária
+        # (OFFSET percorre o índice no próprio SQLite, sem trazer as linhas)
+        if rows_per_shard <= 0:
+            raise ValueError("O tamanho da fatia deve ser positivo.")
+        with self._db_manager as cursor:
+            cursor.execute("SELECT MIN(id), MAX(id) FROM orders")
+            first_id, last_id = cursor.fetchone()
+            shards = []
+            start = first_id
+            while start is not None:
+                cursor.execute(
+                    "SELECT id FROM orders WHERE id BETWEEN ? AND ? ORDER BY id LIMIT 1 OFFSET ?",
+                    (start, last_id, rows_per_shard)
+                )
+                row = cursor.fetchone()
+                shards.append((start, row[0] - 1 if row else last_id))
+                start = row[0] if row else None
+            return shards
+
+    def get_database_path(self) -> Optional[str]:
+        db_name = self._db_manager.db_name
+        return None if db_name == ':memory:' or db_name.startswith('file:') else db_name
+
+    @timed("repository.get_by_customer")
     def get_by_customer(self, customer_name: str) -> List[Order]:
         with self._db_manager as cursor:
-            cursor.execute("SELECT * FROM orders WHERE customer_name=?", (customer_name,))
+            return self._fetch_orders(cursor, "WHERE o.customer_name=?", (customer_name,))
+
+    @timed("repository.list_orders")
+    def list_orders(
+        self,
+        status: Optional[OrderStatus] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        customer: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Order]:
+        # Paginação por chave (keyset): a próxima página começa depois do
+        # último ID retornado, então o custo por página não cresce com o offset
+        if limit <= 0:
+            raise ValueError("O limite da página deve ser positivo.")
+
+        conditions = []
+        params = []
+        if status is not None:
+            conditions.append("o.status=?")
+            params.append(status.value)
+        if customer is not None:
+            conditions.append("o.customer_name=?")
+            params.append(customer)
+        if since is not None:
+            conditions.append("o.created_ts>=?")
+            params.append(calendar.timegm(since.timetuple()))
+        if until is not None:
+            conditions.append("o.created_ts<?")
+            params.append(calendar.timegm(until.timetuple()))
+        if after_id is not None:
+            conditions.append("o.id>?")
+            params.append(after_id)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
+        with self._db_manager as cursor:
+            cursor.execute(f"SELECT {ORDER_COLUMNS} FROM orders o {where} ORDER BY o.id LIMIT ?", params)
             rows = cursor.fetchall()
-            return [self._row_to_order(row) for row in rows]
-    
+            if not rows:
+                return []
+            if self._lazy_items:
+                return [self._row_to_order(row, None) for row in rows]
+
+            placeholders = ", ".join("?" for _ in rows)
+            cursor.execute(
+                f"SELECT order_id, name, price_cents, quantity, item_type FROM order_items "
+                f"WHERE order_id IN ({placeholders}) ORDER BY order_id, position",
+                [row[0] for row in rows]
+            )
+            items_by_order = self._group_items(cursor.fetchall())
+            return [self._row_to_order(row, items_by_order.get(row[0], [])) for row in rows]
+
     def get_all_by_customer(self, customer_name: str) -> List[Order]:
         return self.get_by_customer(customer_name)
-    
+
+    @timed("repository.get_distinct_customers")
     def get_distinct_customers(self) -> List[Customer]:
-        from models.enums import CustomerType
-        
         with self._db_manager as cursor:
             cursor.execute("SELECT DISTINCT customer_name, customer_type FROM orders")
-            rows = cursor.fetchall()
-            customers = []
-            for row in rows:
-                customer = Customer(name=row[0], customer_type=CustomerType(row[1]))
-                customers.append(customer)
-            return customers
-
-    def _row_to_order(self, row: tuple) -> Order:
-        from models.enums import CustomerType, ItemType
-        
-        customer = Customer(name=row[1], customer_type=CustomerType(row[2]))
-        items_list = json.loads(row[3])
-        
-        # Converte os itens de volta para objetos OrderItem
-        items = []
-        for item_data in items_list:
-            item = OrderItem(
-                name=item_data['name'],
-                price=item_data['price'],
-                quantity=item_data['quantity'],
-                item_type=ItemType(item_data['item_type'])
+            return [intern_customer(row[0], row[1]) for row in cursor.fetchall()]
+
+    @timed("repository.calculate_customer_total")
+    def calculate_customer_total(self, customer_name: str) -> Money:
+        # Lido do agregado mantido pelos triggers (centavos inteiros, exato)
+        with self._db_manager as cursor:
+            cursor.execute("SELECT COALESCE(SUM(total_cents), 0) FROM customer_totals WHERE customer_name=?", (customer_name,))
+            return Money(cursor.fetchone()[0])
+
+    @timed("repository.get_customer_totals")
+    def get_customer_totals(self) -> List[CustomerSummary]:
+        # Agregado por cliente mantido na gravação: custo O(clientes), não O(pedidos)
+        with self._db_manager as cursor:
+            cursor.execute("""
+                SELECT customer_name, customer_type, total_cents, order_count
+                FROM customer_totals
+                WHERE order_count > 0
+                ORDER BY first_order_id
+            """)
+            return [
+                CustomerSummary(
+                    customer=intern_customer(row[0], row[1]),
+                    total_spent=Money(row[2]),
+                    order_count=row[3]
+                )
+                for row in cursor.fetchall()
+            ]
+
+    @timed("repository.get_status_counts")
+    def get_status_counts(self) -> Dict[OrderStatus, int]:
+        with self._db_manager as cursor:
+            cursor.execute("SELECT status, order_count FROM status_counts WHERE order_count > 0")
+            return {ORDER_STATUSES[row[0]]: row[1] for row in cursor.fetchall()}
+
+    @timed("repository.get_daily_revenue")
+    def get_daily_revenue(self, since: Optional[date] = None, until: Optional[date] = None) -> List[DailyRevenue]:
+        # Faixa semiaberta [since, until), como em list_orders
+        conditions = ["order_count > 0"]
+        params = []
+        if since is not None:
+            conditions.append("day>=?")
+            params.append(since.strftime('%Y-%m-%d'))
+        if until is not None:
+            conditions.append("day<?")
+            params.append(until.strftime('%Y-%m-%d'))
+
+        with self._db_manager as cursor:
+            cursor.execute(
+                f"SELECT day, total_cents, order_count FROM daily_revenue WHERE {' AND '.join(conditions)} ORDER BY day",
+                params
             )
-            items.append(item)
-        
+            return [DailyRevenue(day=row[0], total=Money(row[1]), order_count=row[2]) for row in cursor.fetchall()]
+
+    @timed("repository.get_product_sales")
+    def get_product_sales(self) -> List[Dict]:
+        # Vendas por produto calculadas direto no SQL, sem hidratar pedidos
+        with self._db_manager as cursor:
+            cursor.execute("""
+                SELECT name, SUM(quantity), SUM(price_cents * quantity)
+                FROM order_items
+                GROUP BY name
+                ORDER BY name
+            """)
+            return [
+                {'name': row[0], 'quantity': row[1], 'gross_revenue': Money(row[2])}
+                for row in cursor.fetchall()
+            ]
+
+    @timed("repository.get_quantities_by_product")
+    def get_quantities_by_product(self, statuses: Optional[List[OrderStatus]] = None) -> Dict[str, int]:
+        # Quantidade vendida por produto, opcionalmente filtrada por status
+        # do pedido (ex.: ignorar cancelados na conciliação de estoque)
+        query = "SELECT i.name, SUM(i.quantity) FROM order_items i"
+        params = ()
+        if statuses:
+            placeholders = ", ".join("?" for _ in statuses)
+            query += f" JOIN orders o ON o.id = i.order_id WHERE o.status IN ({placeholders})"
+            params = tuple(status.value for status in statuses)
+        query += " GROUP BY i.name"
+
+        with self._db_manager as cursor:
+            cursor.execute(query, params)
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def _order_params(self, order_id: Optional[int], order: Order) -> tuple:
+        return (
+            order_id, order.customer.name, order.customer.customer_type.value, float(order.total_price),
+            order.total_price.cents, order.status.value, order.created_at,
+            created_at_to_timestamp(order.created_at), order.idempotency_key
+        )
+
+    def _select_ids_by_keys(self, cursor, keys: List[str]) -> Dict[str, int]:
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for start in range(0, len(keys), QUERY_CHUNK_SIZE):
+            chunk = keys[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT idempotency_key, id FROM orders WHERE idempotency_key IN ({placeholders})",
+                chunk
+            )
+            found.update(cursor.fetchall())
+        return found
+
+    def _raise_if_duplicate(self, cursor, error: sqlite3.IntegrityError, orders: List[Order], order_ids: Optional[List[int]] = None):
+        # Traduz a violação do índice único de idempotency_key para
+        # DuplicateOrderError com o ID do pedido que já usa a chave. Outras
+        # violações (ex.: ID repetido) seguem como IntegrityError.
+        if "orders.idempotency_key" not in str(error):
+            return
+        keys = [order.idempotency_key for order in orders if order.idempotency_key is not None]
+        # Linhas já inseridas por este mesmo lote não contam: a transação será desfeita
+        batch_ids = set(order_ids or ())
+        for key, order_id in self._select_ids_by_keys(cursor, keys).items():
+            if order_id not in batch_ids:
+                raise DuplicateOrderError(key, order_id)
+
+    def _insert_items(self, cursor, orders_with_ids):
+        cursor.executemany(
+            "INSERT INTO order_items (order_id, position, name, price, price_cents, quantity, item_type) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (order_id, position, item.name, float(item.price), item.price.cents, item.quantity, item.item_type.value)
+                for order_id, order in orders_with_ids
+                for position, item in enumerate(order.items)
+            ]
+        )
+
+    def _fetch_orders(self, cursor, where: str = "", params: tuple = ()) -> List[Order]:
+        # Busca os pedidos e depois todos os seus itens com o mesmo filtro,
+        # em duas consultas (sem uma consulta de itens por pedido)
+        cursor.execute(f"SELECT {ORDER_COLUMNS} FROM orders o {where} ORDER BY o.id", params)
+        rows = cursor.fetchall()
+        if not rows:
+            return []
+        if self._lazy_items:
+            return [self._row_to_order(row, None) for row in rows]
+
+        cursor.execute(
+            f"SELECT i.order_id, i.name, i.price_cents, i.quantity, i.item_type FROM order_items i "
+            f"JOIN orders o ON o.id = i.order_id {where} ORDER BY i.order_id, i.position",
+            params
+        )
+        items_by_order = self._group_items(cursor.fetchall())
+        return [self._row_to_order(row, items_by_order.get(row[0], [])) for row in rows]
+
+    def _group_items(self, item_rows: List[tuple]) -> Dict[int, List[tuple]]:
+        items_by_order = {}
+        for item_row in item_rows:
+            items_by_order.setdefault(item_row[0], []).append(item_row)
+        return items_by_order
+
+    def _load_items(self, order_id: int) -> List[OrderItem]:
+        # Carregador usado pelos itens preguiçosos (uma consulta por pedido)
+        with self._db_manager as cursor:
+            cursor.execute(
+                "SELECT order_id, name, price_cents, quantity, item_type FROM order_items "
+                "WHERE order_id=? ORDER BY position",
+                (order_id,)
+            )
+            return self._build_items(cursor.fetchall())
+
+    def _build_items(self, item_rows: List[tuple]) -> List[OrderItem]:
+        # item_row é (order_id, name, price_cents, quantity, item_type)
+        return [
+            OrderItem(item_row[1], Money(item_row[2]), item_row[3], ITEM_TYPES[item_row[4]])
+            for item_row in item_rows
+        ]
+
+    def _row_to_order(self, row: tuple, item_rows: Optional[List[tuple]]) -> Order:
+        # Caminho quente das varreduras: argumentos posicionais, enums por
+        # dicionário e Customer compartilhado entre os pedidos do cliente.
+        # row segue ORDER_COLUMNS; item_rows None indica itens preguiçosos
+        if item_rows is None:
+            items = LazyOrderItems(partial(self._load_items, row[0]))
+        else:
+            items = self._build_items(item_rows)
         return Order(
-            id=row[0],
-            customer=customer,
-            items=items,
-            total_price=row[4],
-            status=OrderStatus(row[5]),
-            created_at=row[6]
-        )
\ No newline at end of file
+            intern_customer(row[1], row[2]),
+            items,
+            row[0],
+            Money(row[3]),
+            ORDER_STATUSES[row[4]],
+            row[5]
+        )
@@ -0,0 +1,65 @@
+# services/async_order_service.py
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, List, Optional, TypeVar
+from models.customer import Customer
+from models.order import Order
+from models.order_item import OrderItem
+from models.order_request import OrderRequest
+from models.enums import OrderStatus
+from interfaces.repository_interface import IOrderRepository
+from services.order_service import OrderService
+
+T = TypeVar('T')
+
+
+class AsyncOrderService:
+    # Contraparte assíncrona do OrderService. Todo acesso ao SQLite roda num
+    # executor dedicado (por padrão uma única thread, que fica com a conexão
+    # persistente do DatabaseManager e serializa as gravações), então o
+    # event loop nunca bloqueia esperando o banco.
+    #
+    # As notificações continuam sendo enviadas pelo OrderService dentro da
+    # transação; com o OutboxNotificationService isso é só mais uma gravação
+    # no banco, e a entrega fica com o NotificationDispatcher.
+    
+    def __init__(
+        self,
+        order_service: OrderService,
+        order_repository: IOrderRepository,
+        db_executor: Optional[Executor] = None
+    ):
+        self._order_service = order_service
+        self._order_repository = order_repository
+        self._owns_executor = db_executor is None
+        self._db_executor = db_executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+    
+    async def run_in_db(self, func: Callable[..., T], *args, **kwargs) -> T:
+        # Executa uma chamada bloqueante de banco no executor dedicado
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, functools.partial(func, *args, **kwargs))
+    
+    async def create_order(
+        self,
+        customer: Customer,
+        items: List[OrderItem],
+        is_special: bool = False,
+        idempotency_key: Optional[str] = None
+    ) -> int:
+        return await self.run_in_db(self._order_service.create_order, customer, items, is_special, idempotency_key)
+    
+    async def create_orders(self, requests: List[OrderRequest]) -> List[int]:
+        return await self.run_in_db(self._order_service.create_orders, requests)
+    
+    async def update_order_status(self, order_id: int, new_status: OrderStatus):
+        await self.run_in_db(self._order_service.update_order_status, order_id, new_status)
+    
+    async def get_order(self, order_id: int) -> Optional[Order]:
+        return await self.run_in_db(self._order_repository.get_by_id, order_id)
+    
+    def close(self):
+        # Só encerra o executor se ele foi criado aqui
+        if self._owns_executor:
+            self._db_executor.shutdown(wait=True)
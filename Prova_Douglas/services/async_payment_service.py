@@ -0,0 +1,57 @@
+# services/async_payment_service.py
+
+from typing import Dict, Optional, Union
+from models.order import Order
+from models.money import Money
+from interfaces.payment_interface import IPaymentStrategy, IAsyncPaymentStrategy
+from strategies.payment_strategy import AsyncPaymentStrategyAdapter
+from services.async_order_service import AsyncOrderService
+from models.enums import OrderStatus, PaymentMethod
+
+class AsyncPaymentService:
+    # Mesmo fluxo do PaymentService, mas a chamada ao gateway é aguardada no
+    # event loop e as leituras/gravações vão para o executor de banco do
+    # AsyncOrderService. Strategies bloqueantes são adaptadas e rodam no
+    # executor padrão do loop, fora da thread do banco.
+    
+    def __init__(
+        self,
+        payment_strategies: Dict[PaymentMethod, Union[IAsyncPaymentStrategy, IPaymentStrategy]],
+        order_service: AsyncOrderService
+    ):
+        self._strategies = {
+            method: strategy if isinstance(strategy, IAsyncPaymentStrategy) else AsyncPaymentStrategyAdapter(strategy)
+            for method, strategy in payment_strategies.items()
+        }
+        self._order_service = order_service
+
+    async def _get_and_validate_order(self, order_id: int, amount_paid: float) -> Optional[Order]:
+        order = await self._order_service.get_order(order_id)
+        
+        if not order:
+            print("Pedido não encontrado!")
+            return None
+        
+        # O valor pago chega em reais; comparado já em centavos
+        if Money.of(amount_paid) < order.total_price:
+            print("Valor pago é insuficiente!")
+            return None
+            
+        return order
+
+    async def process_payment(self, order_id: int, method: PaymentMethod, amount_paid: float) -> bool:
+        order = await self._get_and_validate_order(order_id, amount_paid)
+        if not order:
+            return False
+
+        strategy = self._strategies.get(method)
+        if not strategy:
+            print("Método de pagamento inválido!")
+            return False
+        
+        payment_approved = await strategy.process_payment(order, amount_paid)
+        
+        if payment_approved:
+            await self._order_service.update_order_status(order_id, OrderStatus.APPROVED)
+            
+        return payment_approved
@@ -0,0 +1,66 @@
+# services/export_service.py
+
+import gzip
+from typing import Callable, Dict, Iterator, List, Tuple
+from interfaces.export_interface import IExportWriter, ExportColumn
+from interfaces.repository_interface import IOrderRepository
+
+# Esquema de cada conjunto exportável, na ordem das tuplas do repositório.
+# Valores monetários saem em centavos inteiros (exatos para o BI).
+EXPORT_DATASETS: Dict[str, List[ExportColumn]] = {
+    'orders': [
+        ('id', 'int'),
+        ('customer_name', 'str'),
+        ('customer_type', 'str'),
+        ('total_cents', 'int'),
+        ('status', 'str'),
+        ('created_at', 'str'),
+    ],
+    'order_items': [
+        ('order_id', 'int'),
+        ('position', 'int'),
+        ('name', 'str'),
+        ('price_cents', 'int'),
+        ('quantity', 'int'),
+        ('item_type', 'str'),
+    ],
+}
+
+
+class ExportService:
+    # Exporta tabelas do repositório em streaming: os lotes de linhas cruas
+    # vão direto para o writer (CSV, JSON Lines, colunar), com gzip opcional.
+    # A memória usada é a de um lote, independente do tamanho da exportação.
+    
+    def __init__(self, order_repository: IOrderRepository):
+        self._order_repo = order_repository
+        self._row_sources: Dict[str, Callable[[int], Iterator[List[tuple]]]] = {
+            'orders': self._order_repo.iter_order_rows,
+            'order_items': self._order_repo.iter_item_rows
+        }
+    
+    def export(
+        self,
+        dataset: str,
+        writer: IExportWriter,
+        filename: str,
+        compress: bool = False,
+        batch_size: int = 5000
+    ) -> int:
+        # Retorna o número de linhas exportadas
+        row_source = self._row_sources.get(dataset)
+        if row_source is None:
+            raise ValueError(f"Conjunto de exportação inválido: {dataset}")
+        
+        opener = gzip.open if compress else open
+        rows_written = 0
+        with opener(filename, 'wb') as stream:
+            writer.begin(stream, EXPORT_DATASETS[dataset])
+            for rows in row_source(batch_size):
+                writer.write_chunk(rows)
+                rows_written += len(rows)
+            writer.end()
+        return rows_written
+    
+    def get_datasets(self) -> List[Tuple[str, List[ExportColumn]]]:
+        return list(EXPORT_DATASETS.items())
@@ -0,0 +1,110 @@
+# services/id_generator.py
+
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Optional
+from interfaces.id_generator_interface import IIdGenerator, IWorkerIdLease
+
+# Layout snowflake em 63 bits (cabe no INTEGER do SQLite):
+# 41 bits de milissegundos desde EPOCH_MS | 10 bits de worker_id | 12 bits de sequência
+EPOCH_MS = 1704067200000  # 2024-01-01 00:00:00 UTC
+WORKER_ID_BITS = 10
+SEQUENCE_BITS = 12
+MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# Recuo de relógio tolerado (ms) esperando o relógio alcançar; acima disso, erro
+MAX_CLOCK_DRIFT_MS = 50
+
+
+class SnowflakeIdGenerator(IIdGenerator):
+    # IDs inteiros únicos e ordenados pelo tempo de criação. A unicidade
+    # entre processos vem do worker_id, que deve ser exclusivo: use
+    # from_lease() para obtê-lo do banco em vez de fixá-lo à mão.
+
+    def __init__(self, worker_id: int, epoch_ms: int = EPOCH_MS):
+        if not 0 <= worker_id <= MAX_WORKER_ID:
+            raise ValueError(f"worker_id deve estar entre 0 e {MAX_WORKER_ID}.")
+        self._worker_id = worker_id
+        self._epoch_ms = epoch_ms
+        self._last_ms = -1
+        self._sequence = 0
+        self._lock = threading.Lock()
+        # Preenchidos por from_lease()
+        self._lease: Optional[IWorkerIdLease] = None
+        self._owner = None
+        self._lease_ttl = 0.0
+        self._renew_at = float('inf')
+
+    @classmethod
+    def from_lease(cls, lease: IWorkerIdLease, ttl_seconds: float = 300.0, epoch_ms: int = EPOCH_MS) -> 'SnowflakeIdGenerator':
+        # worker_id concedido pelo banco, renovado automaticamente em next_id
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        generator = cls(lease.acquire(owner, ttl_seconds), epoch_ms)
+        generator._lease = lease
+        generator._owner = owner
+        generator._lease_ttl = ttl_seconds
+        generator._renew_at = time.monotonic() + ttl_seconds / 3
+        return generator
+
+    @property
+    def worker_id(self) -> int:
+        return self._worker_id
+
+    def next_id(self) -> int:
+        with self._lock:
+            if time.monotonic() >= self._renew_at:
+                self._renew_lease()
+
+            now_ms = self._current_ms()
+            if now_ms < self._last_ms:
+                # Relógio voltou (ex.: ajuste de NTP): espera se for pouco
+                if self._last_ms - now_ms > MAX_CLOCK_DRIFT_MS:
+                    raise RuntimeError("Relógio do sistema retrocedeu; geração de IDs suspensa.")
+                now_ms = self._wait_until(self._last_ms)
+
+            if now_ms == self._last_ms:
+                self._sequence = (self._sequence + 1) & MAX_SEQUENCE
+                if self._sequence == 0:
+                    # Sequência esgotada neste milissegundo: avança para o próximo
+                    now_ms = self._wait_until(self._last_ms + 1)
+            else:
+                self._sequence = 0
+
+            self._last_ms = now_ms
+            return (
+                ((now_ms - self._epoch_ms) << (WORKER_ID_BITS + SEQUENCE_BITS))
+                | (self._worker_id << SEQUENCE_BITS)
+                | self._sequence
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._lease is not None:
+                self._lease.release(self._worker_id, self._owner)
+                self._lease = None
+                self._renew_at = float('inf')
+
+    def _renew_lease(self):
+        # A renovação só acontece em next_id: um processo ocioso por mais que
+        # o TTL pode perder o worker_id para outro processo. Nesse caso pede
+        # um novo worker_id em vez de arriscar IDs repetidos.
+        if not self._lease.renew(self._worker_id, self._owner, self._lease_ttl):
+            print(f"Concessão do worker_id {self._worker_id} perdida; obtendo um novo worker_id.")
+            self._worker_id = self._lease.acquire(self._owner, self._lease_ttl)
+            self._last_ms = -1
+            self._sequence = 0
+        self._renew_at = time.monotonic() + self._lease_ttl / 3
+
+    def _current_ms(self) -> int:
+        return time.time_ns() // 1_000_000
+
+    def _wait_until(self, target_ms: int) -> int:
+        now_ms = self._current_ms()
+        while now_ms < target_ms:
+            time.sleep((target_ms - now_ms) / 1000)
+            now_ms = self._current_ms()
+        return now_ms
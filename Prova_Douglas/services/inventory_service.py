@@ -1,36 +1,65 @@
-from typing import List
+import uuid
+from typing import Dict, List, Optional
 from models.order_item import OrderItem
+from interfaces.inventory_interface import IInventoryRepository
+from repositories.inventory_repository import InMemoryInventoryRepository
+
+# Estoque simplificado como na prova original
+DEFAULT_STOCK = {
+    'produto1': 100,
+    'produto2': 50,
+    'produto3': 75
+}
 
 
 class InventoryService:
     
-    def __init__(self):
-        # Estoque simplificado como na prova original
-        self.stock = {
-            'produto1': 100,
-            'produto2': 50,
-            'produto3': 75
-        }
+    def __init__(self, inventory_repository: Optional[IInventoryRepository] = None):
+        # Sem repositório, usa o estoque padrão em memória
+        self._inventory = inventory_repository or InMemoryInventoryRepository(DEFAULT_STOCK)
     
     def is_stock_sufficient(self, items: List[OrderItem]) -> bool:
-        for item in items:
-            product_name = item.name.strip()
-            quantity = item.quantity
-            
+        required = self._required_quantities(items)
+        available = self._inventory.get_quantities(list(required))
+        
+        for product_name, quantity in required.items():
             # Verifica se produto existe no estoque
-            if product_name not in self.stock:
+            if product_name not in available:
                 print(f"Produto {product_name} não encontrado!")
                 return False
             
             # Verifica se há quantidade suficiente
-            if self.stock[product_name] < quantity:
+            if available[product_name] < quantity:
                 print(f"Estoque insuficiente para {product_name}!")
                 return False
         
         return True
     
+    def reserve(self, items: List[OrderItem]) -> Optional[str]:
+        # Baixa atômica de todos os itens; retorna o ID da reserva ou None
+        reservation_id = uuid.uuid4().hex
+        if self._inventory.reserve(reservation_id, self._required_quantities(items)):
+            return reservation_id
+        # Repete a consulta só para informar qual produto faltou
+        self.is_stock_sufficient(items)
+        return None
+    
+    def commit_reservation(self, reservation_id: str, order_id: Optional[int] = None) -> bool:
+        return self._inventory.commit(reservation_id, order_id)
+    
+    def release_reservation(self, reservation_id: str) -> bool:
+        return self._inventory.release(reservation_id)
+    
     def get_available_quantity(self, product_name: str) -> int:
-        return self.stock.get(product_name.strip(), 0)
+        return self._inventory.get_quantities([product_name.strip()]).get(product_name.strip(), 0)
     
     def get_stock_source(self) -> str:
-        return "simple_memory"
+        return "simple_memory" if isinstance(self._inventory, InMemoryInventoryRepository) else "database"
+    
+    def _required_quantities(self, items: List[OrderItem]) -> Dict[str, int]:
+        # Soma as quantidades por produto (o mesmo produto pode vir em várias linhas)
+        required = {}
+        for item in items:
+            product_name = item.name.strip()
+            required[product_name] = required.get(product_name, 0) + item.quantity
+        return required
@@ -0,0 +1,175 @@
+# services/notification_dispatcher.py
+
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+from interfaces.notification_interface import INotificationStrategy
+from interfaces.outbox_interface import INotificationOutbox
+from models.order import Order
+from models.outbox_message import OutboxMessage
+
+class NotificationDispatcher:
+    # Consome o outbox em segundo plano. Cada canal tem seu próprio pool de
+    # threads, cujo tamanho é o limite de envios simultâneos daquele canal;
+    # falhas são reagendadas com backoff exponencial até max_attempts.
+
+    def __init__(
+        self,
+        outbox: INotificationOutbox,
+        strategies: List[INotificationStrategy],
+        channel_concurrency: Optional[Dict[str, int]] = None,
+        default_concurrency: int = 2,
+        max_attempts: int = 5,
+        backoff_seconds: float = 1.0,
+        batch_size: int = 100,
+        poll_interval: float = 0.2,
+        claim_timeout: float = 300.0
+    ):
+        self._outbox = outbox
+        self._strategies = {strategy.get_notification_method(): strategy for strategy in strategies}
+        channel_concurrency = channel_concurrency or {}
+        self._concurrency = {
+            channel: channel_concurrency.get(channel, default_concurrency)
+            for channel in self._strategies
+        }
+        self._executors: Optional[Dict[str, ThreadPoolExecutor]] = None
+        self._max_attempts = max_attempts
+        self._backoff = backoff_seconds
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        # Mensagens em 'processing' há mais que isso são dadas como perdidas
+        self._claim_timeout = claim_timeout
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._ensure_executors()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        # Pools encerrados por um stop() anterior são recriados
+        self._ensure_executors()
+        # Mensagens presas em 'processing' há mais que claim_timeout voltam à
+        # fila; as pegas há pouco podem ser de outro processo ainda enviando
+        self._outbox.release_claimed(self._claim_timeout)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, drain: bool = True):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if drain:
+            self.drain()
+        executors, self._executors = self._executors, None
+        for executor in (executors or {}).values():
+            executor.shutdown(wait=True)
+
+    def dispatch_once(self) -> int:
+        # Processa um lote e espera os envios terminarem; retorna o tamanho do lote
+        self._ensure_executors()
+        messages = self._outbox.claim_batch(self._batch_size)
+        futures = [self._submit(message) for message in messages]
+        wait([future for future in futures if future is not None])
+        return len(messages)
+
+    def drain(self):
+        # Envia tudo o que já está pronto para envio (não espera retentativas futuras)
+        while self.dispatch_once():
+            pass
+
+    def _run(self):
+        # Cada canal tem até batch_size envios em andamento e novas mensagens
+        # são pegas conforme os envios terminam: um canal lento ou saturado
+        # não segura os demais até o lote inteiro acabar
+        in_flight: Dict = {}  # future -> canal
+        per_channel: Dict[str, int] = {}
+        next_recovery = time.monotonic() + self._claim_timeout / 2
+        while not self._stop_event.is_set():
+            if time.monotonic() >= next_recovery:
+                self._recover_stale_claims()
+                next_recovery = time.monotonic() + self._claim_timeout / 2
+
+            saturated = [channel for channel, count in per_channel.items() if count >= self._batch_size]
+            claimed = 0
+            if len(saturated) < len(self._executors):
+                try:
+                    messages = self._outbox.claim_batch(self._batch_size, saturated)
+                except Exception as e:
+                    print(f"Erro ao buscar notificações no outbox: {e}")
+                    messages = []
+                claimed = len(messages)
+                for message in messages:
+                    future = self._submit(message)
+                    if future is not None:
+                        in_flight[future] = message.channel
+                        per_channel[message.channel] = per_channel.get(message.channel, 0) + 1
+
+            if in_flight:
+                done, _ = wait(list(in_flight), timeout=self._poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    per_channel[in_flight.pop(future)] -= 1
+            elif not claimed:
+                self._stop_event.wait(self._poll_interval)
+
+        # Termina os envios já iniciados antes de sair
+        wait(list(in_flight))
+
+    def _recover_stale_claims(self):
+        try:
+            released = self._outbox.release_claimed(self._claim_timeout)
+        except Exception as e:
+            print(f"Erro ao recuperar notificações presas: {e}")
+            return
+        if released:
+            print(f"{released} notificação(ões) presa(s) em processamento voltaram para a fila.")
+
+    def _ensure_executors(self):
+        if self._executors is None:
+            self._executors = {
+                channel: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"notify-{channel}")
+                for channel, workers in self._concurrency.items()
+            }
+
+    def _submit(self, message: OutboxMessage):
+        executor = self._executors.get(message.channel)
+        if executor is None:
+            self._record(self._outbox.mark_failed, message, f"Canal desconhecido: {message.channel}")
+            return None
+        return executor.submit(self._deliver, message)
+
+    def _deliver(self, message: OutboxMessage):
+        strategy = self._strategies[message.channel]
+        order = Order(
+            id=message.order_id,
+            customer=message.customer,
+            items=[],
+            status=message.status,
+            is_special=message.is_special
+        )
+        try:
+            if strategy.send_notification(order, message.status):
+                self._record(self._outbox.mark_sent, message)
+                return
+            error = "Canal recusou a mensagem"
+        except Exception:
+            error = traceback.format_exc(limit=1)
+
+        attempts = message.attempts + 1
+        if attempts >= self._max_attempts:
+            self._record(self._outbox.mark_failed, message, error)
+        else:
+            retry_at = time.time() + self._backoff * 2 ** (attempts - 1)
+            self._record(self._outbox.mark_failed, message, error, retry_at)
+
+    def _record(self, mark, message: OutboxMessage, *args):
+        # Uma falha ao gravar o resultado não pode sumir dentro do future: a
+        # mensagem fica em 'processing' e volta à fila pela recuperação de
+        # mensagens presas (claim_timeout)
+        try:
+            mark(message.id, *args)
+        except Exception as e:
+            print(f"Erro ao registrar o envio da notificação {message.id} ({message.channel}): {e}")
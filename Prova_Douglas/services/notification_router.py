@@ -0,0 +1,40 @@
+# services/notification_router.py
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from interfaces.notification_interface import INotificationService, INotificationStrategy
+from models.order import Order
+from models.enums import OrderStatus
+
+class NotificationRouter(INotificationService):
+    # Distribui cada mudança de status para todos os canais configurados,
+    # em paralelo, e espera todos responderem. A falha de um canal não
+    # impede o envio pelos demais.
+    
+    def __init__(self, strategies: List[INotificationStrategy], max_workers: Optional[int] = None):
+        self._strategies = list(strategies)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or max(len(self._strategies), 1),
+            thread_name_prefix="notification-router"
+        )
+    
+    def send_notification(self, order: Order, status: OrderStatus):
+        self._fan_out(lambda strategy: strategy.send_notification(order, status))
+    
+    def send_many(self, orders: List[Order], status: OrderStatus):
+        # Cada canal recebe o lote inteiro e pode agrupá-lo numa só submissão
+        self._fan_out(lambda strategy: strategy.send_many(orders, status))
+    
+    def get_channels(self) -> List[str]:
+        return [strategy.get_notification_method() for strategy in self._strategies]
+    
+    def close(self):
+        self._executor.shutdown(wait=True)
+    
+    def _fan_out(self, send):
+        futures = [(strategy, self._executor.submit(send, strategy)) for strategy in self._strategies]
+        for strategy, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Erro ao notificar via {strategy.get_notification_method()}: {e}")
@@ -2,8 +2,9 @@
 
 from models.order import Order
 from models.enums import OrderStatus
+from interfaces.notification_interface import INotificationService
 
-class NotificationService:
+class NotificationService(INotificationService):
     
     def send_notification(self, order: Order, status: OrderStatus):
         customer_name = order.customer.name
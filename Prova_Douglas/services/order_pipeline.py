@@ -0,0 +1,162 @@
+# services/order_pipeline.py
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+from models.order_request import OrderRequest
+from models.pipeline_result import PipelineResult
+from monitoring.metrics import StageMetrics
+from services.order_service import OrderService
+from services.payment_service import PaymentService
+from services.inventory_service import InventoryService
+
+# Marca de parada enviada a cada worker
+_STOP = object()
+
+
+class OrderPipeline:
+    # Front-end concorrente do fluxo de pedidos: as requisições entram numa
+    # fila limitada e um pool de threads executa estoque -> criação ->
+    # pagamento -> mudanças de status. Com a fila cheia, submit() bloqueia
+    # (ou recusa, com timeout), aplicando contrapressão no produtor.
+
+    def __init__(
+        self,
+        order_service: OrderService,
+        payment_service: PaymentService,
+        inventory_service: InventoryService,
+        workers: int = 4,
+        queue_size: int = 100,
+        metrics: Optional[StageMetrics] = None
+    ):
+        if workers <= 0:
+            raise ValueError("O pipeline precisa de pelo menos um worker.")
+        if queue_size <= 0:
+            raise ValueError("O tamanho da fila deve ser positivo.")
+
+        self._order_service = order_service
+        self._payment_service = payment_service
+        self._inventory_service = inventory_service
+        self._workers = workers
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._metrics = metrics or StageMetrics()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._threads = [
+                threading.Thread(target=self._worker, name=f"order-pipeline-{i}", daemon=True)
+                for i in range(self._workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def submit(self, request: OrderRequest, timeout: Optional[float] = None) -> Future:
+        # Bloqueia enquanto a fila estiver cheia; com timeout, levanta
+        # queue.Full se não houver espaço a tempo
+        if not self._running:
+            raise RuntimeError("O pipeline não está em execução.")
+
+        future = Future()
+        try:
+            self._queue.put((request, future, time.perf_counter()), timeout=timeout)
+        except queue.Full:
+            self._metrics.increment('rejected')
+            raise
+        self._metrics.increment('submitted')
+        return future
+
+    def process_all(self, requests: List[OrderRequest]) -> List[PipelineResult]:
+        # Submete tudo (respeitando a contrapressão) e devolve na ordem de entrada
+        futures = [self.submit(request) for request in requests]
+        return [future.result() for future in futures]
+
+    def stop(self, wait: bool = True):
+        # Os workers terminam o que já está na fila antes de sair
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(_STOP)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        return self._metrics.snapshot()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+
+            request, future, enqueued_at = job
+            self._metrics.stage('queue_wait').record(time.perf_counter() - enqueued_at)
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            with self._metrics.timer('total'):
+                result = self._process(request)
+            self._metrics.increment('completed' if result.succeeded else 'failed')
+            future.set_result(result)
+
+    def _process(self, request: OrderRequest) -> PipelineResult:
+        result = PipelineResult(request=request)
+        stage = 'stock_check'
+        try:
+            with self._metrics.timer(stage):
+                if not self._inventory_service.is_stock_sufficient(request.items):
+                    result.error = "Estoque insuficiente para um ou mais itens."
+                    result.failed_stage = stage
+                    return result
+
+            # A criação reserva o estoque atomicamente; a checagem acima só
+            # evita trabalho em pedidos que já se sabe que vão falhar
+            stage = 'create'
+            with self._metrics.timer(stage):
+                result.order_id = self._order_service.create_order(
+                    request.customer, request.items, request.is_special, request.idempotency_key
+                )
+
+            if request.payment_method is not None:
+                stage = 'payment'
+                with self._metrics.timer(stage):
+                    result.paid = self._payment_service.process_payment(
+                        result.order_id, request.payment_method, request.amount_paid or 0
+                    )
+                # Pagamento recusado: sem envio/entrega nem pontos de fidelidade
+                if not result.paid:
+                    result.error = "Pagamento não realizado."
+                    result.failed_stage = stage
+                    return result
+
+            if request.status_updates:
+                stage = 'status_update'
+                with self._metrics.timer(stage):
+                    for status in request.status_updates:
+                        self._order_service.update_order_status(result.order_id, status)
+        except Exception as e:
+            result.error = str(e)
+            result.failed_stage = stage
+
+        return result
@@ -1,29 +1,37 @@
 # services/order_service.py (CORRIGIDO E ATUALIZADO)
 
+from contextlib import nullcontext
 from datetime import datetime
-from typing import List
+from typing import ContextManager, Dict, List, Optional
 from models.customer import Customer
 from models.order import Order
 from models.order_item import OrderItem
-from interfaces.repository_interface import IOrderRepository
-from services.notification_service import NotificationService
+from models.money import Money
+from models.order_request import OrderRequest
+from interfaces.repository_interface import IOrderRepository, DuplicateOrderError
+from interfaces.id_generator_interface import IIdGenerator
+from interfaces.notification_interface import INotificationService
 from services.loyalty_service import LoyaltyService
 from services.inventory_service import InventoryService
-from interfaces.discount_interface import IDiscountStrategy, ICustomerDiscountStrategy, ISpecialOrderFeeStrategy
+from interfaces.discount_interface import IDiscountStrategy, ICustomerDiscountStrategy, ISpecialOrderFeeStrategy, IPricingEngine
+from strategies.pricing_engine import PricingEngine
 from models.enums import OrderStatus
-import random
+from monitoring.instrumentation import span, timed
 
 class OrderService:
     
     def __init__(
         self,
         order_repository: IOrderRepository,
-        notification_service: NotificationService,
+        notification_service: INotificationService,
         loyalty_service: LoyaltyService,
         inventory_service: InventoryService,
-        discount_strategy: IDiscountStrategy,
-        customer_discount_strategy: ICustomerDiscountStrategy,
-        special_fee_strategy: ISpecialOrderFeeStrategy
+        discount_strategy: Optional[IDiscountStrategy] = None,
+        customer_discount_strategy: Optional[ICustomerDiscountStrategy] = None,
+        special_fee_strategy: Optional[ISpecialOrderFeeStrategy] = None,
+        unit_of_work: Optional[ContextManager] = None,
+        id_generator: Optional[IIdGenerator] = None,
+        pricing_engine: Optional[IPricingEngine] = None
     ):
         self._order_repository = order_repository
         self._notification_service = notification_service
@@ -32,39 +40,142 @@ class OrderService:
         self._discount_strategy = discount_strategy
         self._customer_discount_strategy = customer_discount_strategy
         self._special_fee_strategy = special_fee_strategy
+        # Sem engine explícito, as três strategies (se todas informadas) mantêm
+        # o cálculo encadeado; caso contrário usa a tabela de regras padrão
+        strategies = (discount_strategy, customer_discount_strategy, special_fee_strategy)
+        if pricing_engine is None and None in strategies:
+            pricing_engine = PricingEngine()
+        self._pricing_engine = pricing_engine
+        # Contexto reentrante que agrupa a gravação do pedido e a da notificação
+        # numa transação (ex.: DatabaseManager persistente + outbox)
+        self._unit_of_work = unit_of_work or nullcontext()
+        # Só uma unidade de trabalho explícita desfaz a gravação do pedido
+        # quando uma etapa seguinte falha
+        self._transactional = unit_of_work is not None
+        # Sem gerador, o repositório atribui o ID (rowid do SQLite)
+        self._id_generator = id_generator
 
-    def create_order(self, customer: Customer, items: List[OrderItem], is_special: bool = False) -> int:
-        # A validação de estoque agora é delegada a outro serviço (DIP)
-        if not self._inventory_service.is_stock_sufficient(items):
-            raise ValueError("Estoque insuficiente para um ou mais itens.")
+    @timed("order_service.create_order")
+    def create_order(
+        self,
+        customer: Customer,
+        items: List[OrderItem],
+        is_special: bool = False,
+        idempotency_key: Optional[str] = None
+    ) -> int:
+        self._validate_items(items)
 
-        # Lógica de cálculo de total usando strategies
-        total = self._discount_strategy.calculate_discount(items)
-        total = self._customer_discount_strategy.apply_customer_discount(total, customer)
-        total = self._special_fee_strategy.apply_special_fee(total, is_special)
+        # Repetição de uma requisição já atendida: devolve o mesmo pedido sem
+        # reservar estoque nem notificar de novo
+        if idempotency_key is not None:
+            existing = self._order_repository.find_ids_by_idempotency_keys([idempotency_key])
+            if idempotency_key in existing:
+                return existing[idempotency_key]
 
-        order = Order(
-            id=random.randint(1, 1000000), 
-            customer=customer, 
-            items=items,
-            total_price=total, 
-            status=OrderStatus.PENDING,
-            created_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            is_special=is_special
-        )
-        
-        order_id = self._order_repository.add(order)
-        order.id = order_id
-        
-        self._notification_service.send_notification(order, OrderStatus.PENDING)
+        # A validação de estoque agora é delegada a outro serviço (DIP).
+        # A reserva já dá baixa no estoque, então pedidos concorrentes não
+        # conseguem vender a mesma unidade duas vezes.
+        with span("inventory.reserve"):
+            reservation_id = self._inventory_service.reserve(items)
+        if reservation_id is None:
+            raise ValueError("Estoque insuficiente para um ou mais itens.")
+
+        order_id = None
+        try:
+            order = self._build_order(customer, items, is_special, idempotency_key)
+            
+            with self._unit_of_work:
+                order_id = self._order_repository.add(order)
+                order.id = order_id
+                
+                with span("notification.send"):
+                    self._notification_service.send_notification(order, OrderStatus.PENDING)
+                self._inventory_service.commit_reservation(reservation_id, order_id)
+        except DuplicateOrderError as e:
+            # Outra requisição com a mesma chave gravou primeiro
+            self._inventory_service.release_reservation(reservation_id)
+            return e.order_id
+        except Exception:
+            self._settle_failed_reservation(reservation_id, order_id is not None, order_id)
+            raise
         
         return order_id
 
+    @timed("order_service.create_orders")
+    def create_orders(self, requests: List[OrderRequest]) -> List[int]:
+        # Caminho em lote para importação: valida tudo antes de gravar e
+        # persiste o lote inteiro numa única transação. Devolve os IDs na
+        # ordem das requisições; chaves de idempotência repetidas (no lote ou
+        # já gravadas) resolvem para o pedido existente.
+        for request in requests:
+            self._validate_items(request.items)
+
+        # Uma nova tentativa cobre a corrida com outro lote gravando as mesmas chaves
+        for attempt in range(2):
+            try:
+                return self._create_orders_once(requests)
+            except DuplicateOrderError:
+                if attempt:
+                    raise
+
+    def _create_orders_once(self, requests: List[OrderRequest]) -> List[int]:
+        keys = [r.idempotency_key for r in requests if r.idempotency_key is not None]
+        ids_by_key: Dict[str, int] = self._order_repository.find_ids_by_idempotency_keys(keys) if keys else {}
+
+        # Só as requisições com chave inédita (primeira ocorrência) viram pedidos
+        new_requests = []
+        seen_keys = set(ids_by_key)
+        for request in requests:
+            if request.idempotency_key is None:
+                new_requests.append(request)
+            elif request.idempotency_key not in seen_keys:
+                seen_keys.add(request.idempotency_key)
+                new_requests.append(request)
+        if not new_requests:
+            return [ids_by_key[r.idempotency_key] for r in requests]
+
+        with span("inventory.reserve"):
+            reservation_id = self._inventory_service.reserve([item for r in new_requests for item in r.items])
+        if reservation_id is None:
+            raise ValueError("Estoque insuficiente para um ou mais itens do lote.")
+
+        order_ids = None
+        try:
+            orders = [self._build_order(r.customer, r.items, r.is_special, r.idempotency_key) for r in new_requests]
+            with self._unit_of_work:
+                order_ids = self._order_repository.add_many(orders)
+
+                for order, order_id in zip(orders, order_ids):
+                    order.id = order_id
+                    with span("notification.send"):
+                        self._notification_service.send_notification(order, OrderStatus.PENDING)
+                self._inventory_service.commit_reservation(reservation_id)
+        except Exception:
+            self._settle_failed_reservation(reservation_id, order_ids is not None)
+            raise
+
+        # Mapeia cada requisição (inclusive as repetidas) para o seu pedido
+        new_ids = iter(order_ids)
+        result = []
+        for request in requests:
+            key = request.idempotency_key
+            if key is not None and key in ids_by_key:
+                result.append(ids_by_key[key])
+                continue
+            order_id = next(new_ids)
+            if key is not None:
+                ids_by_key[key] = order_id
+            result.append(order_id)
+        return result
+
+    @timed("order_service.update_order_status")
     def update_order_status(self, order_id: int, new_status: OrderStatus):
         order = self._order_repository.get_by_id(order_id)
         if order:
-            self._order_repository.update_status(order_id, new_status)
-            self._notification_service.send_notification(order, new_status)
+            with self._unit_of_work:
+                self._order_repository.update_status(order_id, new_status)
+                with span("notification.send"):
+                    self._notification_service.send_notification(order, new_status)
             
             # Orquestra a chamada para o serviço de pontos (SRP)
             if new_status == OrderStatus.DELIVERED:
@@ -72,3 +183,56 @@ class OrderService:
         else:
             print(f"Pedido com ID {order_id} não encontrado.")
 
+    def _build_order(
+        self,
+        customer: Customer,
+        items: List[OrderItem],
+        is_special: bool,
+        idempotency_key: Optional[str] = None
+    ) -> Order:
+        # A tabela de regras é escolhida pelo tipo do cliente, sem estado
+        # mutável no serviço (seguro entre threads)
+        if self._pricing_engine is not None:
+            with span("pricing.calculate_total"):
+                total = self._pricing_engine.calculate_total(items, customer, is_special)
+        else:
+            total = self._chain_strategies(customer, items, is_special)
+
+        return Order(
+            customer=customer, 
+            items=items,
+            id=self._id_generator.next_id() if self._id_generator else None,
+            total_price=total, 
+            status=OrderStatus.PENDING,
+            created_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            is_special=is_special,
+            idempotency_key=idempotency_key
+        )
+
+    def _chain_strategies(self, customer: Customer, items: List[OrderItem], is_special: bool) -> Money:
+        # Cálculo original, uma strategy por etapa
+        with span("strategy.item_discount"):
+            total = self._discount_strategy.calculate_discount(items)
+        with span("strategy.customer_discount"):
+            total = self._customer_discount_strategy.apply_customer_discount(total, customer)
+        with span("strategy.special_fee"):
+            total = self._special_fee_strategy.apply_special_fee(total, is_special)
+        return total
+
+    def _settle_failed_reservation(self, reservation_id: str, persisted: bool, order_id: Optional[int] = None):
+        # Com unidade de trabalho transacional a falha desfez a gravação e o
+        # estoque volta. Sem ela o pedido já está gravado: a reserva é
+        # confirmada para que o mesmo estoque não seja vendido duas vezes.
+        if persisted and not self._transactional:
+            self._inventory_service.commit_reservation(reservation_id, order_id)
+        else:
+            self._inventory_service.release_reservation(reservation_id)
+
+    def _validate_items(self, items: List[OrderItem]):
+        if not items:
+            raise ValueError("Pedido sem itens.")
+        for item in items:
+            if item.price < 0:
+                raise ValueError(f"Preço inválido para {item.name}: {item.price}")
+            if item.quantity <= 0:
+                raise ValueError(f"Quantidade inválida para {item.name}: {item.quantity}")
@@ -0,0 +1,18 @@
+# services/outbox_notification_service.py
+
+from typing import List
+from interfaces.notification_interface import INotificationService
+from interfaces.outbox_interface import INotificationOutbox
+from models.order import Order
+from models.enums import OrderStatus
+
+class OutboxNotificationService(INotificationService):
+    # Em vez de enviar na hora, grava uma mensagem por canal no outbox.
+    # O envio fica com o NotificationDispatcher, fora do caminho do pedido.
+    
+    def __init__(self, outbox: INotificationOutbox, channels: List[str]):
+        self._outbox = outbox
+        self._channels = list(channels)
+    
+    def send_notification(self, order: Order, status: OrderStatus):
+        self._outbox.enqueue(order, status, self._channels)
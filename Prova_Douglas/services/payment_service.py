@@ -2,10 +2,12 @@
 
 from typing import Dict, Optional
 from models.order import Order
+from models.money import Money
 from strategies.payment_strategy import IPaymentStrategy
 from services.order_service import OrderService
 from interfaces.repository_interface import IOrderRepository
 from models.enums import OrderStatus, PaymentMethod
+from monitoring.instrumentation import span, timed
 
 class PaymentService:
     def __init__(
@@ -25,12 +27,14 @@ class PaymentService:
             print("Pedido não encontrado!")
             return None
         
-        if amount_paid < order.total_price:
+        # O valor pago chega em reais; comparado já em centavos
+        if Money.of(amount_paid) < order.total_price:
             print("Valor pago é insuficiente!")
             return None
             
         return order
 
+    @timed("payment_service.process_payment")
     def process_payment(self, order_id: int, method: PaymentMethod, amount_paid: float) -> bool:
         
         order = self._get_and_validate_order(order_id, amount_paid)
@@ -42,9 +46,11 @@ class PaymentService:
             print("Método de pagamento inválido!")
             return False
             
-        payment_approved = strategy.process_payment(order, amount_paid)
+        with span("strategy.payment"):
+            payment_approved = strategy.process_payment(order, amount_paid)
         
         if payment_approved:
             self._order_service.update_order_status(order_id, OrderStatus.APPROVED)
             
-        return True
\ No newline at end of file
+        # Mesmo contrato do AsyncPaymentService: devolve a aprovação
+        return payment_approved
\ No newline at end of file
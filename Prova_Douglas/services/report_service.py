@@ -1,18 +1,62 @@
 # services/report_service.py
 
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
 from interfaces.repository_interface import IOrderRepository
-from models.enums import ReportType
+from models.enums import OrderStatus, ReportType
+from models.money import Money
+from repositories.order_repository import iter_order_rows_readonly
+
+
+def format_sales_line(order_id: int, customer_name: str, total: Money, status_value: str) -> str:
+    return f"Pedido #{order_id} Cliente: {customer_name} Total: R${total:.2f} Status: {status_value}\n"
+
+
+def scan_sales_shard(db_path: str, first_id: int, last_id: int, part_path: str) -> Tuple[int, int]:
+    # Executa num processo do pool: varre uma faixa de IDs com conexão
+    # somente leitura, grava as linhas num arquivo parcial e devolve
+    # (total em centavos, quantidade de pedidos) para a junção
+    total_cents = 0
+    count = 0
+    with open(part_path, 'w') as f:
+        for rows in iter_order_rows_readonly(db_path, first_id, last_id):
+            # row segue ORDER_COLUMNS: id, customer_name, customer_type, total_cents, status, created_at
+            f.writelines(format_sales_line(row[0], row[1], Money(row[3]), row[4]) for row in rows)
+            total_cents += sum(row[3] for row in rows)
+            count += len(rows)
+    return total_cents, count
+
 
 class ReportService:
-    def __init__(self, order_repository: IOrderRepository):
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        workers: int = 1,
+        shard_size: int = 250_000,
+        print_lines: bool = True
+    ):
         # Simplifica o nome da variável interna
         self._order_repo = order_repository
+        # workers > 1 liga o relatório de vendas paralelo: os pedidos são
+        # divididos em fatias de até shard_size linhas, varridas num pool de processos
+        self._workers = workers
+        self._shard_size = shard_size
+        # print_lines=False deixa as linhas de pedido do relatório de vendas
+        # só no arquivo (milhões de linhas no console custam mais que o
+        # relatório); nos dois modos são impressos o cabeçalho, a quantidade
+        # de pedidos e o total
+        self._print_lines = print_lines
         
         # Cria um mapeamento de métodos no construtor.
         # Isso adere ao OCP ao eliminar a cadeia 'if/elif' no método principal.
         self._report_generators = {
             ReportType.SALES: self._generate_sales_report,
-            ReportType.CLIENTS: self._generate_clients_report
+            ReportType.CLIENTS: self._generate_clients_report,
+            ReportType.DAILY: self._generate_daily_report
         }
 
     def generate_report(self, report_type: ReportType):
@@ -27,34 +71,90 @@ class ReportService:
             print("Tipo de relatório inválido.")
 
     def _generate_sales_report(self):
-        orders = self._order_repo.get_all()
-        print("=== RELATÓRIO DE VENDAS ===")
-        total_sales = 0
-        report_content = ""
-        for order in orders:
-            line = f"Pedido #{order.id} Cliente: {order.customer.name} Total: R${order.total_price:.2f} Status: {order.status.value}\n"
-            print(line.strip())
-            report_content += line
-            total_sales += order.total_price
-            
-        summary_line = f"Total Geral: R${total_sales:.2f}\n"
-        print(summary_line.strip())
-        report_content += summary_line
+        db_path = self._order_repo.get_database_path()
+        if self._workers > 1 and db_path is not None:
+            self._generate_sales_report_parallel(db_path)
+            return
 
+        # Relatório em streaming: cada pedido é lido em lotes e escrito direto
+        # no arquivo, sem carregar a tabela nem montar o conteúdo em memória
+        print("=== RELATÓRIO DE VENDAS ===")
+        total_sales = Money(0)
+        order_count = 0
         with open('rel_vendas.txt', 'w') as f:
-            f.write(report_content)
+            for order in self._order_repo.iter_all():
+                line = format_sales_line(order.id, order.customer.name, order.total_price, order.status.value)
+                if self._print_lines:
+                    print(line.strip())
+                f.write(line)
+                total_sales += order.total_price
+                order_count += 1
+                
+            summary_line = f"Total Geral: R${total_sales:.2f}\n"
+            if not self._print_lines:
+                print(f"Pedidos: {order_count}")
+            print(summary_line.strip())
+            f.write(summary_line)
+
+    def _generate_sales_report_parallel(self, db_path: str):
+        # Mesmo arquivo e mesma saída no console do modo serial, montados a
+        # partir das fatias na ordem dos IDs. A faixa é fixada no início,
+        # então pedidos criados durante a geração ficam para o próximo relatório.
+        print("=== RELATÓRIO DE VENDAS ===")
+        # Contagem vem do agregado por status (O(1)); as fatias são por
+        # quantidade de linhas, não por largura da faixa de IDs
+        order_count = sum(self._order_repo.get_status_counts().values())
+        rows_per_shard = max(1, min(self._shard_size, -(-order_count // self._workers)))
+        shards = self._order_repo.get_id_shards(rows_per_shard)
+        
+        # Parciais no mesmo diretório do relatório: a junção é só cópia sequencial
+        with tempfile.TemporaryDirectory(prefix='rel_vendas_', dir='.') as tmp:
+            part_paths = [os.path.join(tmp, f'parte_{index:05d}.txt') for index in range(len(shards))]
+            with ProcessPoolExecutor(max_workers=min(self._workers, len(shards) or 1)) as executor:
+                futures = [
+                    executor.submit(scan_sales_shard, os.path.abspath(db_path), first_id, last_id, part_path)
+                    for (first_id, last_id), part_path in zip(shards, part_paths)
+                ]
+                partials = [future.result() for future in futures]
+
+            total_sales = Money(sum(total_cents for total_cents, _ in partials))
+            with open('rel_vendas.txt', 'wb') as f:
+                for part_path in part_paths:
+                    with open(part_path, 'rb') as part:
+                        shutil.copyfileobj(part, f)
+                    if self._print_lines:
+                        with open(part_path) as part:
+                            shutil.copyfileobj(part, sys.stdout)
+                summary_line = f"Total Geral: R${total_sales:.2f}\n"
+                f.write(summary_line.encode())
+        
+        if not self._print_lines:
+            print(f"Pedidos: {sum(count for _, count in partials)}")
+        print(summary_line.strip())
 
     def _generate_clients_report(self):
-        customers = self._order_repo.get_distinct_customers()
+        # Totais por cliente lidos do agregado mantido na gravação (O(clientes))
+        summaries = self._order_repo.get_customer_totals()
         print("=== RELATÓRIO DE CLIENTES ===")
-        report_content = ""
-        for customer in customers:
-            # Assume que o repositório suporta esta busca
-            orders = self._order_repo.get_all_by_customer(customer.name) 
-            total_spent = sum(order.total_price for order in orders)
-            line = f"Cliente: {customer.name} ({customer.customer_type.value}) - Total gasto: R${total_spent:.2f}\n"
-            print(line.strip())
-            report_content += f"{customer.name},{customer.customer_type.value}\n"
-            
         with open('rel_clientes.txt', 'w') as f:
-            f.write(report_content)
\ No newline at end of file
+            for summary in summaries:
+                customer = summary.customer
+                line = f"Cliente: {customer.name} ({customer.customer_type.value}) - Total gasto: R${summary.total_spent:.2f}\n"
+                print(line.strip())
+                f.write(f"{customer.name},{customer.customer_type.value}\n")
+
+    def _generate_daily_report(self):
+        # Receita por dia e pedidos por status, lidos dos agregados mantidos
+        # na gravação: custo O(dias), independente do tamanho de orders
+        print("=== RELATÓRIO DIÁRIO ===")
+        status_counts = self._order_repo.get_status_counts()
+        with open('rel_diario.txt', 'w') as f:
+            for day in self._order_repo.get_daily_revenue():
+                line = f"Dia: {day.day} Pedidos: {day.order_count} Receita: R${day.total:.2f}\n"
+                print(line.strip())
+                f.write(line)
+
+            for status in OrderStatus:
+                line = f"Status: {status.value} Pedidos: {status_counts.get(status, 0)}\n"
+                print(line.strip())
+                f.write(line)
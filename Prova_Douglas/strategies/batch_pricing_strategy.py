@@ -0,0 +1,83 @@
+from typing import List, Optional
+from interfaces.discount_interface import IBatchPricingStrategy
+from models.money import Money, round_ratio
+from models.order_request import OrderRequest
+from models.pricing_columns import PricingColumns
+from strategies.pricing_engine import PricingEngine, PricingTable
+
+# NumPy é opcional: sem ele o cálculo em lote usa o laço em Python puro
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BatchPricingStrategy(IBatchPricingStrategy):
+    """
+    Calcula o total de muitos pedidos de uma vez a partir de colunas
+    (centavos, quantidade, código do tipo de item por linha).
+    Os fatores vêm só da tabela compilada de um PricingEngine (e acompanham
+    as recargas dele): o desconto de cada pedido é o do customer_type da
+    linha, com os mesmos arredondamentos, na mesma ordem, de
+    PricingEngine.calculate_total, então os totais são idênticos aos do
+    cálculo pedido a pedido no OrderService que usa o mesmo engine.
+    Sem engine, usa as regras padrão (DEFAULT_PRICING_RULES); regras
+    próprias entram por PricingEngine(PricingRules(...)).
+    """
+
+    def __init__(self, engine: Optional[PricingEngine] = None, use_numpy: bool = True):
+        self._engine = engine or PricingEngine()
+        self._use_numpy = use_numpy and np is not None
+
+    def calculate_totals(self, columns: PricingColumns) -> List[Money]:
+        # Uma leitura da tabela por lote: o lote inteiro usa a mesma versão
+        table = self._engine.table
+        if self._use_numpy:
+            return self._calculate_numpy(columns, table)
+        return self._calculate_python(columns, table)
+
+    def price_requests(self, requests: List[OrderRequest]) -> List[Money]:
+        return self.calculate_totals(PricingColumns.from_requests(requests))
+
+    def get_engine(self) -> str:
+        return "numpy" if self._use_numpy else "python"
+
+    def _calculate_numpy(self, columns: PricingColumns, table: PricingTable) -> List[Money]:
+        item_codes = np.asarray(columns.item_type_codes, dtype=np.intp)
+        customer_codes = np.asarray(columns.customer_type_codes, dtype=np.intp)
+        item_ratios = np.asarray(table.item_ratios, dtype=np.int64)
+        customer_ratios = np.asarray(table.customer_ratios, dtype=np.int64)
+
+        lines = np.asarray(columns.price_cents, dtype=np.int64) * np.asarray(columns.quantities, dtype=np.int64)
+        lines = _round_ratio_array(lines * item_ratios[item_codes, 0], item_ratios[item_codes, 1])
+
+        # Soma inteira por pedido (add.at é exato, sem passar por float)
+        totals = np.zeros(columns.order_count, dtype=np.int64)
+        np.add.at(totals, np.asarray(columns.order_index, dtype=np.intp), lines)
+
+        totals = _round_ratio_array(totals * customer_ratios[customer_codes, 0], customer_ratios[customer_codes, 1])
+
+        special = np.asarray(columns.is_special, dtype=bool)
+        fee_numerator, fee_denominator = table.special_fee_ratio
+        totals = np.where(special, _round_ratio_array(totals * fee_numerator, fee_denominator), totals)
+        return [Money(cents) for cents in totals.tolist()]
+
+    def _calculate_python(self, columns: PricingColumns, table: PricingTable) -> List[Money]:
+        totals = [0] * columns.order_count
+        for index, cents, quantity, code in zip(columns.order_index, columns.price_cents, columns.quantities, columns.item_type_codes):
+            numerator, denominator = table.item_ratios[code]
+            totals[index] += round_ratio(cents * quantity * numerator, denominator)
+
+        fee_numerator, fee_denominator = table.special_fee_ratio
+        for index, code in enumerate(columns.customer_type_codes):
+            numerator, denominator = table.customer_ratios[code]
+            totals[index] = round_ratio(totals[index] * numerator, denominator)
+            if columns.is_special[index]:
+                totals[index] = round_ratio(totals[index] * fee_numerator, fee_denominator)
+        return [Money(cents) for cents in totals]
+
+
+def _round_ratio_array(numerators, denominators):
+    # Versão vetorizada de round_ratio (empates afastando-se do zero)
+    magnitude = (2 * np.abs(numerators) + denominators) // (2 * denominators)
+    return np.where(numerators < 0, -magnitude, magnitude)
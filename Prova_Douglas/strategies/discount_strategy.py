@@ -1,21 +1,30 @@
+from decimal import Decimal
 from typing import List
 from interfaces.discount_interface import IDiscountStrategy, ICustomerDiscountStrategy, ISpecialOrderFeeStrategy
 from models.order_item import OrderItem
 from models.customer import Customer
 from models.enums import CustomerType, ItemType
+from models.money import Money
+
+# Fatores de preço compartilhados pelo cálculo item a item e pelo cálculo em lote.
+# Cada aplicação de fator arredonda o resultado ao centavo (ver Money).
+ITEM_DISCOUNT_FACTORS = {
+    ItemType.NORMAL: Decimal('1'),
+    ItemType.DESC10: Decimal('0.9'),  # 10% de desconto
+    ItemType.DESC20: Decimal('0.8'),  # 20% de desconto
+}
+VIP_DISCOUNT_FACTOR = Decimal('0.95')  # 5% de desconto VIP
+SPECIAL_FEE_FACTOR = Decimal('1.15')  # 15% de taxa especial
 
 
 class ItemDiscountStrategy(IDiscountStrategy):
     
-    def calculate_discount(self, items: List[OrderItem]) -> float:
-        total = 0
+    def calculate_discount(self, items: List[OrderItem]) -> Money:
+        total = Money(0)
         for item in items:
-            if item.item_type == ItemType.NORMAL:
-                total += item.price * item.quantity
-            elif item.item_type == ItemType.DESC10:
-                total += item.price * item.quantity * 0.9  # 10% de desconto
-            elif item.item_type == ItemType.DESC20:
-                total += item.price * item.quantity * 0.8  # 20% de desconto
+            factor = ITEM_DISCOUNT_FACTORS.get(item.item_type)
+            if factor is not None:
+                total += item.price * item.quantity * factor
         
         return total
     
@@ -25,7 +34,7 @@ class ItemDiscountStrategy(IDiscountStrategy):
 
 class NormalCustomerStrategy(ICustomerDiscountStrategy):
     
-    def apply_customer_discount(self, total: float, customer: Customer) -> float:
+    def apply_customer_discount(self, total: Money, customer: Customer) -> Money:
         if customer.customer_type == CustomerType.NORMAL:
             return total  # Sem desconto adicional
         return total  # Para outros tipos, não aplica desconto
@@ -36,9 +45,9 @@ class NormalCustomerStrategy(ICustomerDiscountStrategy):
 
 class VIPCustomerStrategy(ICustomerDiscountStrategy):
     
-    def apply_customer_discount(self, total: float, customer: Customer) -> float:
+    def apply_customer_discount(self, total: Money, customer: Customer) -> Money:
         if customer.customer_type == CustomerType.VIP:
-            return total * 0.95  # 5% de desconto VIP
+            return total * VIP_DISCOUNT_FACTOR
         return total  # Para outros tipos, não aplica desconto
     
     def get_customer_type(self) -> CustomerType:
@@ -47,9 +56,9 @@ class VIPCustomerStrategy(ICustomerDiscountStrategy):
 
 class SpecialOrderFeeStrategy(ISpecialOrderFeeStrategy):
     
-    def apply_special_fee(self, total: float, is_special: bool) -> float:
+    def apply_special_fee(self, total: Money, is_special: bool) -> Money:
         if is_special:
-            return total * 1.15  # 15% de taxa especial
+            return total * SPECIAL_FEE_FACTOR
         return total  # Sem taxa para pedidos normais
 
 
@@ -0,0 +1,217 @@
+import csv
+import io
+import json
+import struct
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence
+from interfaces.export_interface import IExportWriter, ExportColumn
+
+
+class CSVExportWriter(IExportWriter):
+    
+    def __init__(self, delimiter: str = ','):
+        self._delimiter = delimiter
+        self._text: Optional[io.TextIOWrapper] = None
+        self._writer = None
+    
+    def begin(self, stream: BinaryIO, columns: Sequence[ExportColumn]) -> None:
+        # newline='' deixa o módulo csv controlar as quebras de linha
+        self._text = io.TextIOWrapper(stream, encoding='utf-8', newline='', write_through=True)
+        self._writer = csv.writer(self._text, delimiter=self._delimiter)
+        self._writer.writerow([name for name, _ in columns])
+    
+    def write_chunk(self, rows: Sequence[tuple]) -> None:
+        self._writer.writerows(rows)
+    
+    def end(self) -> None:
+        # Solta o stream binário sem fechá-lo; quem abriu o arquivo o fecha
+        self._text.flush()
+        self._text.detach()
+        self._text = self._writer = None
+    
+    def get_format(self) -> str:
+        return "csv"
+    
+    def get_extension(self) -> str:
+        return ".csv"
+
+
+class JSONLinesExportWriter(IExportWriter):
+    # Um objeto JSON por linha: cada lote vira um único write
+    
+    def __init__(self):
+        self._stream: Optional[BinaryIO] = None
+        self._names: List[str] = []
+    
+    def begin(self, stream: BinaryIO, columns: Sequence[ExportColumn]) -> None:
+        self._stream = stream
+        self._names = [name for name, _ in columns]
+    
+    def write_chunk(self, rows: Sequence[tuple]) -> None:
+        names = self._names
+        lines = [json.dumps(dict(zip(names, row)), ensure_ascii=False) for row in rows]
+        if lines:
+            self._stream.write(("\n".join(lines) + "\n").encode('utf-8'))
+    
+    def end(self) -> None:
+        self._stream = None
+    
+    def get_format(self) -> str:
+        return "jsonl"
+    
+    def get_extension(self) -> str:
+        return ".jsonl"
+
+
+# Formato colunar binário (little-endian):
+#   MAGIC | u32 tamanho + esquema JSON | blocos... | u32 0 (fim)
+# Cada bloco: u32 n_linhas e, para cada coluna na ordem do esquema,
+#   int   -> u8 typecode do array ('b', 'h', 'i' ou 'q': a menor largura que
+#            comporta o lote) + n valores
+#   float -> n valores float64
+#   str   -> u8 codificação:
+#            0 = texto puro: n+1 offsets uint32 + bytes UTF-8 concatenados
+#            1 = dicionário: u32 k + k+1 offsets + bytes dos k valores
+#                distintos + u8 typecode + n códigos (índices no dicionário)
+# Valores nulos não são suportados (as colunas exportadas são NOT NULL na prática:
+# int/float nulos viram 0 e textos nulos viram '').
+COLUMNAR_MAGIC = b'LOJACOL1'
+
+# Typecodes inteiros do mais estreito ao mais largo, com seus limites
+_INT_WIDTHS = [('b', 2 ** 7), ('h', 2 ** 15), ('i', 2 ** 31), ('q', 2 ** 63)]
+_UNSIGNED_WIDTHS = [('B', 2 ** 8), ('H', 2 ** 16), ('I', 2 ** 32)]
+
+
+class ColumnarExportWriter(IExportWriter):
+    # Compacto e rápido de ler por coluna (ex.: somar total_cents sem
+    # decodificar os nomes). Lido de volta com read_columnar().
+    
+    def __init__(self):
+        self._stream: Optional[BinaryIO] = None
+        self._types: List[str] = []
+    
+    def begin(self, stream: BinaryIO, columns: Sequence[ExportColumn]) -> None:
+        self._stream = stream
+        self._types = [column_type for _, column_type in columns]
+        for column_type in self._types:
+            if column_type not in ('int', 'float', 'str'):
+                raise ValueError(f"Tipo de coluna não suportado: {column_type}")
+        schema = json.dumps([{'name': name, 'type': column_type} for name, column_type in columns]).encode('utf-8')
+        stream.write(COLUMNAR_MAGIC + struct.pack('<I', len(schema)) + schema)
+    
+    def write_chunk(self, rows: Sequence[tuple]) -> None:
+        if not rows:
+            return
+        parts = [struct.pack('<I', len(rows))]
+        for index, column_type in enumerate(self._types):
+            values = [row[index] for row in rows]
+            if column_type == 'str':
+                parts.extend(_encode_strings([value or '' for value in values]))
+            elif column_type == 'int':
+                values = [value or 0 for value in values]
+                typecode = _narrowest(_INT_WIDTHS, min(values), max(values))
+                parts.append(typecode.encode('ascii'))
+                parts.append(_to_little_endian(array(typecode, values)))
+            else:
+                parts.append(_to_little_endian(array('d', [value or 0.0 for value in values])))
+        self._stream.write(b''.join(parts))
+    
+    def end(self) -> None:
+        self._stream.write(struct.pack('<I', 0))
+        self._stream = None
+    
+    def get_format(self) -> str:
+        return "columnar"
+    
+    def get_extension(self) -> str:
+        return ".col"
+
+
+def _narrowest(widths, low: int, high: int) -> str:
+    signed = widths[0][0].islower()
+    for typecode, limit in widths:
+        if (-limit if signed else 0) <= low and high < limit:
+            return typecode
+    raise OverflowError("Valor fora da faixa suportada pelo formato colunar.")
+
+
+def _pack_strings(strings: List[str]) -> List[bytes]:
+    encoded = [value.encode('utf-8') for value in strings]
+    offsets = array('I', [0])
+    position = 0
+    for data in encoded:
+        position += len(data)
+        offsets.append(position)
+    return [_to_little_endian(offsets), b''.join(encoded)]
+
+
+def _encode_strings(values: List[str]) -> List[bytes]:
+    # Colunas repetitivas (tipo de cliente, status, data) viram dicionário +
+    # códigos de 1-2 bytes; as demais ficam como texto puro
+    dictionary = {}
+    codes = [dictionary.setdefault(value, len(dictionary)) for value in values]
+    if len(dictionary) * 2 > len(values):
+        return [b'\x00'] + _pack_strings(values)
+    typecode = _narrowest(_UNSIGNED_WIDTHS, 0, len(dictionary) - 1)
+    return (
+        [b'\x01', struct.pack('<I', len(dictionary))]
+        + _pack_strings(list(dictionary))
+        + [typecode.encode('ascii'), _to_little_endian(array(typecode, codes))]
+    )
+
+
+def _read_strings(stream: BinaryIO, count: int) -> List[str]:
+    offsets = _read_array(stream, 'I', count + 1)
+    data = _read_exact(stream, offsets[-1])
+    return [data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(count)]
+
+
+def _to_little_endian(values: array) -> bytes:
+    if struct.pack('=I', 1) != struct.pack('<I', 1):
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Arquivo colunar truncado.")
+    return data
+
+
+def _read_array(stream: BinaryIO, typecode: str, count: int) -> array:
+    values = array(typecode)
+    values.frombytes(_read_exact(stream, values.itemsize * count))
+    if struct.pack('=I', 1) != struct.pack('<I', 1):
+        values.byteswap()
+    return values
+
+
+def read_columnar(stream: BinaryIO) -> Iterator[Dict[str, list]]:
+    # Lê um arquivo do ColumnarExportWriter bloco a bloco: {coluna: valores}
+    if _read_exact(stream, len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Arquivo não está no formato colunar esperado.")
+    schema_size, = struct.unpack('<I', _read_exact(stream, 4))
+    schema = json.loads(_read_exact(stream, schema_size).decode('utf-8'))
+
+    while True:
+        n_rows, = struct.unpack('<I', _read_exact(stream, 4))
+        if n_rows == 0:
+            return
+        block = {}
+        for column in schema:
+            if column['type'] == 'str':
+                if _read_exact(stream, 1) == b'\x00':
+                    block[column['name']] = _read_strings(stream, n_rows)
+                else:
+                    size, = struct.unpack('<I', _read_exact(stream, 4))
+                    dictionary = _read_strings(stream, size)
+                    typecode = _read_exact(stream, 1).decode('ascii')
+                    block[column['name']] = [dictionary[code] for code in _read_array(stream, typecode, n_rows)]
+            elif column['type'] == 'int':
+                typecode = _read_exact(stream, 1).decode('ascii')
+                block[column['name']] = _read_array(stream, typecode, n_rows).tolist()
+            else:
+                block[column['name']] = _read_array(stream, 'd', n_rows).tolist()
+        yield block
@@ -1,3 +1,6 @@
+import threading
+import time
+from typing import List
 from interfaces.notification_interface import INotificationStrategy
 from models.order import Order
 from models.enums import OrderStatus
@@ -101,3 +104,111 @@ class WhatsAppNotificationStrategy(INotificationStrategy):
             OrderStatus.DELIVERED: "Pedido entregue!"
         }
         return messages.get(status, "Status atualizado!")
+
+
+class FakeNotificationStrategy(INotificationStrategy):
+    """
+    Canal local para benchmarks: não imprime nada, só conta as mensagens.
+    submission_latency simula o custo fixo de cada chamada ao provedor
+    (uma por send_notification ou uma por lote em send_many).
+    """
+    
+    def __init__(self, method: str = "fake", submission_latency: float = 0.0):
+        self._method = method
+        self._latency = submission_latency
+        self._lock = threading.Lock()
+        self.messages_sent = 0
+        self.submissions = 0
+    
+    def send_notification(self, order: Order, status: OrderStatus) -> bool:
+        return self.send_many([order], status) == 1
+    
+    def send_many(self, orders: List[Order], status: OrderStatus) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        with self._lock:
+            self.messages_sent += len(orders)
+            self.submissions += 1
+        return len(orders)
+    
+    def get_notification_method(self) -> str:
+        return self._method
+
+
+class BatchingNotificationStrategy(INotificationStrategy):
+    """
+    Decorator que agrupa as mensagens de um canal e as envia com send_many,
+    quando o lote enche ou a cada flush_interval segundos (ex.: uma
+    submissão de SMS em massa por segundo). Mensagens do mesmo status são
+    agrupadas juntas.
+    """
+    
+    def __init__(self, strategy: INotificationStrategy, max_batch: int = 500, flush_interval: float = 1.0):
+        self._strategy = strategy
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._pending = {}  # status -> lista de pedidos
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+    
+    def send_notification(self, order: Order, status: OrderStatus) -> bool:
+        return self.send_many([order], status) == 1
+    
+    def send_many(self, orders: List[Order], status: OrderStatus) -> int:
+        full_batches = []
+        with self._lock:
+            pending = self._pending.setdefault(status, [])
+            pending.extend(orders)
+            while len(pending) >= self._max_batch:
+                full_batches.append(pending[:self._max_batch])
+                del pending[:self._max_batch]
+        for index, batch in enumerate(full_batches):
+            try:
+                self._strategy.send_many(batch, status)
+            except Exception as e:
+                # Como no flush: o lote que falhou e os seguintes voltam para
+                # a frente da fila e são reenviados no próximo ciclo
+                self._requeue([(status, orders) for orders in full_batches[index:]])
+                print(f"Erro ao enviar lote de notificações ({self.get_notification_method()}): {e}")
+                break
+        # As mensagens foram aceitas; o envio efetivo pode ocorrer no próximo flush
+        return len(orders)
+    
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        sent = 0
+        batches = [(status, orders) for status, orders in pending.items() if orders]
+        for index, (status, orders) in enumerate(batches):
+            try:
+                sent += self._strategy.send_many(orders, status)
+            except Exception:
+                # O lote que falhou e os seguintes voltam para a frente da fila
+                self._requeue(batches[index:])
+                raise
+        return sent
+    
+    def close(self):
+        self._stop_event.set()
+        self._flusher.join()
+        self.flush()
+    
+    def get_notification_method(self) -> str:
+        return self._strategy.get_notification_method()
+    
+    def _flush_periodically(self):
+        # Uma falha do canal não pode matar a thread: o lote fica na fila e
+        # é reenviado no próximo ciclo
+        while not self._stop_event.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Erro ao enviar lote de notificações ({self.get_notification_method()}): {e}")
+    
+    def _requeue(self, batches):
+        # De trás para frente: cada lote entra à frente dos que vêm depois dele
+        with self._lock:
+            for status, orders in reversed(batches):
+                self._pending[status] = orders + self._pending.get(status, [])
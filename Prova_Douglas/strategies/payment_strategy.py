@@ -1,4 +1,7 @@
-from interfaces.payment_interface import IPaymentStrategy
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+from interfaces.payment_interface import IPaymentStrategy, IAsyncPaymentStrategy
 from models.order import Order
 from models.enums import PaymentMethod
 
@@ -44,3 +47,40 @@ class BoletoPaymentStrategy(IPaymentStrategy):
         return False  # Boleto não aprova automaticamente
 
 
+class AsyncPaymentStrategyAdapter(IAsyncPaymentStrategy):
+    # Expõe uma strategy bloqueante como assíncrona, executando-a num
+    # executor (o padrão do loop quando nenhum é informado)
+    def __init__(self, strategy: IPaymentStrategy, executor: Optional[Executor] = None):
+        self._strategy = strategy
+        self._executor = executor
+    
+    async def process_payment(self, order: Order, amount: float) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._strategy.process_payment, order, amount)
+    
+    def get_payment_method(self) -> PaymentMethod:
+        return self._strategy.get_payment_method()
+    
+    def requires_approval(self) -> bool:
+        return self._strategy.requires_approval()
+
+
+class AsyncGatewayPaymentStrategy(IAsyncPaymentStrategy):
+    # Gateway remoto simulado: a latência da resposta é aguardada no
+    # event loop, então milhares de pagamentos podem esperar ao mesmo tempo
+    def __init__(self, method: PaymentMethod, latency_seconds: float = 0.05, approve: bool = True):
+        self._method = method
+        self._latency_seconds = latency_seconds
+        self._approve = approve
+    
+    async def process_payment(self, order: Order, amount: float) -> bool:
+        # Em uma implementação real, isso seria uma chamada HTTP assíncrona
+        # POST /api/payments
+        await asyncio.sleep(self._latency_seconds)
+        return self._approve
+    
+    def get_payment_method(self) -> PaymentMethod:
+        return self._method
+    
+    def requires_approval(self) -> bool:
+        return True
@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
+from interfaces.discount_interface import IPricingEngine
+from models.customer import Customer
+from models.enums import CustomerType, ItemType
+from models.money import Money, round_ratio, to_ratio
+from models.order_item import OrderItem
+from models.pricing_columns import ITEM_TYPE_CODES, CUSTOMER_TYPE_CODES
+from models.pricing_rules import PricingRules
+from strategies.discount_strategy import ITEM_DISCOUNT_FACTORS, VIP_DISCOUNT_FACTOR, SPECIAL_FEE_FACTOR
+
+Ratio = Tuple[int, int]
+
+# Mesmos fatores das strategies item a item
+DEFAULT_PRICING_RULES = PricingRules(
+    item_factors=MappingProxyType(dict(ITEM_DISCOUNT_FACTORS)),
+    customer_factors=MappingProxyType({CustomerType.VIP: VIP_DISCOUNT_FACTOR}),
+    special_fee_factor=SPECIAL_FEE_FACTOR
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CustomerPricing:
+    # Linha da tabela para um tipo de cliente: tudo que o cálculo de um
+    # pedido precisa, já como frações inteiras
+    item_ratios: Mapping[ItemType, Ratio]
+    customer_ratio: Ratio
+    special_fee_ratio: Ratio
+
+
+@dataclass(frozen=True, slots=True)
+class PricingTable:
+    # Tabela compilada e imutável; pode ser lida por várias threads sem lock
+    version: int
+    rules: PricingRules
+    by_customer: Mapping[CustomerType, CustomerPricing]
+    # As mesmas frações indexadas pelo código do enum (cálculo em lote)
+    item_ratios: Tuple[Ratio, ...]
+    customer_ratios: Tuple[Ratio, ...]
+    special_fee_ratio: Ratio
+
+
+def compile_pricing_table(rules: PricingRules, version: int = 1) -> PricingTable:
+    item_ratios = tuple(to_ratio(rules.item_factors.get(item_type, 0)) for item_type in ITEM_TYPE_CODES)
+    customer_ratios = tuple(to_ratio(rules.customer_factors.get(customer_type, 1)) for customer_type in CUSTOMER_TYPE_CODES)
+    special_fee_ratio = to_ratio(rules.special_fee_factor)
+
+    item_ratio_map = MappingProxyType(dict(zip(ITEM_TYPE_CODES, item_ratios)))
+    by_customer = MappingProxyType({
+        customer_type: CustomerPricing(item_ratio_map, customer_ratio, special_fee_ratio)
+        for customer_type, customer_ratio in zip(CUSTOMER_TYPE_CODES, customer_ratios)
+    })
+    return PricingTable(version, rules, by_customer, item_ratios, customer_ratios, special_fee_ratio)
+
+
+class PricingEngine(IPricingEngine):
+    """
+    Calcula o total do pedido numa única passada sobre uma tabela de regras
+    compilada, escolhida pelo customer_type do cliente. Substitui o
+    encadeamento ItemDiscountStrategy -> ICustomerDiscountStrategy ->
+    SpecialOrderFeeStrategy com os mesmos arredondamentos, na mesma ordem.
+
+    reload() compila uma tabela nova e troca a referência de uma vez: cada
+    pedido lê a tabela uma única vez e é precificado inteiro pela versão
+    antiga ou pela nova, nunca por uma mistura das duas.
+    """
+
+    def __init__(self, rules: Optional[PricingRules] = None):
+        self._table = compile_pricing_table(rules or DEFAULT_PRICING_RULES)
+        # Serializa as recargas; o cálculo não usa lock
+        self._reload_lock = threading.Lock()
+        self._source_path: Optional[str] = None
+        self._source_mtime: Optional[float] = None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PricingEngine':
+        engine = cls()
+        engine.load_file(path)
+        return engine
+
+    @property
+    def table(self) -> PricingTable:
+        return self._table
+
+    def calculate_total(self, items: List[OrderItem], customer: Customer, is_special: bool) -> Money:
+        pricing = self._table.by_customer[customer.customer_type]
+        item_ratios = pricing.item_ratios
+
+        cents = 0
+        for item in items:
+            numerator, denominator = item_ratios[item.item_type]
+            cents += round_ratio(item.price.cents * item.quantity * numerator, denominator)
+
+        numerator, denominator = pricing.customer_ratio
+        if denominator != numerator:
+            cents = round_ratio(cents * numerator, denominator)
+        if is_special:
+            numerator, denominator = pricing.special_fee_ratio
+            cents = round_ratio(cents * numerator, denominator)
+        return Money(cents)
+
+    def get_version(self) -> int:
+        return self._table.version
+
+    def reload(self, rules: PricingRules) -> int:
+        # Compila antes de trocar: um erro de compilação mantém a tabela atual
+        with self._reload_lock:
+            table = compile_pricing_table(rules, self._table.version + 1)
+            self._table = table
+        return table.version
+
+    def load_file(self, path: str) -> int:
+        # Regras em JSON (ver PricingRules.from_dict); arquivo inválido
+        # levanta ValueError e mantém as regras em uso
+        mtime = os.path.getmtime(path)
+        with open(path, encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Arquivo de regras de preço inválido ({path}): {e}")
+        if not isinstance(data, dict):
+            raise ValueError(f"Arquivo de regras de preço inválido ({path}): esperado um objeto JSON.")
+
+        version = self.reload(PricingRules.from_dict(data))
+        self._source_path = path
+        self._source_mtime = mtime
+        return version
+
+    def refresh(self) -> bool:
+        # Recarrega o último arquivo lido se ele mudou desde a leitura
+        if self._source_path is None:
+            return False
+        try:
+            mtime = os.path.getmtime(self._source_path)
+        except OSError as e:
+            print(f"Não foi possível verificar as regras de preço: {e}")
+            return False
+        if mtime == self._source_mtime:
+            return False
+        self.load_file(self._source_path)
+        return True
@@ -24,11 +24,12 @@ class SalesReportStrategy(IReportStrategy):
     def save_report(self, content: str, filename: str) -> bool:
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                # Extrai apenas o total geral para salvar (como na prova original)
-                lines = content.split('\n')
-                total_line = [line for line in lines if 'Total Geral' in line]
-                if total_line:
-                    f.write(f"Total de vendas: {total_line[0].split('R$')[1].strip()}")
+                # Salva apenas o total geral (como na prova original), lido da
+                # linha 'Total Geral' do próprio conteúdo; ela é a última, então
+                # não é preciso varrer o texto inteiro
+                last_line = content.rstrip('\n').rpartition('\n')[2]
+                if 'Total Geral' in last_line:
+                    f.write(f"Total de vendas: {last_line.split('R$')[1].strip()}")
                 else:
                     f.write("Total de vendas: 0")
             return True
@@ -1,5 +1,30 @@
+import threading
+import time
 from interfaces.stock_interface import IStockValidationStrategy
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
+
+
+def validate_required_stock(strategy: IStockValidationStrategy, items: List[Dict[str, Any]]) -> bool:
+    # Soma as quantidades por produto antes de comparar (o mesmo produto pode
+    # vir em várias linhas, como em InventoryService) e consulta a fonte uma
+    # única vez para todos os produtos do pedido
+    required: Dict[str, int] = {}
+    for item in items:
+        product_name = item.get('nome', '').strip()
+        required[product_name] = required.get(product_name, 0) + item.get('q', 0)
+    
+    available_by_product = strategy.get_available_quantities(list(required))
+    for product_name, quantity in required.items():
+        if product_name not in available_by_product:
+            print(f"Produto {product_name} não encontrado!")
+            return False
+        
+        available = available_by_product[product_name]
+        if available < quantity:
+            print(f"Estoque insuficiente para {product_name}! Disponível: {available}")
+            return False
+    
+    return True
 
 
 class SimpleStockValidationStrategy(IStockValidationStrategy):
@@ -13,52 +38,41 @@ class SimpleStockValidationStrategy(IStockValidationStrategy):
         }
     
     def validate_stock(self, items: List[Dict[str, Any]]) -> bool:
-        for item in items:
-            product_name = item.get('nome', '').strip()
-            quantity = item.get('q', 0)
-            
-            # Verifica se produto existe no estoque
-            if product_name not in self.stock:
-                print(f"Produto {product_name} não encontrado!")
-                return False
-            
-            # Verifica se há quantidade suficiente
-            if self.stock[product_name] < quantity:
-                print(f"Estoque insuficiente para {product_name}!")
-                return False
-        
-        return True
+        return validate_required_stock(self, items)
     
     def get_available_quantity(self, product_name: str) -> int:
         return self.stock.get(product_name.strip(), 0)
     
+    def get_available_quantities(self, product_names: Iterable[str]) -> Dict[str, int]:
+        # Produtos fora do estoque ficam de fora (relatados como não encontrados)
+        return {name: self.stock[name] for name in product_names if name in self.stock}
+    
     def get_stock_source(self) -> str:
         return "simple_memory"
 
 
 class DatabaseStockValidationStrategy(IStockValidationStrategy):
     def __init__(self, db_connection=None):
+        # db_connection é um DatabaseManager; sem ele os valores são simulados
         self.db_connection = db_connection
-        # Em uma implementação real, isso seria uma conexão com banco de dados
+        self._inventory = None
+        if db_connection is not None:
+            from repositories.inventory_repository import InventoryRepository
+            self._inventory = InventoryRepository(db_connection)
     
     def validate_stock(self, items: List[Dict[str, Any]]) -> bool:
-        for item in items:
-            product_name = item.get('nome', '').strip()
-            quantity = item.get('q', 0)
-            
-            # Simula consulta ao banco de dados
-            available = self.get_available_quantity(product_name)
-            
-            if available < quantity:
-                print(f"Estoque insuficiente para {product_name}! Disponível: {available}")
-                return False
-        
-        return True
+        return validate_required_stock(self, items)
     
     def get_available_quantity(self, product_name: str) -> int:
-        # Em uma implementação real, isso seria uma query SQL
-        # SELECT quantidade FROM estoque WHERE produto = ?
-        return 50  # Valor simulado
+        return self.get_available_quantities([product_name]).get(product_name.strip(), 0)
+    
+    def get_available_quantities(self, product_names: Iterable[str]) -> Dict[str, int]:
+        # SELECT product_name, quantity FROM inventory WHERE product_name IN (...)
+        names = list(dict.fromkeys(name.strip() for name in product_names))
+        if self._inventory is None:
+            return {name: 50 for name in names}  # Valor simulado
+        # Produtos fora do inventário ficam de fora (relatados como não encontrados)
+        return self._inventory.get_quantities(names)
     
     def get_stock_source(self) -> str:
         return "database"
@@ -67,25 +81,94 @@ class DatabaseStockValidationStrategy(IStockValidationStrategy):
 class APIGetStockValidationStrategy(IStockValidationStrategy):
     def __init__(self, api_endpoint: str = None):
         self.api_endpoint = api_endpoint
+        self.requests_made = 0
     
     def validate_stock(self, items: List[Dict[str, Any]]) -> bool:
-        for item in items:
-            product_name = item.get('nome', '').strip()
-            quantity = item.get('q', 0)
-            
-            # Simula chamada para API externa
-            available = self.get_available_quantity(product_name)
-            
-            if available < quantity:
-                print(f"Estoque insuficiente para {product_name}! Disponível: {available}")
-                return False
-        
-        return True
+        return validate_required_stock(self, items)
     
     def get_available_quantity(self, product_name: str) -> int:
-        # Em uma implementação real, isso seria uma chamada HTTP
-        # GET /api/stock/{product_name}
-        return 25  # Valor simulado
+        return self.get_available_quantities([product_name]).get(product_name.strip(), 0)
+    
+    def get_available_quantities(self, product_names: Iterable[str]) -> Dict[str, int]:
+        # Em uma implementação real, isso seria uma chamada HTTP em lote
+        # GET /api/stock?products=produto1,produto2,...
+        names = list(dict.fromkeys(name.strip() for name in product_names))
+        if not names:
+            return {}
+        self.requests_made += 1
+        return {name: 25 for name in names}  # Valor simulado
     
     def get_stock_source(self) -> str:
         return "external_api"
+
+
+class CachedStockValidationStrategy(IStockValidationStrategy):
+    # Decorator com cache de disponibilidade de curta duração: consultas
+    # repetidas dentro do TTL não voltam à fonte, e os produtos ausentes
+    # ou expirados são buscados juntos numa única consulta em lote.
+    # Só produtos que a fonte conhece entram no cache, limitado a max_size
+    # entradas; as vencidas e, acima do limite, as mais antigas são descartadas.
+    def __init__(self, strategy: IStockValidationStrategy, ttl_seconds: float = 2.0, max_size: int = 10000):
+        self._strategy = strategy
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._cache: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def validate_stock(self, items: List[Dict[str, Any]]) -> bool:
+        return validate_required_stock(self, items)
+    
+    def get_available_quantity(self, product_name: str) -> int:
+        return self.get_available_quantities([product_name]).get(product_name.strip(), 0)
+    
+    def get_available_quantities(self, product_names: Iterable[str]) -> Dict[str, int]:
+        names = list(dict.fromkeys(name.strip() for name in product_names))
+        now = time.monotonic()
+        result = {}
+        missing = []
+        with self._lock:
+            for name in names:
+                entry = self._cache.get(name)
+                if entry is not None and entry[1] > now:
+                    result[name] = entry[0]
+                    self.hits += 1
+                else:
+                    missing.append(name)
+                    self.misses += 1
+        
+        if missing:
+            fetched = self._strategy.get_available_quantities(missing)
+            expires_at = time.monotonic() + self._ttl_seconds
+            with self._lock:
+                for name in missing:
+                    # Entrada vencida sai mesmo que o produto tenha sumido da fonte
+                    self._cache.pop(name, None)
+                    if name in fetched:
+                        self._cache[name] = (fetched[name], expires_at)
+                        result[name] = fetched[name]
+                self._prune(now)
+        
+        return result
+    
+    def invalidate(self, product_names: Iterable[str] = None):
+        # Descarta entradas após uma baixa de estoque conhecida
+        with self._lock:
+            if product_names is None:
+                self._cache.clear()
+            else:
+                for name in product_names:
+                    self._cache.pop(name.strip(), None)
+    
+    def _prune(self, now: float):
+        # Chamado com o lock. O dicionário guarda a ordem de inserção e o TTL
+        # é o mesmo para todos: as primeiras entradas são as que vencem antes
+        while self._cache:
+            name = next(iter(self._cache))
+            if len(self._cache) <= self._max_size and self._cache[name][1] > now:
+                break
+            del self._cache[name]
+    
+    def get_stock_source(self) -> str:
+        return f"cached_{self._strategy.get_stock_source()}"